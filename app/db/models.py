@@ -10,7 +10,7 @@ from typing import Optional, List
 
 from sqlalchemy import (
     BigInteger, Boolean, Column, DateTime, ForeignKey,
-    Integer, Numeric, String, Text, UniqueConstraint, CheckConstraint, Enum as DBEnum
+    Index, Integer, Numeric, String, Text, UniqueConstraint, CheckConstraint, Enum as DBEnum
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -154,6 +154,8 @@ class Order(Base):
 
     __table_args__ = (
         CheckConstraint(status.in_(OrderStatusEnum.values()), name='ck_order_status'),
+        # Backs the newest-first admin orders list and its (created_at, id) keyset pagination
+        Index('ix_orders_created_at_id', 'created_at', 'id'),
     )
 
 
@@ -4,8 +4,9 @@ Data access layer for order and cart queries.
 """
 
 import logging
-from typing import List, Optional, Tuple
-from sqlalchemy import select, delete, update, func
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, update, func, tuple_
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,15 +23,19 @@ class OrderRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
     
-    async def get_order_by_id(self, order_id: int) -> Optional[Order]:
-        """Get order by ID with user, items, item products (with localizations), and item locations."""
+    async def get_order_by_id(self, order_id: int, with_localizations: bool = True) -> Optional[Order]:
+        """
+        Get order by ID with user, items, item products, and item locations.
+        Product localizations (all languages) are loaded too unless with_localizations is False.
+        """
+        product_load = joinedload(Order.items).joinedload(OrderItem.product)
+        if with_localizations:
+            product_load = product_load.selectinload(Product.localizations) # Use selectinload for product localizations
         result = await self.session.execute(
             select(Order)
             .options(
                 joinedload(Order.user),
-                joinedload(Order.items)
-                .joinedload(OrderItem.product)
-                .selectinload(Product.localizations), # Use selectinload for product localizations
+                product_load,
                 joinedload(Order.items)
                 .joinedload(OrderItem.location)
             )
@@ -38,6 +43,19 @@ class OrderRepository:
         )
         return result.unique().scalar_one_or_none() # unique() due to multiple joinedload paths to items
 
+    async def get_product_names_for_language(self, product_ids: List[int], language: str) -> Dict[int, str]:
+        """Get localized product names for several products in one IN query. Returns {product_id: name}."""
+        if not product_ids:
+            return {}
+        result = await self.session.execute(
+            select(ProductLocalization.product_id, ProductLocalization.name)
+            .where(
+                ProductLocalization.product_id.in_(product_ids),
+                ProductLocalization.language_code == language
+            )
+        )
+        return {product_id: name for product_id, name in result.all()}
+
     async def get_order_by_id_for_update(self, order_id: int) -> Optional[Order]:
         """Get order by ID with items, FOR UPDATE (locks order and items)."""
         result = await self.session.execute(
@@ -67,23 +85,53 @@ class OrderRepository:
         )
         return result.scalar_one()
 
-    async def list_orders(
+    async def list_orders_with_total(
         self, 
         status: Optional[str] = None, 
         user_id: Optional[int] = None,
         limit: int = 20, 
         offset: int = 0
+    ) -> Tuple[List[Order], int]:
+        """
+        List orders, newest first, with optional status/user filtering and pagination.
+        Returns (orders, total): the total of matching orders comes from COUNT(*) OVER () in the same query,
+        so only a page past the end needs a separate count.
+        """
+        stmt = self._orders_list_stmt(select(Order, func.count().over().label("total")), status, user_id)
+        stmt = stmt.limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            return [order for order, _ in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+        return [], await self.count_orders(status=status, user_id=user_id)
+
+    async def list_orders_before(
+        self,
+        before: Tuple[datetime, int],
+        status: Optional[str] = None,
+        user_id: Optional[int] = None,
+        limit: int = 20
     ) -> List[Order]:
-        """List orders with optional status/user filtering and pagination."""
-        stmt = select(Order).options(joinedload(Order.user)).order_by(Order.created_at.desc())
+        """
+        List the orders after the (created_at, id) keyset cursor `before`, newest first.
+        Read with an index seek instead of skipping rows; nothing is counted, as a count would
+        have to read every remaining row.
+        """
+        stmt = self._orders_list_stmt(select(Order), status, user_id)
+        stmt = stmt.where(tuple_(Order.created_at, Order.id) < tuple_(*before)).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    @staticmethod
+    def _orders_list_stmt(stmt, status: Optional[str], user_id: Optional[int]):
+        """Apply the admin orders list loading, filters and ordering to stmt."""
+        stmt = stmt.options(joinedload(Order.user)).order_by(Order.created_at.desc(), Order.id.desc())
         if status:
             stmt = stmt.where(Order.status == status)
         if user_id:
             stmt = stmt.where(Order.user_id == user_id)
-        
-        stmt = stmt.limit(limit).offset(offset)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return stmt
 
     async def count_orders(self, status: Optional[str] = None, user_id: Optional[int] = None) -> int:
         """Count orders with optional status/user filtering."""
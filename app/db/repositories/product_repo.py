@@ -5,7 +5,7 @@ Handles CRUD operations for products, categories, manufacturers, and stock.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from decimal import Decimal
 from sqlalchemy import select, insert, update, delete, func
 from sqlalchemy.orm import joinedload, selectinload
@@ -72,6 +72,25 @@ class ProductRepository:
         result = await self.session.execute(stmt)
         return result.unique().scalars().all()
 
+    async def list_products_with_total(self, limit: int = 100, offset: int = 0) -> Tuple[List[Product], int]:
+        """
+        List products (localizations loaded) ordered by id, with the total product count from
+        COUNT(*) OVER () in the same query; only a page past the end needs a separate count.
+        """
+        stmt = (
+            select(Product, func.count().over().label("total"))
+            .options(selectinload(Product.localizations))
+            .order_by(Product.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            return [product for product, _ in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+        return [], (await self.session.execute(select(func.count(Product.id)))).scalar_one()
+
     async def update_product(self, product_id: int, **updates: Any) -> Optional[Product]:
         """Update product details."""
         # Ensure 'cost' is Decimal if present
@@ -4,11 +4,11 @@ Data access layer for user-related database queries.
 """
 
 import logging
-from typing import Optional, List
-from sqlalchemy import select, func, update
+from typing import Dict, Optional, List
+from sqlalchemy import select, func, update, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import User, Admin
+from app.db.models import User, Admin, Order
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +77,26 @@ class UserRepository:
             stmt = stmt.where(User.is_blocked == is_blocked)
         result = await self.session.execute(stmt)
         return result.scalar_one()
+
+    async def get_basic_statistics_counts(self, pending_order_status: str) -> Dict[str, int]:
+        """
+        User and order counts for the admin statistics view in one round-trip.
+        Each table is aggregated once with COUNT(*) FILTER (...), and the two one-row
+        aggregates are joined ON TRUE into a single result row.
+        """
+        user_counts = select(
+            func.count(User.telegram_id).label("total_users"),
+            func.count(User.telegram_id).filter(User.is_blocked.is_(False)).label("active_users"),
+            func.count(User.telegram_id).filter(User.is_blocked.is_(True)).label("blocked_users")
+        ).subquery()
+        order_counts = select(
+            func.count(Order.id).label("total_orders"),
+            func.count(Order.id).filter(Order.status == pending_order_status).label("pending_orders")
+        ).subquery()
+
+        stmt = select(user_counts, order_counts).select_from(user_counts.join(order_counts, true()))
+        result = await self.session.execute(stmt)
+        return dict(result.mappings().one())
         
     async def update_user_block_status(self, telegram_id: int, is_blocked: bool) -> Optional[User]:
         """Update user's block status. Returns the updated user or None if not found."""
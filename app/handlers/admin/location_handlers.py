@@ -59,7 +59,7 @@ async def cq_admin_locations_main_menu(callback: types.CallbackQuery, user_data:
     await state.clear() # Clear any previous location FSM state
     await state.set_state(AdminLocationStates.MAIN_MENU)
     # Assuming create_admin_location_management_menu_keyboard will be created in the keyboards step
-    # It should have: Add (admin_add_location_start), List (admin_list_locations_start), Back (admin_panel_main)
+    # It should have: Add (admin_add_location_start), List (LocationCD list_page), Back (admin_panel_main)
     keyboard = create_admin_location_management_menu_keyboard(lang) 
     await callback.message.edit_text(get_text("admin_location_management_title", lang), reply_markup=keyboard)
     await callback.answer()
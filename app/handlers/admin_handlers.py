@@ -7,25 +7,31 @@ User management includes: listing, viewing details, blocking, unblocking.
 Basic settings view and statistics display.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from functools import lru_cache, partial
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 from decimal import Decimal, InvalidOperation as DecimalInvalidOperation
-from datetime import datetime 
 
 from aiogram import Router, types, F
+from aiogram.dispatcher.event.bases import SkipHandler
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command, StateFilter, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup 
 from aiogram.utils.markdown import hbold, hitalic, hcode, hlink
+from aiogram.utils.text_decorations import html_decoration
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
+from cachetools import TTLCache
 
 
 from app.services.order_service import OrderService
 from app.services.product_service import ProductService
 from app.services.user_service import UserService
 from app.services.location_service import LocationService # Import LocationService
-from app.localization.locales import get_text
+from app.localization.locales import get_text, LANGUAGE_NAMES, TEXTS as ALL_LANG_TEXTS
 from app.keyboards.inline import (
     create_admin_keyboard, 
     create_admin_order_actions_keyboard, 
@@ -34,6 +40,8 @@ from app.keyboards.inline import (
     create_admin_category_management_menu_keyboard,
     create_admin_manufacturer_management_menu_keyboard,
     create_admin_location_management_menu_keyboard,
+    create_admin_location_item_actions_keyboard,
+    create_admin_location_edit_options_keyboard,
     create_admin_stock_management_menu_keyboard,
     create_confirmation_keyboard,
     create_admin_product_edit_options_keyboard,
@@ -44,22 +52,29 @@ from app.keyboards.inline import (
     create_admin_order_statuses_keyboard,
     create_admin_user_management_menu_keyboard, 
     create_admin_user_list_item_keyboard, 
+    create_admin_product_view_actions_keyboard,
+)
+from app.keyboards.callback_data import (
+    ManufacturerCD, LocationCD, OrderCD, OrdersListCD, ProductListCD,
+    CB_USER_DETAILS, CB_USER_BLOCK_PROMPT, CB_USER_BLOCK_EXEC, CB_USER_UNBLOCK_PROMPT, CB_USER_UNBLOCK_EXEC
 )
 from app.utils.helpers import (
     sanitize_input, validate_quantity, validate_stock_change_quantity, 
-    format_price, format_datetime, OrderStatusEnum, get_order_status_emoji, get_payment_method_emoji
+    format_price, ORDER_STATUS_VALUES, get_order_status_emoji, get_payment_method_emoji
 )
+from app.middlewares.admin_middleware import AdminOnlyMiddleware
+from app.utils.fsm_storage import set_state_and_data
+from app.utils.keyed_lock import KeyedLock
 from config.settings import settings 
 
 logger = logging.getLogger(__name__)
 router = Router()
 
 # --- Authorization Check ---
-async def is_admin_user_check(user_id: int, user_service: UserService) -> bool:
-    """Check if user is admin based on settings or DB."""
-    if settings.ADMIN_CHAT_ID is not None and user_id == int(settings.ADMIN_CHAT_ID): # Ensure ADMIN_CHAT_ID is int if comparing
-        return True
-    return await user_service.is_admin(user_id)
+# Every handler of this router is admin-only: the check runs once per update in the
+# middleware, so handlers below don't repeat it.
+router.message.middleware(AdminOnlyMiddleware())
+router.callback_query.middleware(AdminOnlyMiddleware())
 
 
 # --- FSM States ---
@@ -143,6 +158,257 @@ class AdminStatisticsStates(StatesGroup):
     # VIEWING_USER_STATS = State() # Future: For specific stats views
 
 
+# --- User list filter mappings ---
+# Callback filter part <-> is_blocked filter <-> locale key of the filter name.
+# The callback carries the is_blocked flag itself: "" = all users, "1" = blocked, "0" = active.
+_FILTER_STR_TO_BOOL: Dict[str, Optional[bool]] = {"": None, "1": True, "0": False}
+_BOOL_TO_FILTER_STR: Dict[Optional[bool], str] = {None: "", True: "1", False: "0"}
+_BOOL_TO_FILTER_KEY: Dict[Optional[bool], str] = {
+    None: "admin_filter_all_users",
+    True: "admin_filter_blocked_users",
+    False: "admin_filter_active_users",
+}
+_FILTER_KEY_TO_BOOL: Dict[str, Optional[bool]] = {key: flag for flag, key in _BOOL_TO_FILTER_KEY.items()}
+
+# Paginated user list markups, keyed on (page items, page, total, lang, base callback).
+# Markups are frozen aiogram objects, so a cached one can be sent again as is.
+_USER_LIST_KEYBOARD_CACHE: TTLCache = TTLCache(maxsize=256, ttl=5)
+
+
+# One shared instance per service: each call opens its own session and their caches are class-level,
+# so nothing is tied to an instance
+_ORDER_SERVICE = OrderService()
+_USER_SERVICE = UserService()
+_PRODUCT_SERVICE = ProductService()
+_LOCATION_SERVICE = LocationService()
+
+# One block/unblock at a time per target user
+_USER_ACTION_LOCKS = KeyedLock()
+
+# Caps concurrent admin list queries so bursts of page refreshes can't drain the DB pool
+_DB_SEM = asyncio.Semaphore(16)
+
+# Next orders page prefetched per admin: admin_id -> ((lang, status, user_id, page), started_at, task).
+# Entries older than the TTL are ignored so a stale page is never shown.
+_ORDERS_PREFETCH: Dict[int, Tuple[Tuple[Any, ...], float, "asyncio.Task"]] = {}
+_ORDERS_PREFETCH_TTL = 30.0
+
+# Last orders page shown per admin: admin_id -> ((lang, status, user_id, page), shown_at, rows, total).
+# An order action patches its row here instead of reloading the page.
+_ORDERS_PAGE_CACHE: Dict[int, Tuple[Tuple[Any, ...], float, List[Dict[str, Any]], int]] = {}
+_ORDERS_PAGE_CACHE_TTL = 120.0
+
+# Reject/cancel reasons are cut to this length before the sanitizing regex runs over them
+_MAX_REASON_LEN = 512
+
+# Masked once at import; the token does not change while the bot runs
+_MASKED_BOT_TOKEN = f"{settings.BOT_TOKEN[:5]}***{settings.BOT_TOKEN[-3:] if len(settings.BOT_TOKEN) > 8 else ''}"
+
+
+# --- Callback data parsing ---
+def _parse_cb(data: str, expected: int) -> Tuple[str, ...]:
+    """
+    Split callback data "prefix:arg1:...". Returns exactly `expected` parts (prefix included);
+    the last part keeps any remaining colons. Raises ValueError on a shorter payload.
+    """
+    parts = tuple(data.split(":", expected - 1))
+    if len(parts) != expected:
+        raise ValueError(f"Malformed callback data {data!r}: expected {expected} parts")
+    return parts
+
+
+# --- FSM data access ---
+# Order/user context is stored under short keys to keep the serialized FSM data small:
+#   olf   - status filter of the orders list being viewed      olu   - user id filter of that list
+#   olp   - page of that list
+#   oid   - order shown in the details view                    ost   - its raw status
+#   ofb   - orders list filter to return to from the details   oub   - orders list user id to return to
+#   opb   - orders list page to return to
+#   opid  - order awaiting a reject/cancel reason or new status
+#   vuid  - user shown in the details view                     buid / ubuid - user being blocked / unblocked
+class _StateCache:
+    """
+    Handler-local copy of the FSM data: read once, written back once on flush().
+    Updates that don't change a value are dropped, so an unchanged state is never written.
+    """
+    __slots__ = ("_state", "data", "_dirty")
+
+    def __init__(self, state: FSMContext, data: Optional[Dict[str, Any]] = None):
+        self._state = state
+        self.data = dict(data) if data is not None else None
+        self._dirty = False
+
+    async def load(self) -> Dict[str, Any]:
+        if self.data is None:
+            self.data = await self._state.get_data()
+        return self.data
+
+    def update(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            if key not in self.data or self.data[key] != value:
+                self.data[key] = value
+                self._dirty = True
+
+    async def flush(self) -> None:
+        if self._dirty:
+            await self._state.set_data(self.data)
+            self._dirty = False
+
+
+async def _set_state_if_changed(state: FSMContext, target: State) -> None:
+    """Set the FSM state only if it differs, saving a storage write when re-rendering the same view."""
+    if await state.get_state() != target.state:
+        await state.set_state(target)
+
+
+async def _reply_or_edit(
+    event: Union[types.Message, types.CallbackQuery],
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[str] = "HTML",
+    answer_callback: bool = False
+):
+    """
+    Show a screen in response to an event: callbacks edit their message in place, messages get a reply.
+    If the edit is rejected (e.g. the message is too old), a new message is sent instead;
+    "message is not modified" is ignored. Pass parse_mode=None for screens without markup.
+    With answer_callback=True a callback is also answered, concurrently with the edit.
+    """
+    if isinstance(event, types.CallbackQuery):
+        if answer_callback:
+            shown, _ = await asyncio.gather(
+                _edit_or_resend(event.message, text, reply_markup, parse_mode),
+                event.answer()
+            )
+            return shown
+        return await _edit_or_resend(event.message, text, reply_markup, parse_mode)
+    return await event.answer(text, reply_markup=reply_markup, parse_mode=parse_mode)
+
+
+def _shows_text(message: types.Message, text: str, parse_mode: Optional[str]) -> bool:
+    """Whether message already displays text (compared as HTML unless parse_mode is None)."""
+    if message.text is None:
+        return False
+    return (message.html_text if parse_mode else message.text) == text
+
+
+async def _edit_or_resend(
+    message: types.Message,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup],
+    parse_mode: Optional[str]
+):
+    """
+    Edit message in place, or send a new one if the edit is rejected; "message is not modified" is ignored.
+    When the text is unchanged (e.g. paging a list under the same title) only the keyboard is replaced.
+    """
+    try:
+        if _shows_text(message, text, parse_mode):
+            return await message.edit_reply_markup(reply_markup=reply_markup)
+        return await message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+    except TelegramBadRequest as e:
+        if "message is not modified" in str(e):
+            return None
+        logger.debug("Editing message failed, sending a new one: %s", e)
+        return await message.answer(text, reply_markup=reply_markup, parse_mode=parse_mode)
+
+
+async def _safe_edit(
+    callback: types.CallbackQuery,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[str] = "HTML"
+):
+    """
+    Show a screen in the callback's message and answer the callback, both requests in flight at once.
+    If the message already shows this text and keyboard (e.g. a double click), only the callback is answered;
+    if only the keyboard differs, only the keyboard is edited.
+    """
+    message = callback.message
+    same_text = _shows_text(message, text, parse_mode)
+    if same_text and message.reply_markup == reply_markup:
+        await callback.answer()
+        return
+
+    async def _edit():
+        try:
+            if same_text:
+                await message.edit_reply_markup(reply_markup=reply_markup)
+            else:
+                await message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+        except TelegramBadRequest as e:
+            if "message is not modified" not in str(e):
+                raise
+
+    await asyncio.gather(_edit(), callback.answer())
+
+
+async def _show_prompt(callback: types.CallbackQuery, text: str):
+    """
+    Replace the callback's message with an HTML prompt without a keyboard and answer the callback.
+    If the edit is rejected (e.g. the message is too old), the prompt is sent as a new message that
+    also removes any reply keyboard; an unchanged prompt is not edited at all.
+    """
+    message = callback.message
+    if _shows_text(message, text, "HTML") and message.reply_markup is None:
+        await callback.answer()
+        return
+
+    async def _edit():
+        try:
+            await message.edit_text(text, parse_mode="HTML", reply_markup=None)
+        except TelegramBadRequest as e:
+            if "message is not modified" in str(e):
+                return
+            logger.debug("Editing prompt failed, sending a new one: %s", e)
+            await message.answer(text, parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
+
+    await asyncio.gather(_edit(), callback.answer())
+
+
+# --- Callback answers ---
+async def _await_callback_answer(answer_task: "asyncio.Task") -> None:
+    """
+    Finish an answerCallbackQuery started with asyncio.create_task so it overlaps the re-render.
+    A failed answer only costs the toast, so it is logged instead of failing the handler.
+    """
+    try:
+        await answer_task
+    except TelegramBadRequest as e:
+        logger.warning("Failed to answer callback query: %s", e)
+
+
+# --- Menu rendering ---
+@lru_cache(maxsize=64)
+def _admin_back_markup(lang: str, cb_data: str, key: str) -> InlineKeyboardMarkup:
+    """
+    Single back-button markup, used for menus and empty-list screens.
+    Built once per (lang, cb_data, key) and shared, as markups are frozen.
+    """
+    return InlineKeyboardBuilder().row(create_back_button(key, lang, cb_data)).as_markup()
+
+
+@lru_cache(maxsize=64)
+def _prompt_with_cancel(prompt_key: str, lang: str) -> str:
+    """Static text prompt followed by the italic /cancel hint (HTML)."""
+    return f"{get_text(prompt_key, lang)}\n\n{hitalic(get_text('cancel_prompt', lang))}"
+
+
+async def _edit_menu_message(message: types.Message, text: str, reply_markup: InlineKeyboardMarkup):
+    """
+    Show a menu in an existing message. If the message already has this text, only the
+    keyboard is replaced (editMessageReplyMarkup); "message is not modified" is ignored.
+    """
+    try:
+        if _shows_text(message, text, "HTML"):
+            await message.edit_reply_markup(reply_markup=reply_markup)
+        else:
+            await message.edit_text(text, reply_markup=reply_markup)
+    except TelegramBadRequest as e:
+        if "message is not modified" not in str(e):
+            raise
+
+
 # --- Helper for paginated entity selection for Product Creation ---
 async def _send_paginated_entities_for_selection(
     event: Union[types.Message, types.CallbackQuery],
@@ -158,16 +424,8 @@ async def _send_paginated_entities_for_selection(
     additional_buttons_override: Optional[List[List[InlineKeyboardButton]]] = None
 ):
     lang = user_data.get("language", "en")
-    product_service = ProductService() # Using ProductService to fetch entities
-    user_service = UserService()
 
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
-
-    entities_on_page_data, total_entities = await product_service.get_all_entities_paginated(
+    entities_on_page_data, total_entities = await _PRODUCT_SERVICE.get_all_entities_paginated(
         entity_type=entity_type,
         page=page,
         items_per_page=ITEMS_PER_PAGE_ADMIN,
@@ -186,22 +444,17 @@ async def _send_paginated_entities_for_selection(
     if not entities_on_page_data and page == 0:
         if entity_type == "manufacturer": # Manufacturer is mandatory
             empty_text = title + "\n\n" + get_text(f"admin_no_{entity_type}s_found_for_product_creation", lang, entity=entity_type)
-            kb = InlineKeyboardBuilder().row(create_back_button("back_to_product_management", lang, "admin_products_menu")).as_markup()
+            kb = _admin_back_markup(lang, "admin_products_menu", "back_to_product_management")
         elif is_category_creation_flow: # Category is mandatory for creation, error if none exist
             empty_text = title + "\n\n" + get_text("admin_no_categories_for_product_creation_error", lang, default="No categories found. Please add a category first.")
-            kb = InlineKeyboardBuilder().row(create_back_button("back_to_product_management", lang, "admin_products_menu")).as_markup()
+            kb = _admin_back_markup(lang, "admin_products_menu", "back_to_product_management")
         else: # Other scenarios (e.g., optional category selection during product edit) might still proceed or have different buttons
             empty_text = title + "\n\n" + get_text(f"admin_no_{entity_type}s_found", lang, entity=entity_type) # Generic "not found"
             # Default back button or allow override to define behavior
-            kb = InlineKeyboardBuilder().row(create_back_button(back_callback_key_override or "cancel_add_product", lang, back_callback_data_override or "admin_prod_add_cancel_to_menu")).as_markup()
+            kb = _admin_back_markup(lang, back_callback_data_override or "admin_prod_add_cancel_to_menu", back_callback_key_override or "cancel_add_product")
             # If additional_buttons_override is used, it might already include a skip or other relevant action
 
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-            await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-            await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery): await event.answer()
+        await _reply_or_edit(event, empty_text, kb, answer_callback=True)
         return
     
     # For categories, if none are found, it's fine, user can skip (logic moved up for creation).
@@ -245,311 +498,290 @@ async def _send_paginated_entities_for_selection(
         additional_buttons=final_additional_buttons
     )
     
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        # Remove reply keyboard if any previous message handler left one
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery): await event.answer()
+    await _reply_or_edit(event, title, keyboard, answer_callback=True)
 
 
-def format_admin_order_details(order_data: Dict[str, Any], lang: str) -> str:
-    """Format order details for admin view. order_data comes from OrderService and is localized."""
-    status_emoji = order_data.get("status_emoji", "") 
-    payment_emoji = get_payment_method_emoji(order_data['payment_method_raw']) 
+@lru_cache(maxsize=8)
+def _order_details_header_template(lang: str) -> str:
+    """
+    Header of the admin order details (HTML) with every label resolved once per language.
+    Dynamic fields stay as {placeholders}; values that are bolded/code-formatted must be passed HTML-escaped.
+    """
+    t = partial(get_text, language=lang)
+    return "\n".join([
+        hbold(t('admin_order_details_title')), # Keeps its {order_id} placeholder
+        "",
+        f"{t('user_id_label', default='User ID')}: <code>{{user_id}}</code> ({{user_display}})",
+        f"{t('status_label', default='Status')}: {{status_emoji}} <b>{{status_display}}</b>",
+        f"{t('payment_label', default='Payment')}: {{payment_emoji}} {{payment_method_display}}",
+        f"{t('total_label', default='Total')}: <b>{{total_amount_display}}</b>",
+        f"{t('created_at_label', default='Created At')}: {{created_at_display}}",
+        f"{t('updated_at_label', default='Updated At')}: {{updated_at_display}}",
+    ])
 
-    details = f"{hbold(get_text('admin_order_details_title', lang).format(order_id=order_data['id']))}\n\n" \
-              f"{get_text('user_id_label', lang, default='User ID')}: {hcode(str(order_data['user_id']))} ({order_data.get('user_display', '')})\n" \
-              f"{get_text('status_label', lang, default='Status')}: {status_emoji} {hbold(order_data['status_display'])}\n" \
-              f"{get_text('payment_label', lang, default='Payment')}: {payment_emoji} {order_data['payment_method_display']}\n" \
-              f"{get_text('total_label', lang, default='Total')}: {hbold(order_data['total_amount_display'])}\n" \
-              f"{get_text('created_at_label', lang, default='Created At')}: {order_data['created_at_display']}\n" \
-              f"{get_text('updated_at_label', lang, default='Updated At')}: {format_datetime(datetime.fromisoformat(order_data['updated_at_iso']), lang=lang) if order_data.get('updated_at_iso') else get_text('not_available_short', lang, default='N/A')}\n"
-    
-    if order_data.get('admin_notes'):
-        details += f"\n{hbold(get_text('admin_notes_label', lang))}:\n{hitalic(order_data['admin_notes'])}\n"
 
-    details += f"\n{hbold(get_text('order_items_list', lang))}:\n"
-    
-    if order_data.get('items'):
-        for item in order_data['items']: 
-            details += get_text("order_item_admin_format", lang).format(
+def format_admin_order_details(order_data: Dict[str, Any], lang: str) -> str:
+    """Format order details for admin view. order_data comes from OrderService and is localized."""
+    t = partial(get_text, language=lang)
+    quote = html_decoration.quote
+    header = _order_details_header_template(lang).format_map({
+        "order_id": order_data['id'],
+        "user_id": quote(str(order_data['user_id'])),
+        "user_display": order_data.get('user_display', ''),
+        "status_emoji": order_data.get("status_emoji", ""),
+        "status_display": quote(order_data['status_display']),
+        "payment_emoji": get_payment_method_emoji(order_data['payment_method_raw']),
+        "payment_method_display": order_data['payment_method_display'],
+        "total_amount_display": quote(order_data['total_amount_display']),
+        "created_at_display": order_data['created_at_display'],
+        "updated_at_display": order_data.get('updated_at_display') or t('not_available_short', default='N/A'),
+    })
+    lines = [header]
+    
+    admin_notes = order_data.get('admin_notes')
+    if admin_notes:
+        lines += ["", f"{hbold(t('admin_notes_label'))}:", hitalic(admin_notes)]
+
+    lines += ["", f"{hbold(t('order_items_list'))}:"]
+    
+    items = order_data.get('items')
+    if items:
+        item_template = t("order_item_admin_format") # Same template for every line
+        lines.extend(
+            item_template.format(
                 name=item['product_name'], 
                 location=item['location_name'], 
                 quantity=item['quantity'],
                 price=item['price_at_order_display'], 
                 total=item['item_total_display'], 
                 reserved_qty = item.get('reserved_quantity', 0) 
-            ) + "\n"
+            )
+            for item in items
+        )
     else:
-        details += get_text("no_items_found", lang) + "\n"
+        lines.append(t("no_items_found"))
         
-    return details
+    return "\n".join(lines) + "\n"
 
 # --- Main Admin Panel Entry ---
 @router.message(Command("admin"))
 async def admin_panel_command(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService() # Instantiate service
-    if not await is_admin_user_check(message.from_user.id, user_service): 
-        return await message.answer(get_text("admin_access_denied", lang))
     
     await state.clear() 
-    await message.answer(get_text("admin_panel_title", lang), reply_markup=create_admin_keyboard(lang))
+    text, keyboard = _menu_screen("admin_panel", lang)
+    await message.answer(text, reply_markup=keyboard)
 
 @router.callback_query(F.data == "admin_panel_main")
 async def cq_admin_panel_main(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
     await state.clear()
-    await callback.message.edit_text(get_text("admin_panel_title", lang), reply_markup=create_admin_keyboard(lang))
+    await _edit_menu_message(callback.message, *_menu_screen("admin_panel", lang))
     await callback.answer()
 
-# --- Product Management Menu Handler ---
-@router.callback_query(F.data == "admin_products_menu", StateFilter("*"))
-async def cq_admin_products_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    await state.clear()
-    keyboard = create_admin_product_management_menu_keyboard(lang)
-    await callback.message.edit_text(get_text("admin_product_management_title", lang), reply_markup=keyboard)
-    await callback.answer()
-
-# --- Stock Management Menu Handler ---
-@router.callback_query(F.data == "admin_stock_menu", StateFilter("*"))
-async def cq_admin_stock_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    await state.clear()
-    # Assuming "admin_stock_management_title" text key exists or will be added.
-    # Using "Stock Management" as a placeholder if the key is missing, as per instructions.
-    title_text = get_text("admin_stock_management_title", lang, default="Stock Management")
-    keyboard = create_admin_stock_management_menu_keyboard(lang)
-    
-    try:
-        await callback.message.edit_text(title_text, reply_markup=keyboard)
-    except Exception as e: # Fallback if edit fails (e.g. message not modified)
-        logger.info(f"Editing message for admin_stock_menu failed, sending new: {e}")
-        await callback.message.answer(title_text, reply_markup=keyboard)
-        
-    await callback.answer()
+# --- Section Menu Handlers ---
+# Section menu callback -> static menu screen; entering a section drops any unfinished FSM flow
+_SECTION_MENUS = {
+    "admin_products_menu": "products",
+    "admin_stock_menu": "stock",
+    "admin_manufacturers_menu": "manufacturers",
+    "admin_categories_menu": "categories",
+    "admin_locations_menu": "locations",
+}
 
-# --- Manufacturer Management Menu Handler ---
-@router.callback_query(F.data == "admin_manufacturers_menu", StateFilter("*"))
-async def cq_admin_manufacturers_main_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    await state.clear()
-    title_text = get_text("admin_manufacturer_management_title", lang, default="Manufacturer Management")
-    keyboard = create_admin_manufacturer_management_menu_keyboard(lang)
-    
-    try:
-        await callback.message.edit_text(title_text, reply_markup=keyboard)
-    except Exception as e:
-        logger.info(f"Editing message for admin_manufacturers_menu failed, sending new: {e}")
-        await callback.message.answer(title_text, reply_markup=keyboard)
-        
-    await callback.answer()
 
-# --- Category Management Menu Handler ---
-@router.callback_query(F.data == "admin_categories_menu", StateFilter("*"))
-async def cq_admin_categories_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
+@router.callback_query(F.data.in_(_SECTION_MENUS), StateFilter("*"))
+async def cq_admin_section_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
     await state.clear()
-    title_text = get_text("admin_category_management_title", lang, default="Category Management")
-    keyboard = create_admin_category_management_menu_keyboard(lang)
-    
-    try:
-        await callback.message.edit_text(title_text, reply_markup=keyboard)
-    except Exception as e:
-        logger.info(f"Editing message for admin_categories_menu failed, sending new: {e}")
-        await callback.message.answer(title_text, reply_markup=keyboard)
-        
-    await callback.answer()
+    text, keyboard = _menu_screen(_SECTION_MENUS[callback.data], lang)
+    await _safe_edit(callback, text, reply_markup=keyboard)
 
 # --- User Management Handlers ---
 @router.callback_query(F.data == "admin_users_menu")
 async def cq_admin_users_menu(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
     await state.set_state(AdminUserManagementStates.VIEWING_USER_LIST) # Initial state for this section
     # Show the menu with filter options
-    keyboard = create_admin_user_management_menu_keyboard(lang)
-    await callback.message.edit_text(get_text("admin_user_management_title", lang), reply_markup=keyboard)
+    await _edit_menu_message(callback.message, *_menu_screen("users", lang))
     await callback.answer()
 
-async def _send_paginated_user_list(
-    event: Union[types.Message, types.CallbackQuery], 
+@lru_cache(maxsize=32)
+def _users_list_title(lang: str, is_blocked_filter: Optional[bool]) -> str:
+    """Title of the admin user list for a filter; fixed per (language, filter), so formatted once."""
+    filter_display = get_text(_BOOL_TO_FILTER_KEY[is_blocked_filter], lang)
+    return get_text("admin_users_list_title", lang).format(filter=filter_display)
+
+
+async def _build_user_list_view(
     state: FSMContext, 
-    user_data: Dict[str, Any], 
+    lang: str, 
     is_blocked_filter: Optional[bool] = None, 
     page: int = 0
-):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
+) -> Tuple[str, InlineKeyboardMarkup]:
+    """Fetch a page of users and build the (text, keyboard) of the admin user list. The text has no markup."""
     
-    # Admin check
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
-
-    users_on_page_data, total_users = await user_service.list_users_for_admin(
+    users_on_page_data, total_users = await _USER_SERVICE.list_users_for_admin(
         language=lang,
         limit=ITEMS_PER_PAGE_ADMIN, 
         offset=page * ITEMS_PER_PAGE_ADMIN,
         is_blocked_filter=is_blocked_filter
     )
     
-    filter_key = "admin_filter_all_users"
-    if is_blocked_filter is True: filter_key = "admin_filter_blocked_users"
-    elif is_blocked_filter is False: filter_key = "admin_filter_active_users"
-    filter_display = get_text(filter_key, lang)
-
-    title = get_text("admin_users_list_title", lang).format(filter=filter_display)
+    title = _users_list_title(lang, is_blocked_filter)
 
     if not users_on_page_data and page == 0:
         empty_text = title + "\n\n" + get_text("admin_no_users_found", lang)
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_admin_main_menu", lang, "admin_users_menu")).as_markup()
-        
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-             await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-             await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery) and hasattr(event, 'answer'): await event.answer()
-        return
+        kb = _admin_back_markup(lang, "admin_users_menu", "back_to_admin_main_menu")
+        return empty_text, kb
 
-    await state.set_state(AdminUserManagementStates.VIEWING_USER_LIST)
+    await _set_state_if_changed(state, AdminUserManagementStates.VIEWING_USER_LIST) # Unchanged while paging
     # Store filter for back navigation from user details & for pagination itself
-    await state.update_data(current_user_filter_type=filter_key, current_user_list_page=page) 
+    await state.update_data(current_user_filter_type=_BOOL_TO_FILTER_KEY[is_blocked_filter], current_user_list_page=page) 
 
-    filter_cb_part = "all"
-    if is_blocked_filter is True: filter_cb_part = "blocked"
-    elif is_blocked_filter is False: filter_cb_part = "active"
-    
-    base_cb_data_for_pagination = f"admin_users_list_page:{filter_cb_part}" # Page num will be appended by create_paginated_keyboard
+    base_cb_data_for_pagination = f"admin_users_list_page:{_BOOL_TO_FILTER_STR[is_blocked_filter]}" # Page num will be appended by create_paginated_keyboard
     
-    keyboard = create_paginated_keyboard(
-        items=users_on_page_data, 
-        page=page,
-        items_per_page=ITEMS_PER_PAGE_ADMIN,
-        base_callback_data=base_cb_data_for_pagination, # e.g. "admin_users_list_page:all"
-        item_callback_prefix="admin_user_details", 
-        language=lang,
-        back_callback_key="back_to_admin_main_menu", 
-        back_callback_data="admin_users_menu", # Back to the user filter menu
-        total_items_override=total_users,
-        item_text_key="name", # 'name' field from users_on_page_data as formatted by service
-        item_id_key="telegram_id" # User's telegram_id as the unique identifier
+    # Same page content -> same markup; reuse it while it is fresh
+    keyboard_cache_key = (
+        tuple((u["telegram_id"], u["name"]) for u in users_on_page_data),
+        page, total_users, lang, base_cb_data_for_pagination
     )
-    
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery) and hasattr(event, 'answer'): await event.answer()
+    keyboard = _USER_LIST_KEYBOARD_CACHE.get(keyboard_cache_key)
+    if keyboard is None:
+        keyboard = create_paginated_keyboard(
+            items=users_on_page_data, 
+            page=page,
+            items_per_page=ITEMS_PER_PAGE_ADMIN,
+            base_callback_data=base_cb_data_for_pagination, # e.g. "admin_users_list_page:1"
+            item_callback_prefix="admin_user_details", 
+            language=lang,
+            back_callback_key="back_to_admin_main_menu", 
+            back_callback_data="admin_users_menu", # Back to the user filter menu
+            total_items_override=total_users,
+            item_text_key="name", # 'name' field from users_on_page_data as formatted by service
+            item_id_key="telegram_id" # User's telegram_id as the unique identifier
+        )
+        _USER_LIST_KEYBOARD_CACHE[keyboard_cache_key] = keyboard
+    return title, keyboard
+
+
+async def _send_paginated_user_list_msg(
+    message: types.Message, 
+    state: FSMContext, 
+    user_data: Dict[str, Any], 
+    is_blocked_filter: Optional[bool] = None, 
+    page: int = 0
+):
+    """Send the admin user list as a new message."""
+    text, keyboard = await _build_user_list_view(state, user_data.get("language", "en"), is_blocked_filter, page)
+    await message.answer(text, reply_markup=keyboard, parse_mode=None)
+
+
+async def _send_paginated_user_list_cq(
+    callback: types.CallbackQuery, 
+    state: FSMContext, 
+    user_data: Dict[str, Any], 
+    is_blocked_filter: Optional[bool] = None, 
+    page: int = 0
+):
+    """Show the admin user list in the callback's message."""
+    text, keyboard = await _build_user_list_view(state, user_data.get("language", "en"), is_blocked_filter, page)
+    await _safe_edit(callback, text, reply_markup=keyboard, parse_mode=None)
 
 # Callback for selecting filter and for pagination on user list
 @router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_LIST, AdminUserManagementStates.VIEWING_USER_DETAILS, None), F.data.startswith("admin_users_list_page:"))
 async def cq_admin_users_list_navigate(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    parts = callback.data.split(":") # Expected: "admin_users_list_page", "filter_type", "page_num"
-    filter_str = parts[1]
-    page = int(parts[2])
+    _, blocked_flag, page_str = _parse_cb(callback.data, 3) # "admin_users_list_page", ""/"1"/"0", "page_num"
+    page = int(page_str)
     
-    is_blocked_filter = None
-    if filter_str == 'blocked': is_blocked_filter = True
-    elif filter_str == 'active': is_blocked_filter = False
+    is_blocked_filter = _FILTER_STR_TO_BOOL.get(blocked_flag)
+
+    await _send_paginated_user_list_cq(callback, state, user_data, is_blocked_filter=is_blocked_filter, page=page)
+
+
+async def _build_user_details_view(lang: str, state: FSMContext, telegram_id: int) -> Optional[Tuple[str, InlineKeyboardMarkup]]:
+    """
+    Fetch a user's details, set VIEWING_USER_DETAILS and build the details view.
+    Returns (text, keyboard) or None if the user was not found (state is left untouched then).
+    """
+    user_details_data = await _USER_SERVICE.get_user_details_for_admin(telegram_id, lang)
+    if not user_details_data:
+        return None
+
+    t = partial(get_text, language=lang)
+    details_text = "\n".join([
+        t("admin_user_details_title").format(id=user_details_data['telegram_id']),
+        "",
+        t("language_label") + f": {user_details_data['language_code'].upper()}",
+        t("status_label") + f": {'🔒 ' + t('blocked_status') if user_details_data['is_blocked'] else '🔓 ' + t('active_status')}",
+        t("is_admin_label") + f": {'✅ ' + t('yes') if user_details_data['is_admin_status'] else '❌ ' + t('no')}",
+        t("total_orders_label") + f": {user_details_data['order_count']}",
+        t("joined_date_label") + f": {user_details_data['created_at_display']}",
+    ]) + "\n"
+
+    keyboard = create_admin_user_list_item_keyboard(user_details_data['telegram_id'], user_details_data['is_blocked'], lang)
 
-    await _send_paginated_user_list(callback, state, user_data, is_blocked_filter=is_blocked_filter, page=page)
+    await _set_state_if_changed(state, AdminUserManagementStates.VIEWING_USER_DETAILS)
+    await state.update_data(vuid=telegram_id) # Store for actions
+    return details_text, keyboard
 
 
-@router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_LIST), F.data.startswith("admin_user_details:"))
+async def _render_user_details(target_message: types.Message, lang: str, state: FSMContext, telegram_id: int) -> bool:
+    """
+    Fetch a user's details and show them in target_message (edited in place).
+    Returns False if the user was not found (nothing is rendered then).
+    """
+    view = await _build_user_details_view(lang, state, telegram_id)
+    if not view:
+        return False
+
+    details_text, keyboard = view
+    await target_message.edit_text(details_text, reply_markup=keyboard, parse_mode="HTML")
+    return True
+
+
+async def _user_list_position(state: FSMContext) -> Tuple[Optional[bool], int]:
+    """(is_blocked_filter, page) of the user list last shown, from FSM; defaults to the first page of all users."""
+    state_data = await state.get_data()
+    filter_type_key = state_data.get("current_user_filter_type", "admin_filter_all_users")
+    return _FILTER_KEY_TO_BOOL.get(filter_type_key), state_data.get("current_user_list_page", 0)
+
+
+async def _show_user_list_from_state(target_message: types.Message, state: FSMContext, lang: str):
+    """Re-show the user list (filter and page taken from FSM) in target_message, without answering any callback."""
+    is_blocked_filter, current_page = await _user_list_position(state)
+    text, keyboard = await _build_user_list_view(state, lang, is_blocked_filter, current_page)
+    await target_message.edit_text(text, reply_markup=keyboard, parse_mode=None)
+
+
+@router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_LIST), F.data.startswith(CB_USER_DETAILS))
 async def cq_admin_view_user_details(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    telegram_id = int(callback.data.split(":")[1])
+    telegram_id = int(_parse_cb(callback.data, 2)[1])
     
-    user_details_data = await user_service.get_user_details_for_admin(telegram_id, lang)
-
-    if not user_details_data:
+    if not await _render_user_details(callback.message, lang, state, telegram_id):
+        # The message still shows the user list (state is unchanged), so the alert is enough
         await callback.answer(get_text("admin_user_not_found", lang).format(id=telegram_id), show_alert=True)
-        # Attempt to return to the user list (current page and filter)
-        state_data = await state.get_data()
-        filter_type_key = state_data.get("current_user_filter_type", "admin_filter_all_users")
-        current_page = state_data.get("current_user_list_page", 0)
-        
-        is_blocked_filter = None
-        if filter_type_key == "admin_filter_blocked_users": is_blocked_filter = True
-        elif filter_type_key == "admin_filter_active_users": is_blocked_filter = False
-        
-        await _send_paginated_user_list(callback, state, user_data, is_blocked_filter=is_blocked_filter, page=current_page)
         return
 
-    details_text = get_text("admin_user_details_title", lang).format(id=user_details_data['telegram_id']) + "\n\n"
-    details_text += get_text("language_label", lang) + f": {user_details_data['language_code'].upper()}\n"
-    details_text += get_text("status_label", lang) + f": {'🔒 ' + get_text('blocked_status', lang) if user_details_data['is_blocked'] else '🔓 ' + get_text('active_status', lang)}\n"
-    details_text += get_text("is_admin_label", lang) + f": {'✅ ' + get_text('yes', lang) if user_details_data['is_admin_status'] else '❌ ' + get_text('no', lang)}\n"
-    details_text += get_text("total_orders_label", lang) + f": {user_details_data['order_count']}\n"
-    details_text += get_text("joined_date_label", lang) + f": {user_details_data['created_at_display']}\n"
-
-    keyboard = create_admin_user_list_item_keyboard(user_details_data['telegram_id'], user_details_data['is_blocked'], lang)
-
-    await state.set_state(AdminUserManagementStates.VIEWING_USER_DETAILS)
-    await state.update_data(viewing_user_id=telegram_id) # Store for actions
-
-    await callback.message.edit_text(details_text, reply_markup=keyboard, parse_mode="HTML")
     await callback.answer()
 
 
 @router.callback_query(F.data.startswith("admin_edit_location_start:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))
 async def cq_admin_edit_location_start(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    location_id = int(callback.data.split(":")[1])
+    location_id = int(_parse_cb(callback.data, 2)[1])
     state_data = await state.get_data()
     
     # Ensure current_location_id and name are in state, fetch if not (e.g. direct entry to edit)
     current_location_name_from_state = state_data.get("current_location_name")
     if state_data.get("current_location_id") != location_id or not current_location_name_from_state:
-        location_details = await location_service.get_location_details(location_id, lang)
+        location_details = await _LOCATION_SERVICE.get_location_details(location_id, lang)
         if not location_details:
             await callback.answer(get_text("admin_location_not_found_error", lang), show_alert=True)
             current_page = state_data.get("current_location_list_page", 0) # Attempt to go back to list
@@ -564,25 +796,19 @@ async def cq_admin_edit_location_start(callback: types.CallbackQuery, user_data:
     else:
         location_name_for_prompt = current_location_name_from_state
 
-    # Assuming create_admin_location_edit_options_keyboard will be defined in app.keyboards.inline
-    from app.keyboards.inline import create_admin_location_edit_options_keyboard 
     keyboard = create_admin_location_edit_options_keyboard(location_id, lang)
     
-    await callback.message.edit_text(
-        get_text("admin_what_to_edit_location", lang, name=location_name_for_prompt), 
+    await _safe_edit(
+        callback,
+        get_text("admin_what_to_edit_location", lang, name=location_name_for_prompt),
         reply_markup=keyboard
     )
-    await callback.answer()
 
 @router.callback_query(F.data.startswith("admin_edit_location_field:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))
 async def cq_admin_edit_location_field_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    parts = callback.data.split(":") # Expected: admin_edit_location_field:FIELD_NAME
-    field_to_edit = parts[1] 
+    field_to_edit = callback.data.removeprefix("admin_edit_location_field:")
     await state.update_data(editing_location_field=field_to_edit)
 
     prompt_text_key = ""
@@ -596,18 +822,11 @@ async def cq_admin_edit_location_field_prompt(callback: types.CallbackQuery, use
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         return
 
-    prompt_text = get_text(prompt_text_key, lang)
-    cancel_info = get_text("cancel_prompt", lang)
-    await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
-    await callback.answer()
+    await _safe_edit(callback, _prompt_with_cancel(prompt_text_key, lang), parse_mode="HTML")
 
 @router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_EDIT_NAME, AdminProductStates.LOCATION_AWAIT_EDIT_ADDRESS), F.text)
 async def fsm_admin_location_edit_value_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     state_data = await state.get_data()
     location_id = state_data.get("current_location_id")
@@ -615,15 +834,7 @@ async def fsm_admin_location_edit_value_received(message: types.Message, user_da
     if message.text.lower() == "/cancel":
         if location_id: 
             await state.set_state(AdminProductStates.LOCATION_SELECT_FOR_EDIT)
-            temp_message_for_edit = await message.answer(get_text("loading_text", lang, default="."), reply_markup=types.ReplyKeyboardRemove())
-            mock_callback = types.CallbackQuery(
-                id=str(message.message_id) + "_cancel_loc_edit", 
-                from_user=message.from_user,
-                chat_instance=str(message.chat.id), 
-                message=temp_message_for_edit, 
-                data=f"admin_location_actions:{location_id}"
-            )
-            return await cq_admin_location_actions(mock_callback, user_data, state)
+            return await _answer_location_actions(message, location_id, lang, state)
         else: 
             return await universal_cancel_admin_action(message, state, user_data)
 
@@ -632,9 +843,7 @@ async def fsm_admin_location_edit_value_received(message: types.Message, user_da
 
     if not new_value and current_fsm_state == AdminProductStates.LOCATION_AWAIT_EDIT_NAME:
         await message.answer(get_text("admin_location_name_empty_error", lang))
-        prompt_text = get_text("admin_enter_new_location_name_prompt", lang) # Re-prompt for name
-        cancel_info = get_text("cancel_prompt", lang)
-        await message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
+        await message.answer(_prompt_with_cancel("admin_enter_new_location_name_prompt", lang), parse_mode="HTML") # Re-prompt for name
         return
     
     if new_value == "-" and current_fsm_state == AdminProductStates.LOCATION_AWAIT_EDIT_ADDRESS: 
@@ -645,9 +854,7 @@ async def fsm_admin_location_edit_value_received(message: types.Message, user_da
     if not location_id or not field_to_edit: 
         await message.answer(get_text("admin_action_failed_no_context", lang))
         await state.clear()
-        from app.keyboards.inline import create_admin_location_management_menu_keyboard # For fallback
-        keyboard = create_admin_location_management_menu_keyboard(lang)
-        await message.answer(get_text("admin_location_management_title", lang), reply_markup=keyboard)
+        await message.answer(*_menu_screen("locations", lang))
         return
 
     name_arg, address_arg = None, None
@@ -656,49 +863,37 @@ async def fsm_admin_location_edit_value_received(message: types.Message, user_da
     elif field_to_edit == "address":
         address_arg = new_value
     
-    updated_location_dict, error_message_key = await location_service.update_location_details(
+    updated_location_dict, error_message_key = await _LOCATION_SERVICE.update_location_details(
         location_id, name=name_arg, address=address_arg, lang=lang
     )
 
     original_name_before_edit = state_data.get("current_location_name", "") # For error messages
 
     if updated_location_dict:
-        await message.answer(get_text("admin_location_updated_successfully", lang, name=updated_location_dict['name']))
-        # Update state with potentially new name/address for the actions menu
-        await state.update_data(
-            current_location_name=updated_location_dict['name'],
-            current_location_address=updated_location_dict.get('address', get_text("not_specified_placeholder", lang))
-        )
+        result_text = get_text("admin_location_updated_successfully", lang, name=updated_location_dict['name'])
     else:
-        await message.answer(get_text(error_message_key or "admin_location_update_failed_error", lang, name=original_name_before_edit))
+        result_text = get_text(error_message_key or "admin_location_update_failed_error", lang, name=original_name_before_edit)
 
-    # Always return to location actions menu for the current location_id
+    # Always return to location actions menu for the current location_id.
+    # The result notice and the fetch behind the actions menu (which also refreshes the
+    # stored name/address) are independent, so they run concurrently.
     await state.set_state(AdminProductStates.LOCATION_SELECT_FOR_EDIT) 
-    temp_message_for_actions_edit = await message.answer(get_text("loading_text", lang, default="."), reply_markup=types.ReplyKeyboardRemove())
-    mock_callback_for_actions = types.CallbackQuery(
-        id=str(message.message_id) + "_actions_after_loc_val_recv", 
-        from_user=message.from_user,
-        chat_instance=str(message.chat.id),
-        message=temp_message_for_actions_edit, 
-        data=f"admin_location_actions:{location_id}"
-    )
-    await cq_admin_location_actions(mock_callback_for_actions, user_data, state)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(message.answer(result_text))
+        view_task = tg.create_task(_build_location_actions_view(location_id, lang, state))
+    await _answer_location_actions_view(message, view_task.result(), lang, state)
 
 
 @router.callback_query(F.data.startswith("admin_confirm_delete_location_prompt:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))
 async def cq_admin_confirm_delete_location_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    location_id = int(callback.data.split(":")[1])
+    location_id = int(callback.data.removeprefix("admin_confirm_delete_location_prompt:"))
     state_data = await state.get_data()
     location_name = state_data.get("current_location_name")
 
     if state_data.get("current_location_id") != location_id or not location_name:
-        location_details = await location_service.get_location_details(location_id, lang)
+        location_details = await _LOCATION_SERVICE.get_location_details(location_id, lang)
         if not location_details:
             await callback.answer(get_text("admin_location_not_found_error", lang), show_alert=True)
             current_page = state_data.get("current_location_list_page", 0)
@@ -712,31 +907,26 @@ async def cq_admin_confirm_delete_location_prompt(callback: types.CallbackQuery,
     keyboard = create_confirmation_keyboard(
         lang,
         yes_callback=f"admin_execute_delete_location:{location_id}",
-        no_callback=f"admin_location_actions:{location_id}" 
+        no_callback=LocationCD(action="actions", id=location_id).pack()
     )
-    await callback.message.edit_text(confirmation_text, reply_markup=keyboard)
-    await callback.answer()
+    await _safe_edit(callback, confirmation_text, reply_markup=keyboard)
 
 @router.callback_query(F.data.startswith("admin_execute_delete_location:"), StateFilter(AdminProductStates.LOCATION_CONFIRM_DELETE))
 async def cq_admin_execute_delete_location(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     location_id = state_data.get("current_location_id") 
     location_name_from_state = state_data.get("current_location_name", "N/A")
 
-    callback_location_id = int(callback.data.split(":")[1])
+    callback_location_id = int(_parse_cb(callback.data, 2)[1])
     if location_id != callback_location_id: 
-        logger.warning(f"Location ID mismatch in delete execution. State: {location_id}, Callback: {callback_location_id}")
+        logger.warning("Location ID mismatch in delete execution. State: %s, Callback: %s", location_id, callback_location_id)
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         await state.clear() 
         return await _send_paginated_locations_list(callback, state, user_data, page=0)
 
-    success, msg_key, deleted_loc_name = await location_service.delete_location_by_id(location_id, lang)
+    success, msg_key, deleted_loc_name = await _LOCATION_SERVICE.delete_location_by_id(location_id, lang)
     
     display_name = deleted_loc_name or location_name_from_state 
     
@@ -750,7 +940,7 @@ async def cq_admin_execute_delete_location(callback: types.CallbackQuery, state:
 # The existing universal_cancel_admin_action should be reviewed to ensure it handles
 # AdminProductStates.LOCATION_AWAIT_NAME, LOCATION_AWAIT_ADDRESS,
 # LOCATION_AWAIT_EDIT_NAME, LOCATION_AWAIT_EDIT_ADDRESS, LOCATION_CONFIRM_DELETE
-# and navigates appropriately, likely back to cq_admin_locations_menu or cq_admin_location_actions.
+# and navigates appropriately, likely back to cq_admin_section_menu or cq_admin_location_actions.
 
 # Example modification for universal_cancel_admin_action (conceptual)
 # (Actual implementation might vary based on existing structure)
@@ -773,214 +963,356 @@ async def cq_admin_execute_delete_location(callback: types.CallbackQuery, state:
 # Back from user details to user list
 @router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_DETAILS, AdminUserManagementStates.CONFIRM_BLOCK_USER, AdminUserManagementStates.CONFIRM_UNBLOCK_USER), F.data == "back_to_user_list")
 async def cq_admin_back_to_user_list(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
+    is_blocked_filter, current_page = await _user_list_position(state)
+    await _send_paginated_user_list_cq(callback, state, user_data, is_blocked_filter=is_blocked_filter, page=current_page)
 
-    state_data = await state.get_data()
-    filter_type_key = state_data.get("current_user_filter_type", "admin_filter_all_users") # default to "all" view
-    current_page = state_data.get("current_user_list_page", 0)
-    
-    is_blocked_filter = None
-    if filter_type_key == "admin_filter_blocked_users": is_blocked_filter = True
-    elif filter_type_key == "admin_filter_active_users": is_blocked_filter = False
-    
-    await _send_paginated_user_list(callback, state, user_data, is_blocked_filter=is_blocked_filter, page=current_page)
+
+async def _set_user_blocked(telegram_id: int, admin_id: int, blocked: bool) -> Tuple[bool, str]:
+    """
+    Block or unblock a user, one action per user at a time: concurrent clicks (e.g. two admins)
+    wait for each other, and the later one finds the user already blocked/unblocked instead of
+    writing the same change again. Returns (success, message_key).
+    """
+    async with _USER_ACTION_LOCKS.hold(telegram_id):
+        action = _USER_SERVICE.block_user_by_admin if blocked else _USER_SERVICE.unblock_user_by_admin
+        return await action(telegram_id, admin_id)
 
 
-@router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_DETAILS), F.data.startswith("admin_user_block_confirm_prompt:"))
 async def cq_admin_block_user_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    telegram_id_to_block = int(callback.data.split(":")[1])
+    telegram_id_to_block = int(callback.data.removeprefix(CB_USER_BLOCK_PROMPT))
     
     await state.set_state(AdminUserManagementStates.CONFIRM_BLOCK_USER)
-    # viewing_user_id is already set from user details view. Re-set to be sure.
-    await state.update_data(user_to_block_id=telegram_id_to_block, viewing_user_id=telegram_id_to_block)
+    # vuid is normally already set by the user details view; it is only written if it differs.
+    state_cache = _StateCache(state)
+    await state_cache.load()
+    state_cache.update(buid=telegram_id_to_block, vuid=telegram_id_to_block)
+    await state_cache.flush()
 
 
     confirm_text = get_text("admin_confirm_block_user", lang).format(id=telegram_id_to_block)
     keyboard = create_confirmation_keyboard(
         lang, 
-        yes_callback=f"admin_user_block_execute:{telegram_id_to_block}", 
-        no_callback=f"admin_user_details:{telegram_id_to_block}" 
+        yes_callback=CB_USER_BLOCK_EXEC + str(telegram_id_to_block),
+        no_callback=CB_USER_DETAILS + str(telegram_id_to_block)
     )
-    await callback.message.edit_text(confirm_text, reply_markup=keyboard)
-    await callback.answer()
+    await _safe_edit(callback, confirm_text, reply_markup=keyboard)
 
-@router.callback_query(StateFilter(AdminUserManagementStates.CONFIRM_BLOCK_USER), F.data.startswith("admin_user_block_execute:"))
 async def cq_admin_block_user_execute(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    telegram_id_to_block = int(callback.data.split(":")[1])
+    telegram_id_to_block = int(callback.data.removeprefix(CB_USER_BLOCK_EXEC))
     
-    success, message_key = await user_service.block_user_by_admin(telegram_id_to_block, callback.from_user.id)
+    success, message_key = await _set_user_blocked(telegram_id_to_block, callback.from_user.id, blocked=True)
     
     alert_text = get_text(message_key, lang).format(id=telegram_id_to_block) if success else get_text(message_key, lang)
-    await callback.answer(alert_text, show_alert=True) # Show alert, especially on failure
-
-    # After action, return to user details view, which will refresh its data
-    # State is CONFIRM_BLOCK_USER, need to set back to VIEWING_USER_DETAILS to call details handler
-    await state.set_state(AdminUserManagementStates.VIEWING_USER_DETAILS)
-    # Create a mock callback with the correct data to reinvoke details view
-    mock_callback_data = f"admin_user_details:{telegram_id_to_block}"
-    # Re-use existing callback message if possible, or construct a new one for the call
-    await cq_admin_view_user_details(
-        types.CallbackQuery(id=callback.id, from_user=callback.from_user, chat_instance=callback.chat_instance, message=callback.message, data=mock_callback_data),
-        user_data, 
-        state
-    )
+    answer_task = asyncio.create_task(callback.answer(alert_text, show_alert=True))
+
+    # After action, return to user details view with refreshed data (sets VIEWING_USER_DETAILS)
+    if not await _render_user_details(callback.message, lang, state, telegram_id_to_block):
+        await _show_user_list_from_state(callback.message, state, lang)
+    await _await_callback_answer(answer_task)
 
 
-@router.callback_query(StateFilter(AdminUserManagementStates.VIEWING_USER_DETAILS), F.data.startswith("admin_user_unblock_confirm_prompt:"))
 async def cq_admin_unblock_user_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    telegram_id_to_unblock = int(callback.data.split(":")[1])
+    telegram_id_to_unblock = int(callback.data.removeprefix(CB_USER_UNBLOCK_PROMPT))
     
     await state.set_state(AdminUserManagementStates.CONFIRM_UNBLOCK_USER)
-    await state.update_data(user_to_unblock_id=telegram_id_to_unblock, viewing_user_id=telegram_id_to_unblock)
+    state_cache = _StateCache(state)
+    await state_cache.load()
+    state_cache.update(ubuid=telegram_id_to_unblock, vuid=telegram_id_to_unblock)
+    await state_cache.flush()
 
     confirm_text = get_text("admin_confirm_unblock_user", lang).format(id=telegram_id_to_unblock)
     keyboard = create_confirmation_keyboard(
         lang, 
-        yes_callback=f"admin_user_unblock_execute:{telegram_id_to_unblock}", 
-        no_callback=f"admin_user_details:{telegram_id_to_unblock}"
+        yes_callback=CB_USER_UNBLOCK_EXEC + str(telegram_id_to_unblock),
+        no_callback=CB_USER_DETAILS + str(telegram_id_to_unblock)
     )
-    await callback.message.edit_text(confirm_text, reply_markup=keyboard)
-    await callback.answer()
+    await _safe_edit(callback, confirm_text, reply_markup=keyboard)
 
-@router.callback_query(StateFilter(AdminUserManagementStates.CONFIRM_UNBLOCK_USER), F.data.startswith("admin_user_unblock_execute:"))
 async def cq_admin_unblock_user_execute(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    telegram_id_to_unblock = int(callback.data.split(":")[1])
+    telegram_id_to_unblock = int(callback.data.removeprefix(CB_USER_UNBLOCK_EXEC))
 
-    success, message_key = await user_service.unblock_user_by_admin(telegram_id_to_unblock, callback.from_user.id)
+    success, message_key = await _set_user_blocked(telegram_id_to_unblock, callback.from_user.id, blocked=False)
 
     alert_text = get_text(message_key, lang).format(id=telegram_id_to_unblock) if success else get_text(message_key, lang)
-    await callback.answer(alert_text, show_alert=True)
+    answer_task = asyncio.create_task(callback.answer(alert_text, show_alert=True))
     
-    await state.set_state(AdminUserManagementStates.VIEWING_USER_DETAILS)
-    mock_callback_data = f"admin_user_details:{telegram_id_to_unblock}"
-    await cq_admin_view_user_details(
-        types.CallbackQuery(id=callback.id, from_user=callback.from_user, chat_instance=callback.chat_instance, message=callback.message, data=mock_callback_data),
-        user_data, 
-        state
-    )
+    if not await _render_user_details(callback.message, lang, state, telegram_id_to_unblock):
+        await _show_user_list_from_state(callback.message, state, lang)
+    await _await_callback_answer(answer_task)
+
+
+# Block/unblock actions: callback prefix -> (required FSM state, handler).
+# One registered handler looks the prefix up here instead of aiogram testing a filter chain per handler.
+_USER_ACTION_DISPATCH: Dict[str, Tuple[State, Any]] = {
+    "admin_user_block_confirm_prompt": (AdminUserManagementStates.VIEWING_USER_DETAILS, cq_admin_block_user_prompt),
+    "admin_user_block_execute": (AdminUserManagementStates.CONFIRM_BLOCK_USER, cq_admin_block_user_execute),
+    "admin_user_unblock_confirm_prompt": (AdminUserManagementStates.VIEWING_USER_DETAILS, cq_admin_unblock_user_prompt),
+    "admin_user_unblock_execute": (AdminUserManagementStates.CONFIRM_UNBLOCK_USER, cq_admin_unblock_user_execute),
+}
+
+
+@router.callback_query(F.data.startswith("admin_user_"))
+async def cq_admin_user_action_dispatch(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext, raw_state: Optional[str]):
+    entry = _USER_ACTION_DISPATCH.get(callback.data.split(":", 1)[0])
+    if entry is None or raw_state != entry[0].state:
+        raise SkipHandler()  # Not a block/unblock action for the current state; let other handlers try
+    
+    handler = entry[1]
+    return await handler(callback, user_data, state)
 
 
 # --- Bot Parameter Settings Handlers ---
+@lru_cache(maxsize=8)
+def _settings_menu_text(lang: str) -> str:
+    """Settings overview (HTML). Settings are only read from config, so the text is fixed per language."""
+    t = partial(get_text, language=lang)
+    return "\n".join([
+        t("admin_settings_title"),
+        "",
+        hbold(t("admin_current_settings")),
+        # Display current settings from config.settings (these are not editable via bot by default)
+        f"- {t('setting_bot_token')}: {_MASKED_BOT_TOKEN}",
+        f"- {t('setting_admin_chat_id')}: {settings.ADMIN_CHAT_ID or t('not_set')}",
+        f"- {t('setting_order_timeout_hours')}: {settings.ORDER_TIMEOUT_HOURS} {t('hours', default='hours')}",
+        # Add more settings from settings.py or a dynamic settings service if implemented
+        ""
+    ])
+
+
 @router.callback_query(F.data == "admin_settings_menu")
 async def cq_admin_settings_menu(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
     await state.set_state(AdminSettingsStates.VIEWING_SETTINGS_MENU)
-    
-    settings_text = get_text("admin_settings_title", lang) + "\n\n"
-    settings_text += hbold(get_text("admin_current_settings", lang)) + "\n"
-    
-    # Display current settings from config.settings (these are not editable via bot by default)
-    settings_text += f"- {get_text('setting_bot_token', lang)}: {settings.BOT_TOKEN[:5]}***{settings.BOT_TOKEN[-3:] if len(settings.BOT_TOKEN) > 8 else ''}\n"
-    settings_text += f"- {get_text('setting_admin_chat_id', lang)}: {settings.ADMIN_CHAT_ID or get_text('not_set', lang)}\n"
-    settings_text += f"- {get_text('setting_order_timeout_hours', lang)}: {settings.ORDER_TIMEOUT_HOURS} {get_text('hours', lang, default='hours')}\n"
-    # Add more settings from settings.py or a dynamic settings service if implemented
 
     # Keyboard only has back button for now. Future: add buttons to edit specific settings.
-    keyboard = InlineKeyboardBuilder().row(create_back_button("back_to_admin_main_menu", lang, "admin_panel_main")).as_markup()
+    keyboard = _admin_back_markup(lang, "admin_panel_main", "back_to_admin_main_menu")
 
-    await callback.message.edit_text(settings_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+    await _safe_edit(callback, _settings_menu_text(lang), reply_markup=keyboard, parse_mode="HTML")
 
 
 # --- Statistics View Handlers ---
 @router.callback_query(F.data == "admin_stats_menu")
 async def cq_admin_stats_menu(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService() # For admin check and stats
-    product_service = ProductService() # For product stats
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    await state.set_state(AdminStatisticsStates.VIEWING_STATS_MENU)
-
-    stats_data = await user_service.get_basic_statistics(lang) # UserService aggregates some stats
+    # The FSM write and the stats queries are independent
+    _, stats_data = await asyncio.gather(
+        state.set_state(AdminStatisticsStates.VIEWING_STATS_MENU),
+        _USER_SERVICE.get_basic_statistics(lang) # UserService aggregates some stats
+    )
 
-    stats_text = hbold(get_text("admin_statistics_title", lang)) + "\n\n"
-    stats_text += get_text("stats_total_users", lang).format(count=stats_data.get("total_users", 0)) + "\n"
-    stats_text += get_text("stats_active_users", lang).format(count=stats_data.get("active_users",0)) + "\n"
-    stats_text += get_text("stats_blocked_users", lang).format(count=stats_data.get("blocked_users",0)) + "\n"
-    stats_text += "-----\n"
-    stats_text += get_text("stats_total_orders", lang).format(count=stats_data.get("total_orders",0)) + "\n"
-    stats_text += get_text("stats_pending_orders", lang).format(count=stats_data.get("pending_orders",0)) + "\n"
+    t = partial(get_text, language=lang)
+    stats_text = "\n".join([
+        hbold(t("admin_statistics_title")),
+        "",
+        t("stats_total_users").format(count=stats_data.get("total_users", 0)),
+        t("stats_active_users").format(count=stats_data.get("active_users", 0)),
+        t("stats_blocked_users").format(count=stats_data.get("blocked_users", 0)),
+        "-----",
+        t("stats_total_orders").format(count=stats_data.get("total_orders", 0)),
+        t("stats_pending_orders").format(count=stats_data.get("pending_orders", 0)),
+        ""
+    ])
     # stats_text += "-----\n"
     # Placeholder for product count until ProductService has a count method.
     # For now, we'll omit it or use a placeholder if ProductService cannot provide it easily.
-    # total_products, _ = await product_service.list_all_entities_paginated("product", 0, 1, lang) # hack for total product count
+    # total_products, _ = await _PRODUCT_SERVICE.list_all_entities_paginated("product", 0, 1, lang) # hack for total product count
     # stats_text += get_text("stats_total_products", lang).format(count=total_products if total_products is not None else get_text("not_available_short", lang)) + "\n"
     
-    keyboard = InlineKeyboardBuilder().row(create_back_button("back_to_admin_main_menu", lang, "admin_panel_main")).as_markup()
+    keyboard = _admin_back_markup(lang, "admin_panel_main", "back_to_admin_main_menu")
 
-    await callback.message.edit_text(stats_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+    await _safe_edit(callback, stats_text, reply_markup=keyboard, parse_mode="HTML")
 
 
-# --- Order Management Handlers (largely existing, ensure they use updated is_admin_user_check) ---
+# --- Order Management Handlers ---
 @router.callback_query(F.data == "admin_orders_menu")
 async def cq_admin_orders_menu(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
     await state.set_state(AdminOrderManagementStates.CHOOSING_ORDER_ACTION)
-    keyboard = create_admin_order_list_filters_keyboard(lang) 
-    await callback.message.edit_text(get_text("admin_orders_title", lang), reply_markup=keyboard)
-    await callback.answer()
-
-async def _send_paginated_orders_list(
-    event: Union[types.Message, types.CallbackQuery], 
-    state: FSMContext, 
-    user_data: Dict[str, Any], 
-    status_filter: Optional[str] = None, 
+    text, keyboard = _menu_screen("orders", lang)
+    await _safe_edit(callback, text, reply_markup=keyboard)
+
+async def _fetch_orders_page(
+    lang: str,
+    status_filter: Optional[str],
+    filter_user_id: Optional[int],
+    page: int,
+    after: Optional[Tuple[Dict[str, Any], int]] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Load one page of the admin orders list, bounded by _DB_SEM.
+    after is (previous page's last row, its total): the query seeks past that row instead of using
+    an offset, and the total is carried over rather than counted again.
+    """
+    if after is not None:
+        after_row, total = after
+        cursor = {"offset": 0, "before_ts": after_row["created_at"], "before_id": after_row["id"]}
+    else:
+        cursor = {"offset": page * ITEMS_PER_PAGE_ADMIN}
+    async with _DB_SEM:
+        orders, page_total = await _ORDER_SERVICE.get_orders_list_for_admin(
+            language=lang, 
+            limit=ITEMS_PER_PAGE_ADMIN, 
+            status_filter=status_filter,
+            user_id_filter=filter_user_id,
+            **cursor
+        )
+    if after is None:
+        total = page_total
+    return orders, total
+
+
+def _previous_page_cursor(admin_id: int, page_key: Tuple[Any, ...]) -> Optional[Tuple[Dict[str, Any], int]]:
+    """
+    (last row, total) of the page before page_key if it is the admin's fresh cached page and full,
+    i.e. a keyset cursor for page_key. None when the page has to be read by offset.
+    """
+    lang, status_filter, filter_user_id, page = page_key
+    entry = _ORDERS_PAGE_CACHE.get(admin_id)
+    if page == 0 or entry is None:
+        return None
+    key, shown_at, rows, total = entry
+    if key != (lang, status_filter, filter_user_id, page - 1) or time.monotonic() - shown_at > _ORDERS_PAGE_CACHE_TTL:
+        return None
+    if len(rows) != ITEMS_PER_PAGE_ADMIN or rows[-1].get("created_at") is None:
+        return None
+    return rows[-1], total
+
+
+def _prefetch_orders_page(
+    admin_id: int,
+    lang: str,
+    status_filter: Optional[str],
+    filter_user_id: Optional[int],
+    page: int,
+    after: Optional[Tuple[Dict[str, Any], int]] = None
+) -> None:
+    """Start loading a page in the background; replaces (and cancels) the admin's previous prefetch."""
+    task = asyncio.create_task(_fetch_orders_page(lang, status_filter, filter_user_id, page, after))
+    previous = _ORDERS_PREFETCH.pop(admin_id, None)
+    if previous is not None and not previous[2].done():
+        previous[2].cancel()
+    _ORDERS_PREFETCH[admin_id] = ((lang, status_filter, filter_user_id, page), time.monotonic(), task)
+
+
+def _take_prefetched_orders_page(admin_id: int, page_key: Tuple[Any, ...]) -> Optional["asyncio.Task"]:
+    """Return the admin's prefetch task if it is for exactly this page and still fresh."""
+    entry = _ORDERS_PREFETCH.pop(admin_id, None)
+    if entry is None:
+        return None
+    key, started_at, task = entry
+    if key != page_key or time.monotonic() - started_at > _ORDERS_PREFETCH_TTL or task.cancelled():
+        task.cancel()
+        return None
+    if task.done() and task.exception() is not None:
+        return None  # Failed prefetch; query again instead
+    return task
+
+
+@lru_cache(maxsize=64)
+def _orders_list_title(lang: str, status_filter: Optional[str]) -> Tuple[str, str]:
+    """(title, status filter display name) of the admin orders list; fixed per (language, filter), so formatted once."""
+    if status_filter and status_filter in ORDER_STATUS_VALUES:
+        filter_display_name = get_text(f"order_status_{status_filter}", lang)
+    else:
+        filter_display_name = get_text("admin_filter_all_orders_display", lang)
+    return get_text("admin_orders_list_title_status", lang).format(status=filter_display_name), filter_display_name
+
+
+def _order_summary_row(order_details: Dict[str, Any], lang: str) -> Dict[str, Any]:
+    """Orders list row (as built by OrderService.get_orders_list_for_admin) from an order's admin details."""
+    return {
+        "id": order_details["id"],
+        "summary_text": get_text("admin_order_summary_list_format", lang).format(
+            status_emoji=order_details["status_emoji"],
+            id=order_details["id"],
+            user=order_details["user_display"],
+            total=order_details["total_amount_display"],
+            date=order_details["created_at_display"]
+        ),
+        "status_raw": order_details["status_raw"],
+        "user_id": order_details["user_id"],
+        "created_at": order_details["created_at"]
+    }
+
+
+async def _patch_order_in_cached_page(
+    admin_id: int,
+    page_key: Tuple[Any, ...],
+    order_id: int
+) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    """
+    Refresh one order's row in the admin's cached orders page and return (rows, total).
+    Returns None when the page has to be reloaded instead: nothing fresh is cached for page_key,
+    the order is not on it, or its new status no longer matches the list's status filter.
+    """
+    entry = _ORDERS_PAGE_CACHE.get(admin_id)
+    if entry is None:
+        return None
+    key, shown_at, rows, total = entry
+    if key != page_key or time.monotonic() - shown_at > _ORDERS_PAGE_CACHE_TTL:
+        return None
+    if not any(row["id"] == order_id for row in rows):
+        return None
+
+    order_details = await _ORDER_SERVICE.get_order_details_for_admin(order_id, page_key[0])
+    status_filter = page_key[1]
+    if not order_details or (status_filter and order_details["status_raw"] != status_filter):
+        return None
+
+    patched_row = _order_summary_row(order_details, page_key[0])
+    rows = [patched_row if row["id"] == order_id else row for row in rows]
+    _ORDERS_PAGE_CACHE[admin_id] = (key, shown_at, rows, total)
+    return rows, total
+
+
+async def _build_orders_list_view(
+    state: FSMContext,
+    lang: str,
+    admin_id: int,
+    status_filter: Optional[str] = None,
     page: int = 0,
-    filter_user_id: Optional[int] = None # Added for filtering orders by user ID
-):
-    lang = user_data.get("language", "en")
-    order_service = OrderService()
-    user_service = UserService() 
+    filter_user_id: Optional[int] = None,
+    patch_order_id: Optional[int] = None
+) -> Tuple[str, InlineKeyboardMarkup]:
+    """
+    Fetch a page of orders and build the (text, keyboard) of the admin orders list. The text has no markup.
+    With patch_order_id only that order's row is re-read when the page is still cached (see _patch_order_in_cached_page).
+    A non-empty list sets VIEWING_ORDERS_LIST and stores its filter and page for back navigation.
+    """
+    page_key = (lang, status_filter, filter_user_id, page)
+    patched = None
+    if patch_order_id is not None:
+        patched = await _patch_order_in_cached_page(admin_id, page_key, patch_order_id)
+    if patched is not None:
+        orders_on_page_data, total_orders = patched
+    else:
+        prefetched = _take_prefetched_orders_page(admin_id, page_key)
+        if prefetched is not None:
+            orders_on_page_data, total_orders = await prefetched
+        else:
+            orders_on_page_data, total_orders = await _fetch_orders_page(
+                lang, status_filter, filter_user_id, page, _previous_page_cursor(admin_id, page_key)
+            )
 
-    if not await is_admin_user_check(event.from_user.id, user_service): 
-         if isinstance(event, types.CallbackQuery): await event.answer(get_text("admin_access_denied", lang), show_alert=True)
-         elif isinstance(event, types.Message): await event.answer(get_text("admin_access_denied", lang))
-         return
-    
-    orders_on_page_data, total_orders = await order_service.get_orders_list_for_admin(
-        language=lang, 
-        limit=ITEMS_PER_PAGE_ADMIN, 
-        offset=page * ITEMS_PER_PAGE_ADMIN,
-        status_filter=status_filter,
-        user_id_filter=filter_user_id
-    )
+        if not orders_on_page_data and page > 0 and total_orders:
+            # The page emptied (e.g. its last order changed status); show the last page instead
+            page = (total_orders - 1) // ITEMS_PER_PAGE_ADMIN
+            page_key = (lang, status_filter, filter_user_id, page)
+            orders_on_page_data, total_orders = await _fetch_orders_page(lang, status_filter, filter_user_id, page)
+        _ORDERS_PAGE_CACHE[admin_id] = (page_key, time.monotonic(), orders_on_page_data, total_orders)
 
-    filter_display_name = get_text(f"order_status_{status_filter}", lang) if status_filter and status_filter in OrderStatusEnum.values() else get_text("admin_filter_all_orders_display", lang)
-    title = get_text("admin_orders_list_title_status", lang).format(status=filter_display_name)
+    title, filter_display_name = _orders_list_title(lang, status_filter)
     if filter_user_id: title += f" (User ID: {filter_user_id})"
 
 
@@ -993,296 +1325,261 @@ async def _send_paginated_orders_list(
         
         back_cb = "admin_users_menu" if filter_user_id else "admin_orders_menu"
         back_key = "back_to_user_list" if filter_user_id else "back_to_order_filters" # Or a more generic key
-        kb = InlineKeyboardBuilder().row(create_back_button(back_key, lang, back_cb)).as_markup()
-        
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-             await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-             await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery) and hasattr(event, 'answer'): await event.answer()
-        return
+        return empty_text, _admin_back_markup(lang, back_cb, back_key)
 
-    base_cb_data_for_pagination = f"admin_orders_list_page:{status_filter or 'all'}"
-    if filter_user_id: base_cb_data_for_pagination += f":user{filter_user_id}"
-        
     keyboard = create_paginated_keyboard(
         items=orders_on_page_data, 
         page=page,
         items_per_page=ITEMS_PER_PAGE_ADMIN,
-        base_callback_data=base_cb_data_for_pagination,
-        item_callback_prefix="admin_order_details", 
+        base_callback_data=lambda page_num: OrdersListCD(status=status_filter or "all", user_id=filter_user_id, page=page_num).pack(),
+        item_callback_prefix=lambda order_id: OrderCD(action="details", id=order_id).pack(), 
         language=lang,
         back_callback_key="back_to_order_filters" if not filter_user_id else "back_to_user_list", 
-        back_callback_data="admin_orders_menu" if not filter_user_id else f"admin_user_details:{filter_user_id}",    
+        back_callback_data="admin_orders_menu" if not filter_user_id else CB_USER_DETAILS + str(filter_user_id),    
         total_items_override=total_orders,
         item_text_key="summary_text", # As formatted by OrderService.get_orders_list_for_admin
         item_id_key="id"
     )
     
-    await state.set_state(AdminOrderManagementStates.VIEWING_ORDERS_LIST)
-    # Store current filter and user_id for back navigation from order details
-    await state.update_data(current_order_filter=status_filter, current_order_list_user_id=filter_user_id) 
+    # Admins usually page forward next, so start loading the following page now
+    # (a patched page left the following one unchanged, so its earlier prefetch still stands)
+    if patched is None and (page + 1) * ITEMS_PER_PAGE_ADMIN < total_orders:
+        after = (orders_on_page_data[-1], total_orders) if len(orders_on_page_data) == ITEMS_PER_PAGE_ADMIN else None
+        _prefetch_orders_page(admin_id, lang, status_filter, filter_user_id, page + 1, after)
 
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML") 
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML") 
-        
-    if isinstance(event, types.CallbackQuery) and hasattr(event, 'answer'): await event.answer()
+    await _set_state_if_changed(state, AdminOrderManagementStates.VIEWING_ORDERS_LIST) # Unchanged while paging
+    # Store current filter, user_id and page for back navigation from order details
+    await state.update_data(olf=status_filter, olu=filter_user_id, olp=page)
+    return title, keyboard
 
 
-@router.callback_query(StateFilter(AdminOrderManagementStates.CHOOSING_ORDER_ACTION), F.data.startswith("admin_orders_filter:"))
-async def cq_admin_filter_orders(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    status_filter = callback.data.split(":")[1]
-    if status_filter == "all": status_filter = None
-    
-    await _send_paginated_orders_list(callback, state, user_data, status_filter=status_filter, page=0)
+async def _send_paginated_orders_list(
+    event: Union[types.Message, types.CallbackQuery], 
+    state: FSMContext, 
+    user_data: Dict[str, Any], 
+    status_filter: Optional[str] = None, 
+    page: int = 0,
+    filter_user_id: Optional[int] = None # Added for filtering orders by user ID
+):
+    text, keyboard = await _build_orders_list_view(
+        state, user_data.get("language", "en"), event.from_user.id, status_filter, page, filter_user_id
+    )
+    await _reply_or_edit(event, text, keyboard, parse_mode=None, answer_callback=True)
 
-# Handler for viewing a specific user's orders (from user details panel)
-@router.callback_query(F.data.startswith("admin_view_user_orders:"))
-async def cq_admin_view_user_orders_list(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    parts = callback.data.split(":") # admin_view_user_orders:USER_ID:PAGE
-    try:
-        user_id_to_filter = int(parts[1])
-        page = int(parts[2]) if len(parts) > 2 else 0
-    except (IndexError, ValueError):
-        await callback.answer(get_text("error_occurred", lang), show_alert=True)
+async def _show_orders_list_after_action(
+    event: Union[types.Message, types.CallbackQuery],
+    state: FSMContext,
+    lang: str,
+    result_text: str,
+    order_id: int
+):
+    """
+    Return to the orders list page the order was opened from (ofb/oub/opb), with the order's row
+    patched in place, and report result_text in the same step: a callback gets it as an alert
+    alongside one edit, a message gets a single reply with result_text above the list.
+    """
+    state_data = await state.get_data()
+    status_filter = state_data.get("ofb")
+    if status_filter == "all": status_filter = None
+    build_view = _build_orders_list_view(
+        state, lang, event.from_user.id, status_filter, state_data.get("opb", 0), state_data.get("oub"),
+        patch_order_id=order_id
+    )
+    if isinstance(event, types.CallbackQuery):
+        answer_task = asyncio.create_task(event.answer(result_text, show_alert=True))
+        text, keyboard = await build_view
+        await _edit_or_resend(event.message, text, keyboard, None)
+        await _await_callback_answer(answer_task)
         return
-    
-    await _send_paginated_orders_list(callback, state, user_data, status_filter=None, page=page, filter_user_id=user_id_to_filter)
-
-
-@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDERS_LIST), F.data.startswith("admin_orders_list_page:"))
-async def cq_admin_orders_list_paginate(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    parts = callback.data.split(":") # admin_orders_list_page:STATUS_FILTER[:userUSER_ID]:PAGE_NUM
-    status_filter_str = parts[1]
-    user_id_filter = None
-    page_num_str = parts[2]
-
-    if "user" in page_num_str: # Format is admin_orders_list_page:STATUS:userUSERID:PAGE
-        user_id_str_part = parts[2]
-        user_id_filter = int(user_id_str_part.replace("user", ""))
-        page_num_str = parts[3]
-    
-    page = int(page_num_str)
-    status_filter = None if status_filter_str == "all" else status_filter_str
-    
-    await _send_paginated_orders_list(callback, state, user_data, status_filter=status_filter, page=page, filter_user_id=user_id_filter)
-
+    text, keyboard = await build_view
+    await event.answer(f"{result_text}\n\n{text}", reply_markup=keyboard, parse_mode=None)
 
-@router.callback_query(F.data.startswith("admin_order_details:")) # Allow from various states
-async def cq_admin_view_order_details(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    order_id = int(callback.data.split(":")[1])
-    
-    order_service = OrderService()
-    order_details_data = await order_service.get_order_details_for_admin(order_id, lang) 
 
-    state_data = await state.get_data() 
-    current_filter = state_data.get("current_order_filter", "all") 
-    filter_user_id_for_back = state_data.get("current_order_list_user_id")
+# Status filter menu, a user's orders (from the user details panel), back from an order and paging
+@router.callback_query(OrdersListCD.filter())
+async def cq_admin_orders_list(callback: types.CallbackQuery, callback_data: OrdersListCD, state: FSMContext, user_data: Dict[str, Any]):
+    status_filter = None if callback_data.status == "all" else callback_data.status
+    await _send_paginated_orders_list(
+        callback, state, user_data,
+        status_filter=status_filter, page=callback_data.page, filter_user_id=callback_data.user_id
+    )
 
 
+async def _build_order_details_view(
+    lang: str,
+    state: FSMContext,
+    order_id: int
+) -> Tuple[Optional[Tuple[str, InlineKeyboardMarkup]], Dict[str, Any]]:
+    """
+    Fetch an order, set VIEWING_ORDER_DETAILS with its context and build the details view.
+    Returns (view, state_data); view is None if the order was not found (state is left untouched then).
+    """
+    order_details_data, state_data = await asyncio.gather(
+        _ORDER_SERVICE.get_order_details_for_admin(order_id, lang),
+        state.get_data()
+    )
     if not order_details_data:
-        await callback.answer(get_text("admin_order_not_found", lang).format(id=order_id), show_alert=True)
-        back_cb_data = f"admin_orders_filter:{current_filter}"
-        if filter_user_id_for_back:
-             back_cb_data = f"admin_view_user_orders:{filter_user_id_for_back}:0" # Go to page 0 of user's orders
-        
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_orders_list", lang, back_cb_data)).as_markup()
-        try:
-             await callback.message.edit_text(get_text("admin_order_not_found", lang).format(id=order_id), reply_markup=kb)
-        except Exception:
-             await callback.message.answer(get_text("admin_order_not_found", lang).format(id=order_id), reply_markup=kb)
-        await callback.answer()
-        return
+        return None, state_data
 
     details_text = format_admin_order_details(order_details_data, lang)
     actions_keyboard = create_admin_order_actions_keyboard(order_id, order_details_data["status_raw"], lang)
 
     await state.set_state(AdminOrderManagementStates.VIEWING_ORDER_DETAILS)
-    await state.update_data(
-        current_order_id=order_id, 
-        current_order_status_raw=order_details_data["status_raw"], 
-        current_order_filter_for_back=current_filter, # Store filter for returning to correct list
-        current_order_list_user_id_for_back=filter_user_id_for_back # Store user_id if list was filtered by user
+    # Reuse the data read above instead of letting update_data() fetch it again
+    state_cache = _StateCache(state, state_data)
+    state_cache.update(
+        oid=order_id, 
+        ost=order_details_data["status_raw"], 
+        ofb=state_data.get("olf", "all"), # Store filter for returning to correct list
+        oub=state_data.get("olu"), # Store user_id if list was filtered by user
+        opb=state_data.get("olp", 0) # Store page to return to
     )
+    await state_cache.flush()
+    return (details_text, actions_keyboard), state_data
+
+
+@router.callback_query(OrderCD.filter(F.action == "details")) # Allow from various states
+async def cq_admin_view_order_details(callback: types.CallbackQuery, callback_data: OrderCD, user_data: Dict[str, Any], state: FSMContext):
+    lang = user_data.get("language", "en")
     
-    await callback.message.edit_text(details_text, reply_markup=actions_keyboard, parse_mode="HTML")
-    await callback.answer()
+    order_id = callback_data.id
+    
+    view, state_data = await _build_order_details_view(lang, state, order_id)
+    if view:
+        details_text, actions_keyboard = view
+        await _safe_edit(callback, details_text, reply_markup=actions_keyboard, parse_mode="HTML")
+        return
+
+    # Order not found: offer a way back to the list it was opened from
+    current_filter = state_data.get("olf", "all") 
+    filter_user_id_for_back = state_data.get("olu")
+    await callback.answer(get_text("admin_order_not_found", lang).format(id=order_id), show_alert=True)
+    back_cb_data = OrdersListCD(status=current_filter or "all").pack()
+    if filter_user_id_for_back:
+         back_cb_data = OrdersListCD(user_id=filter_user_id_for_back).pack() # Go to page 0 of user's orders
+    
+    kb = _admin_back_markup(lang, back_cb_data, "back_to_orders_list")
+    await _edit_or_resend(callback.message, get_text("admin_order_not_found", lang).format(id=order_id), kb, "HTML")
 
 # ... (Rest of the order management handlers: approve, reject, cancel, change_status)
 # These need to be updated to use the new state data for "back" navigation:
-# current_order_filter_for_back and current_order_list_user_id_for_back
+# ofb (list filter) and oub (list user id)
 
-@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDER_DETAILS), F.data.startswith("admin_approve_order:"))
 async def cq_admin_approve_order(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    order_id = int(callback.data.split(":")[1])
-    order_service = OrderService()
-    success, msg_key_or_error = await order_service.approve_order(order_id, callback.from_user.id, language=lang)
+    order_id = int(callback.data.removeprefix("admin_approve_order:"))
+    success, msg_key_or_error = await _ORDER_SERVICE.approve_order(order_id, callback.from_user.id, language=lang)
     
     alert_text = get_text(msg_key_or_error, lang) if success else msg_key_or_error 
     if success: alert_text = alert_text.format(id=order_id) 
 
-    await callback.answer(alert_text, show_alert=True)
-
-    state_data = await state.get_data()
-    current_filter = state_data.get("current_order_filter_for_back", "all") 
-    user_id_filter = state_data.get("current_order_list_user_id_for_back")
-    await _send_paginated_orders_list(callback, state, user_data, status_filter=current_filter, page=0, filter_user_id=user_id_filter)
-
-
-@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDER_DETAILS), F.data.startswith("admin_reject_order:"))
-async def cq_admin_reject_order_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    order_id = int(callback.data.split(":")[1])
-    
-    await state.set_state(AdminOrderManagementStates.AWAITING_REJECTION_REASON)
-    # current_order_filter_for_back and current_order_list_user_id_for_back are already in state
-    await state.update_data(order_to_process_id=order_id) 
+    await _show_orders_list_after_action(callback, state, lang, alert_text, order_id)
 
-    prompt_text = get_text("admin_enter_rejection_reason", lang).format(order_id=order_id)
-    cancel_text = get_text("cancel_prompt", lang)
-    await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_text)}", parse_mode="HTML")
-    await callback.answer()
 
-@router.message(StateFilter(AdminOrderManagementStates.AWAITING_REJECTION_REASON), F.text)
-async def fsm_admin_rejection_reason_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService() 
-    if not await is_admin_user_check(message.from_user.id, user_service): return
-    
-    if message.text.lower() == "/cancel": # Handle /cancel command
-        return await universal_cancel_admin_action(message, state, user_data)
+# Reject and cancel share the same two steps: prompt for a reason, then apply it.
+def _make_reason_prompt_handler(callback_prefix: str, awaiting_state: State, prompt_key: str):
+    """Build the callback handler that asks the admin for a reason for the order action."""
+    async def handler(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
+        lang = user_data.get("language", "en")
+        
+        order_id = int(callback.data.removeprefix(callback_prefix))
+        
+        await state.set_state(awaiting_state)
+        # ofb and oub are already in state
+        await state.update_data(opid=order_id) 
 
-    state_data = await state.get_data()
-    order_id = state_data.get("order_to_process_id")
-    current_filter = state_data.get("current_order_filter_for_back", "all")
-    user_id_filter = state_data.get("current_order_list_user_id_for_back")
-    reason = sanitize_input(message.text)
+        prompt_text = get_text(prompt_key, lang).format(order_id=order_id)
+        cancel_text = get_text("cancel_prompt", lang)
+        await _safe_edit(callback, f"{prompt_text}\n\n{hitalic(cancel_text)}", parse_mode="HTML")
+    return handler
 
-    if not order_id: 
-        await message.answer(get_text("admin_action_failed_no_context", lang))
-        return await admin_panel_command(message, state, user_data) 
 
-    order_service = OrderService()
-    success, msg_key = await order_service.reject_order(order_id, message.from_user.id, reason, language=lang)
+def _make_reason_received_handler(service_method_name: str):
+    """Build the message handler that applies the order action (an OrderService method) with the given reason."""
+    async def handler(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
+        lang = user_data.get("language", "en")
+        
+        if message.text.lower() == "/cancel": # Handle /cancel command
+            return await universal_cancel_admin_action(message, state, user_data)
 
-    await message.answer(get_text(msg_key, lang).format(id=order_id))
-    await _send_paginated_orders_list(message, state, user_data, status_filter=current_filter, page=0, filter_user_id=user_id_filter)
+        state_data = await state.get_data()
+        order_id = state_data.get("opid")
+        reason = sanitize_input(message.text, max_length=_MAX_REASON_LEN)
 
+        if not order_id: 
+            await message.answer(get_text("admin_action_failed_no_context", lang))
+            return await admin_panel_command(message, state, user_data) 
 
-@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDER_DETAILS), F.data.startswith("admin_cancel_order:"))
-async def cq_admin_cancel_order_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    order_id = int(callback.data.split(":")[1])
-    await state.set_state(AdminOrderManagementStates.AWAITING_CANCELLATION_REASON)
-    await state.update_data(order_to_process_id=order_id) 
+        service_method = getattr(_ORDER_SERVICE, service_method_name)
+        success, msg_key = await service_method(order_id, message.from_user.id, reason, language=lang)
 
-    prompt_text = get_text("admin_enter_cancellation_reason", lang).format(order_id=order_id)
-    cancel_text = get_text("cancel_prompt", lang)
-    await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_text)}", parse_mode="HTML")
-    await callback.answer()
+        await _show_orders_list_after_action(message, state, lang, get_text(msg_key, lang).format(id=order_id), order_id)
+    return handler
 
-@router.message(StateFilter(AdminOrderManagementStates.AWAITING_CANCELLATION_REASON), F.text)
-async def fsm_admin_cancellation_reason_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service): return
 
-    if message.text.lower() == "/cancel":
-        return await universal_cancel_admin_action(message, state, user_data)
+cq_admin_reject_order_prompt = _make_reason_prompt_handler(
+    "admin_reject_order:", AdminOrderManagementStates.AWAITING_REJECTION_REASON, "admin_enter_rejection_reason"
+)
 
-    state_data = await state.get_data()
-    order_id = state_data.get("order_to_process_id")
-    current_filter = state_data.get("current_order_filter_for_back", "all")
-    user_id_filter = state_data.get("current_order_list_user_id_for_back")
-    reason = sanitize_input(message.text)
+fsm_admin_rejection_reason_received = router.message(
+    StateFilter(AdminOrderManagementStates.AWAITING_REJECTION_REASON), F.text
+)(_make_reason_received_handler("reject_order"))
 
-    if not order_id: 
-        await message.answer(get_text("admin_action_failed_no_context", lang))
-        return await admin_panel_command(message, state, user_data)
+cq_admin_cancel_order_prompt = _make_reason_prompt_handler(
+    "admin_cancel_order:", AdminOrderManagementStates.AWAITING_CANCELLATION_REASON, "admin_enter_cancellation_reason"
+)
 
-    order_service = OrderService()
-    success, msg_key = await order_service.cancel_order_by_admin(order_id, message.from_user.id, reason, language=lang) 
-    
-    await message.answer(get_text(msg_key, lang).format(id=order_id))
-    await _send_paginated_orders_list(message, state, user_data, status_filter=current_filter, page=0, filter_user_id=user_id_filter)
+fsm_admin_cancellation_reason_received = router.message(
+    StateFilter(AdminOrderManagementStates.AWAITING_CANCELLATION_REASON), F.text
+)(_make_reason_received_handler("cancel_order_by_admin"))
 
 
-@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDER_DETAILS), F.data.startswith("admin_change_order_status:"))
 async def cq_admin_change_status_prompt(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     
-    order_id = int(callback.data.split(":")[1])
-    state_data = await state.get_data()
-    current_status_raw = state_data.get("current_order_status_raw") 
+    order_id = int(callback.data.removeprefix("admin_change_order_status:"))
+    state_cache = _StateCache(state)
+    state_data = await state_cache.load()
+    current_status_raw = state_data.get("ost") 
 
     if not current_status_raw: 
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         return 
 
     await state.set_state(AdminOrderManagementStates.SELECTING_NEW_STATUS)
-    await state.update_data(order_to_process_id=order_id) 
+    state_cache.update(opid=order_id)
+    await state_cache.flush()
 
     keyboard = create_admin_order_statuses_keyboard(lang, current_status_raw=current_status_raw, order_id=order_id)
-    await callback.message.edit_text(get_text("admin_select_new_status_prompt", lang).format(order_id=order_id), reply_markup=keyboard)
-    await callback.answer()
+    await _safe_edit(callback, get_text("admin_select_new_status_prompt", lang).format(order_id=order_id), reply_markup=keyboard)
 
-@router.callback_query(StateFilter(AdminOrderManagementStates.SELECTING_NEW_STATUS), F.data.startswith("admin_set_status:"))
-async def cq_admin_set_new_status(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
+
+# Order details actions: callback prefix -> handler. All of them start from VIEWING_ORDER_DETAILS,
+# so one registered handler dispatches them instead of aiogram testing a filter per action.
+_ORDER_ACTION_DISPATCH: Dict[str, Any] = {
+    "admin_approve_order": cq_admin_approve_order,
+    "admin_reject_order": cq_admin_reject_order_prompt,
+    "admin_cancel_order": cq_admin_cancel_order_prompt,
+    "admin_change_order_status": cq_admin_change_status_prompt,
+}
+
+
+@router.callback_query(StateFilter(AdminOrderManagementStates.VIEWING_ORDER_DETAILS), F.data)
+async def cq_admin_order_action_dispatch(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
+    handler = _ORDER_ACTION_DISPATCH.get(callback.data.split(":", 1)[0])
+    if handler is None:
+        raise SkipHandler()  # Not an order action (e.g. back to the list); let other handlers try
+    return await handler(callback, user_data, state)
+
+@router.callback_query(StateFilter(AdminOrderManagementStates.SELECTING_NEW_STATUS), OrderCD.filter(F.action == "set_status"))
+async def cq_admin_set_new_status(callback: types.CallbackQuery, callback_data: OrderCD, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service): 
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
         
-    parts = callback.data.split(":")
-    order_id = int(parts[1])
-    new_status_value = parts[2]
-    state_data = await state.get_data()
-    current_filter = state_data.get("current_order_filter_for_back", "all")
-    user_id_filter = state_data.get("current_order_list_user_id_for_back")
+    order_id, new_status_value = callback_data.id, callback_data.status
 
-
-    order_service = OrderService()
-    success, msg_key_or_error = await order_service.change_order_status_by_admin(
+    success, msg_key_or_error = await _ORDER_SERVICE.change_order_status_by_admin(
         order_id, new_status_value, callback.from_user.id, 
         notes=None, 
         language=lang
@@ -1291,147 +1588,165 @@ async def cq_admin_set_new_status(callback: types.CallbackQuery, user_data: Dict
     alert_text = get_text(msg_key_or_error, lang) if success else msg_key_or_error
     if success: alert_text = alert_text.format(id=order_id, new_status=get_text(f"order_status_{new_status_value}", lang))
 
-    await callback.answer(alert_text, show_alert=True)
-    await _send_paginated_orders_list(callback, state, user_data, status_filter=current_filter, page=0, filter_user_id=user_id_filter)
+    await _show_orders_list_after_action(callback, state, lang, alert_text, order_id)
+
+
+# --- Static menu screens ---
+# Screen name -> (title text key, fallback title for keys missing from the locales, keyboard factory taking the language)
+_MENU_SCREEN_BUILDERS = {
+    "admin_panel": ("admin_panel_title", None, create_admin_keyboard),
+    "orders": ("admin_orders_title", None, create_admin_order_list_filters_keyboard),
+    "users": ("admin_user_management_title", None, create_admin_user_management_menu_keyboard),
+    "products": ("admin_product_management_title", None, create_admin_product_management_menu_keyboard),
+    "stock": ("admin_stock_management_title", "Stock Management", create_admin_stock_management_menu_keyboard),
+    "manufacturers": ("admin_manufacturer_management_title", "Manufacturer Management", create_admin_manufacturer_management_menu_keyboard),
+    "categories": ("admin_category_management_title", "Category Management", create_admin_category_management_menu_keyboard),
+    "locations": ("admin_location_management_title", "Location Management", create_admin_location_management_menu_keyboard),
+    "settings": ("admin_settings_title", None, lambda lang: _admin_back_markup(lang, "admin_panel_main", "back_to_admin_main_menu")),
+    "statistics": ("admin_statistics_title", None, lambda lang: _admin_back_markup(lang, "admin_panel_main", "back_to_admin_main_menu")),
+}
+
+
+@lru_cache(maxsize=64)
+def _menu_screen(screen: str, lang: str) -> Tuple[str, InlineKeyboardMarkup]:
+    """(text, keyboard) of a static menu screen; identical for every admin, so built once per language."""
+    title_key, default_title, build_keyboard = _MENU_SCREEN_BUILDERS[screen]
+    return get_text(title_key, lang, default=default_title), build_keyboard(lang)
+
+
+# Build every menu screen (and the settings text) for every shipped language at import, so no admin pays for the first render
+for _lang in LANGUAGE_NAMES:
+    for _screen in _MENU_SCREEN_BUILDERS:
+        _menu_screen(_screen, _lang)
+    _settings_menu_text(_lang)
 
 
 # --- Universal Cancel for Admin FSM Actions ---
-@router.message(Command("cancel"), StateFilter(AdminOrderManagementStates, AdminProductStates, AdminUserManagementStates, AdminSettingsStates, AdminStatisticsStates))
+# Each _cancel_* function handles one StatesGroup. It returns the (text, markup) screen to show,
+# or None if it already navigated somewhere itself (e.g. back to a details view).
+_CancelScreen = Optional[Tuple[str, InlineKeyboardMarkup]]
+
+# Product sub-flows, as full state names ("AdminProductStates:LOCATION_..."), for O(1) membership checks
+_LOCATION_STATE_NAMES: FrozenSet[str] = frozenset(
+    name for name in AdminProductStates.__state_names__ if name.startswith("AdminProductStates:LOCATION_")
+)
+_MANUFACTURER_STATE_NAMES: FrozenSet[str] = frozenset(
+    name for name in AdminProductStates.__state_names__ if name.startswith("AdminProductStates:MANUFACTURER_")
+)
+# Location states that aren't tied to one location (global add flow and list views)
+_LOCATION_GLOBAL_STATE_NAMES: FrozenSet[str] = frozenset(state.state for state in (
+    AdminProductStates.LOCATION_AWAIT_NAME, # This is for global add, not specific edit
+    AdminProductStates.LOCATION_AWAIT_ADDRESS, # Global add
+    AdminProductStates.LOCATION_SELECT_FOR_EDIT, # This is the list view
+    AdminProductStates.LOCATION_SELECT_FOR_DELETE # Also list view (if used)
+))
+
+
+async def _cancel_orders(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any], current_fsm_state_obj: str, state_data: Dict[str, Any]) -> _CancelScreen:
+    lang = user_data.get("language", "en")
+    # If cancelling from order details or sub-flow, try to go back to relevant order list
+    order_id_context = state_data.get("oid") or state_data.get("opid")
+    if order_id_context and current_fsm_state_obj not in [AdminOrderManagementStates.CHOOSING_ORDER_ACTION, AdminOrderManagementStates.VIEWING_ORDERS_LIST]:
+        # If we have an order_id, go back to its details view
+        view, _ = await _build_order_details_view(lang, state, order_id_context)
+        if view:
+            await _reply_or_edit(event, *view)
+            return None
+    # Go to order filters menu
+    return _menu_screen("orders", lang)
+
+
+async def _cancel_users(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any], current_fsm_state_obj: str, state_data: Dict[str, Any]) -> _CancelScreen:
+    lang = user_data.get("language", "en")
+    user_id_context = state_data.get("vuid") or state_data.get("buid") or state_data.get("ubuid")
+    if user_id_context and current_fsm_state_obj not in [AdminUserManagementStates.VIEWING_USER_LIST]:
+        # Go back to user details view
+        view = await _build_user_details_view(lang, state, user_id_context)
+        if view:
+            await _reply_or_edit(event, *view)
+            return None
+    # Go to user management main menu (filter selection)
+    return _menu_screen("users", lang)
+
+
+async def _cancel_products(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any], current_fsm_state_obj: str, state_data: Dict[str, Any]) -> _CancelScreen:
+    lang = user_data.get("language", "en")
+    # Check if it's a location-specific state
+    if current_fsm_state_obj in _LOCATION_STATE_NAMES:
+        location_id_context = state_data.get("current_location_id")
+        # If in a sub-flow of a specific location (e.g. editing name/address, confirm delete)
+        if location_id_context and current_fsm_state_obj not in _LOCATION_GLOBAL_STATE_NAMES:
+            view = await _build_location_actions_view(location_id_context, lang, state)
+            if view:
+                await state.set_state(AdminProductStates.LOCATION_SELECT_FOR_EDIT)
+                await _reply_or_edit(event, *view)
+                return None
+        # Global location states (add name/address, list view) -> go to location menu
+        return _menu_screen("locations", lang)
+    if current_fsm_state_obj == AdminProductStates.MANUFACTURER_AWAIT_EDIT_NAME.state:
+        # Renaming a manufacturer -> back to the edit list, on the page it was picked from
+        await state.clear() # The list sets its own state when it has entries
+        await _send_paginated_manufacturers_for_edit(
+            event, state, user_data, page=state_data.get("current_manufacturer_edit_page", 0)
+        )
+        return None
+    if current_fsm_state_obj in _MANUFACTURER_STATE_NAMES: # Example for manufacturer
+        # Similar logic for manufacturer if needed, e.g., go to manufacturer menu
+        return _menu_screen("manufacturers", lang)
+    # Default for other product states (product creation, category, ...): product management menu
+    return _menu_screen("products", lang)
+
+
+async def _cancel_settings(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any], current_fsm_state_obj: str, state_data: Dict[str, Any]) -> _CancelScreen:
+    lang = user_data.get("language", "en")
+    return _menu_screen("settings", lang)
+
+
+async def _cancel_statistics(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any], current_fsm_state_obj: str, state_data: Dict[str, Any]) -> _CancelScreen:
+    lang = user_data.get("language", "en")
+    return _menu_screen("statistics", lang)
+
+
+# StatesGroup name (the part of the state string before ":") -> cancel handler
+_CANCEL_DISPATCH = {
+    "AdminOrderManagementStates": _cancel_orders,
+    "AdminUserManagementStates": _cancel_users,
+    "AdminProductStates": _cancel_products,
+    "AdminSettingsStates": _cancel_settings,
+    "AdminStatisticsStates": _cancel_statistics,
+}
+
+
+# Registered ahead of the FSM text handlers below, so "/cancel" in any case never reaches them
+@router.message(Command("cancel", ignore_case=True), StateFilter(AdminOrderManagementStates, AdminProductStates, AdminUserManagementStates, AdminSettingsStates, AdminStatisticsStates))
 @router.callback_query(F.data == "cancel_admin_action", StateFilter(AdminOrderManagementStates, AdminProductStates, AdminUserManagementStates, AdminSettingsStates, AdminStatisticsStates))
 async def universal_cancel_admin_action(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService() 
-    if not await is_admin_user_check(event.from_user.id, user_service): 
-        # This case should ideally be caught by middleware or earlier checks
-        return await event.answer(get_text("admin_access_denied", lang)) if isinstance(event, types.Message) else await event.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     current_fsm_state_obj = await state.get_state()
-    logger.info(f"Admin {event.from_user.id} cancelling action from state {current_fsm_state_obj}")
+    logger.info("Admin %s cancelling action from state %s", event.from_user.id, current_fsm_state_obj)
     
     cancel_message_text = get_text("admin_action_cancelled", lang)
-    response_target = event.message if isinstance(event, types.CallbackQuery) else event
     
-    # Acknowledge cancellation
-    if isinstance(event, types.CallbackQuery):
-        await event.answer(cancel_message_text, show_alert=False)
-    else:
-        await response_target.answer(cancel_message_text)
-
-    # Logic to determine where to go back
-    state_data = await state.get_data() # Get FSM data before clearing
+    # Acknowledge cancellation (a toast for callbacks, a reply for /cancel)
+    await event.answer(cancel_message_text)
 
     # Default navigation target
-    target_message_text = get_text("admin_panel_title", lang)
-    target_reply_markup = create_admin_keyboard(lang)
-
-    if current_fsm_state_obj:
-        if current_fsm_state_obj.startswith("AdminOrderManagementStates:"):
-            # If cancelling from order details or sub-flow, try to go back to relevant order list
-            order_id_context = state_data.get("current_order_id") or state_data.get("order_to_process_id")
-            if order_id_context and current_fsm_state_obj not in [AdminOrderManagementStates.CHOOSING_ORDER_ACTION, AdminOrderManagementStates.VIEWING_ORDERS_LIST]:
-                # If we have an order_id, go back to its details view
-                await state.set_state(AdminOrderManagementStates.VIEWING_ORDER_DETAILS) # Set for details handler
-                # Re-invoke view order details
-                mock_cb_data = f"admin_order_details:{order_id_context}"
-                await cq_admin_view_order_details(
-                    types.CallbackQuery(id=str(event.id), from_user=event.from_user, chat_instance=event.chat.id if hasattr(event, 'chat') else event.message.chat.id, message=response_target, data=mock_cb_data),
-                    user_data, state
-                )
-                return 
-            else: # Go to order filters menu
-                target_message_text = get_text("admin_orders_title", lang)
-                target_reply_markup = create_admin_order_list_filters_keyboard(lang)
-
-        elif current_fsm_state_obj.startswith("AdminUserManagementStates:"):
-            user_id_context = state_data.get("viewing_user_id") or state_data.get("user_to_block_id") or state_data.get("user_to_unblock_id")
-            if user_id_context and current_fsm_state_obj not in [AdminUserManagementStates.VIEWING_USER_LIST]:
-                 # Go back to user details view
-                await state.set_state(AdminUserManagementStates.VIEWING_USER_DETAILS)
-                mock_cb_data = f"admin_user_details:{user_id_context}"
-                await cq_admin_view_user_details(
-                     types.CallbackQuery(id=str(event.id), from_user=event.from_user, chat_instance=event.chat.id if hasattr(event, 'chat') else event.message.chat.id, message=response_target, data=mock_cb_data),
-                     user_data, state
-                )
-                return
-            else: # Go to user management main menu (filter selection)
-                target_message_text = get_text("admin_user_management_title", lang)
-                target_reply_markup = create_admin_user_management_menu_keyboard(lang)
-        
-        elif current_fsm_state_obj.startswith("AdminProductStates:"):
-            # Check if it's a location-specific state
-            if "LOCATION_" in current_fsm_state_obj:
-                location_id_context = state_data.get("current_location_id")
-                # If in a sub-flow of a specific location (e.g. editing name/address, confirm delete)
-                if location_id_context and current_fsm_state_obj not in [
-                    AdminProductStates.LOCATION_AWAIT_NAME, # This is for global add, not specific edit
-                    AdminProductStates.LOCATION_AWAIT_ADDRESS, # Global add
-                    AdminProductStates.LOCATION_SELECT_FOR_EDIT, # This is the list view
-                    AdminProductStates.LOCATION_SELECT_FOR_DELETE # Also list view (if used)
-                ]:
-                    await state.set_state(AdminProductStates.LOCATION_SELECT_FOR_EDIT)
-                    temp_message_for_edit = await response_target.answer(get_text("loading_text", lang, default="."), reply_markup=types.ReplyKeyboardRemove()) if not isinstance(event, types.CallbackQuery) else event.message
-                    
-                    mock_cb_data = f"admin_location_actions:{location_id_context}"
-                    await cq_admin_location_actions(
-                        types.CallbackQuery(
-                            id=str(event.id) + "_cancel_to_loc_actions", 
-                            from_user=event.from_user, 
-                            chat_instance=event.chat.id if hasattr(event, 'chat') else event.message.chat.id, 
-                            message=temp_message_for_edit, # Use the message that can be edited
-                            data=mock_cb_data
-                        ),
-                        user_data, state
-                    )
-                    return
-                else: # Global location states (add name/address, list view) -> go to location menu
-                    target_message_text = get_text("admin_location_management_title", lang)
-                    target_reply_markup = create_admin_location_management_menu_keyboard(lang)
-            elif "MANUFACTURER_" in current_fsm_state_obj: # Example for manufacturer
-                # Similar logic for manufacturer if needed, e.g., go to manufacturer menu
-                target_message_text = get_text("admin_manufacturer_management_title", lang) # Assuming this key exists
-                target_reply_markup = create_admin_manufacturer_management_menu_keyboard(lang)
-            else: # Default for other product states (e.g. product, category)
-                 # The new if block goes here
-                 if current_fsm_state_obj in [
-                     AdminProductStates.PRODUCT_AWAIT_MANUFACTURER_ID,
-                     AdminProductStates.PRODUCT_AWAIT_CATEGORY_ID,
-                     AdminProductStates.PRODUCT_AWAIT_PRICE, # Changed from PRODUCT_AWAIT_COST
-                     AdminProductStates.PRODUCT_AWAIT_SKU,
-                     AdminProductStates.PRODUCT_AWAIT_VARIATION,
-                     AdminProductStates.PRODUCT_AWAIT_IMAGE_URL,
-                     AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_LANG_CODE,
-                     AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_NAME,
-                     AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_DESCRIPTION,
-                     AdminProductStates.PRODUCT_CONFIRM_ADD
-                 ]:
-                     # If cancelling during product creation, go to product management menu
-                     target_message_text = get_text("admin_product_management_title", lang)
-                     target_reply_markup = create_admin_product_management_menu_keyboard(lang)
-                 elif current_fsm_state_obj.startswith("AdminProductStates:"): # Catch-all for other product states
-                     # Default for other product states (e.g. product, category, manufacturer)
-                     # Navigate to product management menu
-                     target_message_text = get_text("admin_product_management_title", lang)
-                     target_reply_markup = create_admin_product_management_menu_keyboard(lang)
-
-
-        elif current_fsm_state_obj.startswith("AdminSettingsStates:"):
-             target_message_text = get_text("admin_settings_title", lang)
-             target_reply_markup = InlineKeyboardBuilder().row(create_back_button("back_to_admin_main_menu", lang, "admin_panel_main")).as_markup() # Simple back for now
-        
-        elif current_fsm_state_obj.startswith("AdminStatisticsStates:"):
-             target_message_text = get_text("admin_statistics_title", lang)
-             target_reply_markup = InlineKeyboardBuilder().row(create_back_button("back_to_admin_main_menu", lang, "admin_panel_main")).as_markup() # Simple back for now
+    target_message_text, target_reply_markup = _menu_screen("admin_panel", lang)
+
+    group, _, _ = (current_fsm_state_obj or "").partition(":")
+    cancel_handler = _CANCEL_DISPATCH.get(group)
+    if cancel_handler:
+        state_data = await state.get_data() # Get FSM data before clearing
+        screen = await cancel_handler(event, state, user_data, current_fsm_state_obj, state_data)
+        if screen is None:
+            return # The handler already navigated back to a details view
+        target_message_text, target_reply_markup = screen
 
     await state.clear() # Clear state *after* deciding where to go
 
     # Edit message or send new one
-    if hasattr(response_target, "edit_text") and isinstance(event, types.CallbackQuery):
-        try:
-            await response_target.edit_text(target_message_text, reply_markup=target_reply_markup, parse_mode="HTML")
-        except Exception: 
-            await response_target.answer(target_message_text, reply_markup=target_reply_markup, parse_mode="HTML")
-    else: 
-        await response_target.answer(target_message_text, reply_markup=target_reply_markup, parse_mode="HTML")
+    await _reply_or_edit(event, target_message_text, target_reply_markup)
 
 
 # Note: Product/Category/Manufacturer/Location/Stock management handlers are largely placeholders
@@ -1444,9 +1759,6 @@ async def universal_cancel_admin_action(event: Union[types.Message, types.Callba
 @router.callback_query(F.data == "admin_mfg_add_start", StateFilter("*"))
 async def cq_admin_mfg_add_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     await state.set_state(AdminProductStates.MANUFACTURER_AWAIT_NAME)
     
@@ -1455,29 +1767,17 @@ async def cq_admin_mfg_add_start(callback: types.CallbackQuery, state: FSMContex
     
     full_prompt = f"{prompt_text}\n\n{hitalic(cancel_info)}"
     
-    try:
-        await callback.message.edit_text(full_prompt, parse_mode="HTML", reply_markup=None) # Remove previous keyboard
-    except Exception as e:
-        logger.info(f"Editing message for admin_mfg_add_start failed, sending new: {e}")
-        # Send as a new message if edit fails, ensuring ReplyKeyboardRemove to clear any prior reply keyboards
-        await callback.message.answer(full_prompt, parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-        
-    await callback.answer()
+    await _show_prompt(callback, full_prompt)
 
 @router.message(StateFilter(AdminProductStates.MANUFACTURER_AWAIT_NAME), F.text)
 async def fsm_admin_manufacturer_name_received(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
         await message.answer(get_text("admin_action_cancelled", lang), reply_markup=types.ReplyKeyboardRemove())
         await state.clear()
         # Directly send manufacturer menu
-        keyboard = create_admin_manufacturer_management_menu_keyboard(lang)
-        title_text = get_text("admin_manufacturer_management_title", lang, default="Manufacturer Management")
+        title_text, keyboard = _menu_screen("manufacturers", lang)
         await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
         return
 
@@ -1491,8 +1791,7 @@ async def fsm_admin_manufacturer_name_received(message: types.Message, state: FS
         await message.answer(full_reprompt, parse_mode="HTML")
         return
 
-    product_service = ProductService()
-    created_manufacturer, message_key, _ = await product_service.create_manufacturer(name=sanitized_name, lang=lang)
+    created_manufacturer, message_key, _ = await _PRODUCT_SERVICE.create_manufacturer(name=sanitized_name, lang=lang)
 
     if created_manufacturer:
         success_msg = get_text(message_key, lang, name=hcode(created_manufacturer['name']))
@@ -1506,11 +1805,31 @@ async def fsm_admin_manufacturer_name_received(message: types.Message, state: FS
     await state.clear()
     
     # Directly send manufacturer menu
-    keyboard = create_admin_manufacturer_management_menu_keyboard(lang)
-    title_text = get_text("admin_manufacturer_management_title", lang, default="Manufacturer Management")
+    title_text, keyboard = _menu_screen("manufacturers", lang)
     await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
 
 
+# Last manufacturer delete page shown to each admin: admin_id -> (page, items, total).
+# Lets a successful delete patch the list locally instead of querying the page again.
+_MANUFACTURER_DELETE_PAGES: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+def _manufacturers_for_delete_keyboard(lang: str, items: List[Dict[str, Any]], page: int, total: int) -> InlineKeyboardMarkup:
+    return create_paginated_keyboard(
+        items=items,
+        page=page,
+        items_per_page=ITEMS_PER_PAGE_ADMIN,
+        base_callback_data=lambda page_num: ManufacturerCD(action="delete_page", page=page_num).pack(),
+        item_callback_prefix=lambda manufacturer_id: ManufacturerCD(action="confirm_delete", id=manufacturer_id).pack(),
+        language=lang,
+        back_callback_key="back_to_manufacturer_menu",
+        back_callback_data="admin_manufacturers_menu",
+        total_items_override=total,
+        item_text_key="name",
+        item_id_key="id"
+    )
+
+
 async def _send_paginated_manufacturers_for_delete(
     event: Union[types.Message, types.CallbackQuery], 
     state: FSMContext, 
@@ -1518,82 +1837,47 @@ async def _send_paginated_manufacturers_for_delete(
     page: int = 0
 ):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
 
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
-
-    manufacturers_on_page_data, total_manufacturers = await product_service.get_all_entities_paginated(
+    manufacturers_on_page_data, total_manufacturers = await _PRODUCT_SERVICE.get_all_entities_paginated(
         entity_type="manufacturer", 
         page=page, 
         items_per_page=ITEMS_PER_PAGE_ADMIN, 
         language=lang
     )
+    _MANUFACTURER_DELETE_PAGES[event.from_user.id] = (page, manufacturers_on_page_data, total_manufacturers)
 
     title = get_text("admin_select_manufacturer_to_delete_title", lang)
 
     if not manufacturers_on_page_data and page == 0:
         empty_text = title + "\n\n" + get_text("admin_no_manufacturers_to_delete", lang)
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_manufacturer_menu", lang, "admin_manufacturers_menu")).as_markup()
+        kb = _admin_back_markup(lang, "admin_manufacturers_menu", "back_to_manufacturer_menu")
         
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-             await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-             await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery): await event.answer()
+        await set_state_and_data(state, None, {}) # Nothing to select: leave the delete flow
+        await _reply_or_edit(event, empty_text, kb, parse_mode=None, answer_callback=True)
         return
 
-    await state.set_state(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE)
-    await state.update_data(current_manufacturer_delete_page=page)
+    # The current page is the only data this flow keeps, so state and data are replaced in one write
+    await set_state_and_data(state, AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE, {"current_manufacturer_delete_page": page})
 
-    keyboard = create_paginated_keyboard(
-        items=manufacturers_on_page_data,
-        page=page,
-        items_per_page=ITEMS_PER_PAGE_ADMIN,
-        base_callback_data="admin_select_manufacturer_for_delete_page",
-        item_callback_prefix="admin_confirm_delete_manufacturer_prompt",
-        language=lang,
-        back_callback_key="back_to_manufacturer_menu",
-        back_callback_data="admin_manufacturers_menu",
-        total_items_override=total_manufacturers,
-        item_text_key="name",
-        item_id_key="id"
-    )
+    keyboard = _manufacturers_for_delete_keyboard(lang, manufacturers_on_page_data, page, total_manufacturers)
     
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery): await event.answer()
+    await _reply_or_edit(event, title, keyboard, answer_callback=True)
 
 @router.callback_query(F.data == "admin_delete_manufacturer_start", StateFilter("*")) # Accessible from manufacturer menu
 async def cq_admin_select_manufacturer_for_delete(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     await _send_paginated_manufacturers_for_delete(callback, state, user_data, page=0)
 
-@router.callback_query(F.data.startswith("admin_select_manufacturer_for_delete_page:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))
-async def cq_admin_select_manufacturer_for_delete_paginate(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    page = int(callback.data.split(":")[1])
-    await _send_paginated_manufacturers_for_delete(callback, state, user_data, page=page)
+@router.callback_query(ManufacturerCD.filter(F.action == "delete_page"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))
+async def cq_admin_select_manufacturer_for_delete_paginate(callback: types.CallbackQuery, callback_data: ManufacturerCD, state: FSMContext, user_data: Dict[str, Any]):
+    await _send_paginated_manufacturers_for_delete(callback, state, user_data, page=callback_data.page or 0)
 
-@router.callback_query(F.data.startswith("admin_confirm_delete_manufacturer_prompt:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))
-async def cq_admin_confirm_delete_manufacturer_prompt(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
+@router.callback_query(ManufacturerCD.filter(F.action == "confirm_delete"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))
+async def cq_admin_confirm_delete_manufacturer_prompt(callback: types.CallbackQuery, callback_data: ManufacturerCD, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    manufacturer_id = int(callback.data.split(":")[1])
+    manufacturer_id = callback_data.id
     
-    manufacturer_entity = await product_service.get_entity_by_id("manufacturer", manufacturer_id, lang)
+    manufacturer_entity = await _PRODUCT_SERVICE.get_entity_by_id("manufacturer", manufacturer_id, lang)
     if not manufacturer_entity:
         await callback.answer(get_text("admin_manufacturer_not_found", lang), show_alert=True)
         # Go back to the selection list
@@ -1602,40 +1886,41 @@ async def cq_admin_confirm_delete_manufacturer_prompt(callback: types.CallbackQu
 
     manufacturer_name = manufacturer_entity.get("name", str(manufacturer_id))
     
-    await state.set_state(AdminProductStates.MANUFACTURER_CONFIRM_DELETE)
-    await state.update_data(manufacturer_to_delete_id=manufacturer_id, manufacturer_to_delete_name=manufacturer_name)
-
     confirmation_text = get_text("admin_confirm_delete_manufacturer_prompt", lang, name=manufacturer_name)
     keyboard = create_confirmation_keyboard(
         lang,
-        yes_callback=f"admin_execute_delete_manufacturer:{manufacturer_id}",
+        yes_callback=ManufacturerCD(action="execute_delete", id=manufacturer_id).pack(),
         no_callback="admin_delete_manufacturer_start" # Back to list selection start
     )
-    await callback.message.edit_text(confirmation_text, reply_markup=keyboard)
+    # The FSM write and the message edit don't depend on each other, so run them together.
+    # Only the manufacturer being deleted matters from here on, so overwrite rather than merge.
+    await asyncio.gather(
+        set_state_and_data(
+            state,
+            AdminProductStates.MANUFACTURER_CONFIRM_DELETE,
+            {"manufacturer_to_delete_id": manufacturer_id, "manufacturer_to_delete_name": manufacturer_name}
+        ),
+        callback.message.edit_text(confirmation_text, reply_markup=keyboard)
+    )
     await callback.answer()
 
-@router.callback_query(F.data.startswith("admin_execute_delete_manufacturer:"), StateFilter(AdminProductStates.MANUFACTURER_CONFIRM_DELETE))
-async def cq_admin_execute_delete_manufacturer(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
+@router.callback_query(ManufacturerCD.filter(F.action == "execute_delete"), StateFilter(AdminProductStates.MANUFACTURER_CONFIRM_DELETE))
+async def cq_admin_execute_delete_manufacturer(callback: types.CallbackQuery, callback_data: ManufacturerCD, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     manufacturer_id = state_data.get("manufacturer_to_delete_id")
     manufacturer_name = state_data.get("manufacturer_to_delete_name", "N/A") # Fallback name
 
     # Verify callback data matches state data as a safeguard
-    callback_manufacturer_id = int(callback.data.split(":")[1])
+    callback_manufacturer_id = callback_data.id
     if manufacturer_id != callback_manufacturer_id:
-        logger.warning(f"Manufacturer ID mismatch in delete execution. State: {manufacturer_id}, Callback: {callback_manufacturer_id}")
+        logger.warning("Manufacturer ID mismatch in delete execution. State: %s, Callback: %s", manufacturer_id, callback_manufacturer_id)
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
-        await state.clear()
+        # The list refresh replaces the FSM state and data itself, so no separate clear is needed
         return await _send_paginated_manufacturers_for_delete(callback, state, user_data, page=0) # Refresh list
 
-    success, message_key, deleted_name = await product_service.delete_manufacturer_by_id(manufacturer_id, lang)
+    success, message_key, deleted_name = await _PRODUCT_SERVICE.delete_manufacturer_by_id(manufacturer_id, lang)
     
     display_name = deleted_name or manufacturer_name # Use name from service if available, else from state
 
@@ -1649,9 +1934,27 @@ async def cq_admin_execute_delete_manufacturer(callback: types.CallbackQuery, st
         alert_text = get_text(message_key, lang)
 
     await callback.answer(alert_text, show_alert=True)
+    if not success:
+        # Nothing changed: the alert is enough, and the confirmation stays usable
+        return
+
+    # Drop the row from the page we showed; re-query only if that page is now empty
+    cached_page = _MANUFACTURER_DELETE_PAGES.get(callback.from_user.id)
+    if cached_page:
+        page, items, total = cached_page
+        remaining = [item for item in items if item["id"] != manufacturer_id]
+        if remaining:
+            total -= len(items) - len(remaining)
+            _MANUFACTURER_DELETE_PAGES[callback.from_user.id] = (page, remaining, total)
+            await set_state_and_data(state, AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE, {"current_manufacturer_delete_page": page})
+            await _reply_or_edit(
+                callback,
+                get_text("admin_select_manufacturer_to_delete_title", lang),
+                _manufacturers_for_delete_keyboard(lang, remaining, page, total)
+            )
+            return
     
-    await state.clear() # Clear state after operation
-    # Refresh the list of manufacturers to delete
+    # Refresh the list of manufacturers to delete (this also resets the FSM state and data)
     await _send_paginated_manufacturers_for_delete(callback, state, user_data, page=0)
 
 
@@ -1669,16 +1972,8 @@ async def _send_paginated_manufacturers_for_edit(
     base_callback_data_override: Optional[str] = None # For pagination callback base
 ):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
 
-    manufacturers_on_page_data, total_manufacturers = await product_service.get_all_entities_paginated(
+    manufacturers_on_page_data, total_manufacturers = await _PRODUCT_SERVICE.get_all_entities_paginated(
         entity_type="manufacturer",
         page=page,
         items_per_page=ITEMS_PER_PAGE_ADMIN,
@@ -1689,14 +1984,9 @@ async def _send_paginated_manufacturers_for_edit(
 
     if not manufacturers_on_page_data and page == 0:
         empty_text = title + "\n\n" + get_text("admin_no_manufacturers_found", lang) # Using generic "no manufacturers found"
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_manufacturer_menu", lang, "admin_manufacturers_menu")).as_markup()
+        kb = _admin_back_markup(lang, "admin_manufacturers_menu", "back_to_manufacturer_menu")
         
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-             await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-             await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery): await event.answer()
+        await _reply_or_edit(event, empty_text, kb, parse_mode=None, answer_callback=True)
         return
 
     await state.set_state(AdminProductStates.MANUFACTURER_SELECT_FOR_EDIT)
@@ -1716,30 +2006,16 @@ async def _send_paginated_manufacturers_for_edit(
         item_id_key="id"
     )
     
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery): await event.answer()
+    await _reply_or_edit(event, title, keyboard, answer_callback=True)
 
 @router.callback_query(F.data == "admin_edit_manufacturer_start", StateFilter("*"))
 async def cq_admin_edit_manufacturer_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     await _send_paginated_manufacturers_for_edit(callback, state, user_data, page=0)
 
 @router.callback_query(F.data.startswith("admin_select_manufacturer_for_edit_page:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_EDIT))
 async def cq_admin_select_manufacturer_for_edit_paginate(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     try:
-        page = int(callback.data.split(":")[1])
+        page = int(callback.data.removeprefix("admin_select_manufacturer_for_edit_page:"))
     except (IndexError, ValueError):
         page = 0 # Default to page 0 if malformed
     await _send_paginated_manufacturers_for_edit(callback, state, user_data, page=page)
@@ -1747,19 +2023,14 @@ async def cq_admin_select_manufacturer_for_edit_paginate(callback: types.Callbac
 @router.callback_query(F.data.startswith("admin_edit_manufacturer_prompt:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_EDIT))
 async def cq_admin_edit_manufacturer_prompt_name(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        manufacturer_id = int(callback.data.split(":")[1])
+        manufacturer_id = int(callback.data.removeprefix("admin_edit_manufacturer_prompt:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         return # Or redirect to list
 
-    manufacturer_entity = await product_service.get_entity_by_id("manufacturer", manufacturer_id, lang)
+    manufacturer_entity = await _PRODUCT_SERVICE.get_entity_by_id("manufacturer", manufacturer_id, lang)
     if not manufacturer_entity:
         await callback.answer(get_text("admin_manufacturer_not_found", lang), show_alert=True)
         current_page = (await state.get_data()).get("current_manufacturer_edit_page", 0)
@@ -1772,45 +2043,13 @@ async def cq_admin_edit_manufacturer_prompt_name(callback: types.CallbackQuery,
 
     prompt_text = get_text("admin_enter_new_manufacturer_name_prompt", lang, current_name=hcode(current_name))
     cancel_info = get_text("cancel_prompt", lang)
-    
-    # Provide a back button to go back to the selection list
-    # Back button to go back to the selection list, preserving the page
-    current_page = (await state.get_data()).get("current_manufacturer_edit_page", 0)
-    back_button_cb = f"admin_select_manufacturer_for_edit_page:{current_page}"
-    if callback.data == "admin_edit_manufacturer_start": # If came from menu directly, no page, go to page 0
-        back_button_cb = "admin_edit_manufacturer_start"
 
-
-    builder = InlineKeyboardBuilder()
-    # builder.row(create_back_button("back_to_manufacturer_selection", lang, back_button_cb)) # TODO: This back button might be tricky with message edits. For now, rely on /cancel.
-    
-    await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", reply_markup=builder.as_markup(), parse_mode="HTML")
-    await callback.answer()
+    # /cancel returns to the edit list on the current page (see _cancel_products)
+    await _safe_edit(callback, f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
 
 @router.message(StateFilter(AdminProductStates.MANUFACTURER_AWAIT_EDIT_NAME), F.text)
 async def fsm_admin_manufacturer_new_name_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
-
-    if message.text.lower() == "/cancel":
-        # Before calling universal cancel, determine the correct "back" navigation
-        # Send them back to the manufacturer edit selection list
-        await message.answer(get_text("admin_action_cancelled", lang)) # Acknowledge cancel first
-        state_data = await state.get_data()
-        current_page = state_data.get("current_manufacturer_edit_page", 0)
-        # We need a CallbackQuery-like object or to call the list function directly with a message
-        # For simplicity, create a mock message event and call the list function.
-        # This is a bit of a workaround because universal_cancel might not be ideal here.
-        await state.clear() # Clear state first
-         # Create a temporary message to be edited by the paginated list function
-        temp_msg_for_list = await message.answer(get_text("loading_text", lang))
-        mock_event_for_list = temp_msg_for_list # It can take a message directly
-        return await _send_paginated_manufacturers_for_edit(mock_event_for_list, state, user_data, page=current_page)
-
 
     state_data = await state.get_data()
     manufacturer_id = state_data.get("editing_manufacturer_id")
@@ -1842,7 +2081,7 @@ async def fsm_admin_manufacturer_new_name_received(message: types.Message, user_
         # For now, we will proceed to send them back to the list after this message.
         # Fall through to sending back to list.
 
-    success, msg_key, updated_details = await product_service.update_manufacturer_details(manufacturer_id, new_name, lang)
+    success, msg_key, updated_details = await _PRODUCT_SERVICE.update_manufacturer_details(manufacturer_id, new_name, lang)
 
     if success and updated_details:
         await message.answer(get_text(msg_key, lang, name=hcode(updated_details['name'])))
@@ -1860,17 +2099,17 @@ async def fsm_admin_manufacturer_new_name_received(message: types.Message, user_
 
 # --- Handler Registration (Illustrative - Actual registration in main bot file) ---
 # router.callback_query(F.data == "admin_delete_manufacturer_start", StateFilter("*"))(cq_admin_select_manufacturer_for_delete)
-# router.callback_query(F.data.startswith("admin_select_manufacturer_for_delete_page:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))(cq_admin_select_manufacturer_for_delete_paginate)
-# router.callback_query(F.data.startswith("admin_confirm_delete_manufacturer_prompt:"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))(cq_admin_confirm_delete_manufacturer_prompt)
-# router.callback_query(F.data.startswith("admin_execute_delete_manufacturer:"), StateFilter(AdminProductStates.MANUFACTURER_CONFIRM_DELETE))(cq_admin_execute_delete_manufacturer)
+# router.callback_query(ManufacturerCD.filter(F.action == "delete_page"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))(cq_admin_select_manufacturer_for_delete_paginate)
+# router.callback_query(ManufacturerCD.filter(F.action == "confirm_delete"), StateFilter(AdminProductStates.MANUFACTURER_SELECT_FOR_DELETE))(cq_admin_confirm_delete_manufacturer_prompt)
+# router.callback_query(ManufacturerCD.filter(F.action == "execute_delete"), StateFilter(AdminProductStates.MANUFACTURER_CONFIRM_DELETE))(cq_admin_execute_delete_manufacturer)
 
 # --- Location Handler Registration (Illustrative) ---
-# router.callback_query(F.data == "admin_locations_menu", StateFilter("*"))(cq_admin_locations_menu)
+# router.callback_query(F.data == "admin_locations_menu", StateFilter("*"))(cq_admin_section_menu)
 # router.callback_query(F.data == "admin_add_location_start", StateFilter("*"))(cq_admin_add_location_start)
 # router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_NAME), F.text)(fsm_admin_location_name_received)
 # router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_ADDRESS), F.text)(fsm_admin_location_address_received)
-# router.callback_query(F.data.startswith("admin_list_locations_start") | F.data.startswith("admin_locations_list_page:"))(cq_admin_list_locations_start)
-# router.callback_query(F.data.startswith("admin_location_actions:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))(cq_admin_location_actions) # type: ignore
+# router.callback_query(LocationCD.filter(F.action == "list_page"))(cq_admin_list_locations_start)
+# router.callback_query(LocationCD.filter(F.action == "actions"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))(cq_admin_location_actions) # type: ignore
 # router.callback_query(F.data.startswith("admin_edit_location_start:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))(cq_admin_edit_location_start) # type: ignore
 # router.callback_query(F.data.startswith("admin_edit_location_field:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))(cq_admin_edit_location_field_prompt) # type: ignore
 # router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_EDIT_NAME, AdminProductStates.LOCATION_AWAIT_EDIT_ADDRESS), F.text)(fsm_admin_location_edit_value_received) # type: ignore
@@ -1880,68 +2119,37 @@ async def fsm_admin_manufacturer_new_name_received(message: types.Message, user_
 
 # --- Location Management Handlers ---
 
-@router.callback_query(F.data == "admin_locations_menu", StateFilter("*"))
-async def cq_admin_locations_menu(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext): # type: ignore
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-
-    await state.clear() # Clear state when entering the menu
-    # Assuming create_admin_location_management_menu_keyboard will be defined in app.keyboards.inline
-    from app.keyboards.inline import create_admin_location_management_menu_keyboard
-    keyboard = create_admin_location_management_menu_keyboard(lang)
-    await callback.message.edit_text(get_text("admin_location_management_title", lang), reply_markup=keyboard)
-    await callback.answer()
-
 @router.callback_query(F.data == "admin_add_location_start", StateFilter("*"))
 async def cq_admin_add_location_start(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext): # type: ignore
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     await state.set_state(AdminProductStates.LOCATION_AWAIT_NAME)
-    prompt_text = get_text("admin_enter_location_name_prompt", lang)
-    cancel_info = get_text("cancel_prompt", lang)
-    await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
-    await callback.answer()
+    await _safe_edit(callback, _prompt_with_cancel("admin_enter_location_name_prompt", lang), parse_mode="HTML")
 
 @router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_NAME), F.text)
 async def fsm_admin_location_name_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
-
-    if message.text.lower() == "/cancel":
-        return await universal_cancel_admin_action(message, state, user_data)
 
-    name = sanitize_input(message.text)
+    # A pasted "name<newline>address" message completes the flow in one step
+    name_line, _, address_text = message.text.strip().partition("\n")
+    name = sanitize_input(name_line)
     if not name:
         await message.answer(get_text("admin_location_name_empty_error", lang))
         # Re-prompt
-        prompt_text = get_text("admin_enter_location_name_prompt", lang)
-        cancel_info = get_text("cancel_prompt", lang)
-        await message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
+        await message.answer(_prompt_with_cancel("admin_enter_location_name_prompt", lang), parse_mode="HTML")
         return
 
-    await state.update_data(location_name=name)
-    await state.set_state(AdminProductStates.LOCATION_AWAIT_ADDRESS)
-    prompt_text = get_text("admin_enter_location_address_prompt", lang)
-    cancel_info = get_text("cancel_prompt", lang)
-    await message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
+    address = sanitize_input(address_text)
+    if address:
+        return await _create_location_and_show_menu(message, state, lang, name, None if address == "-" else address)
+
+    # Nothing else is carried through the add flow
+    await set_state_and_data(state, AdminProductStates.LOCATION_AWAIT_ADDRESS, {"location_name": name})
+    await message.answer(_prompt_with_cancel("admin_enter_location_address_prompt", lang), parse_mode="HTML")
 
 @router.message(StateFilter(AdminProductStates.LOCATION_AWAIT_ADDRESS), F.text)
 async def fsm_admin_location_address_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
-
-    if message.text.lower() == "/cancel":
-        return await universal_cancel_admin_action(message, state, user_data)
 
     address = sanitize_input(message.text)
     if address == "-": # Treat '-' as skip/None for address
@@ -1954,24 +2162,32 @@ async def fsm_admin_location_address_received(message: types.Message, user_data:
         await message.answer(get_text("admin_action_failed_no_context", lang))
         await state.clear()
         # Navigate back to main admin panel or location menu
-        from app.keyboards.inline import create_admin_location_management_menu_keyboard
-        keyboard = create_admin_location_management_menu_keyboard(lang)
-        await message.answer(get_text("admin_location_management_title", lang), reply_markup=keyboard)
+        await message.answer(*_menu_screen("locations", lang))
         return
 
-    location_dict, error_message_key = await location_service.create_location(name, address, lang)
+    await _create_location_and_show_menu(message, state, lang, name, address)
+
+
+async def _create_location_and_show_menu(
+    message: types.Message,
+    state: FSMContext,
+    lang: str,
+    name: str,
+    address: Optional[str]
+):
+    """Create the location, report the outcome, end the add flow and send the locations menu."""
+    location_dict, error_message_key = await _LOCATION_SERVICE.create_location(name, address, lang)
 
     if location_dict:
         await message.answer(get_text("admin_location_created_successfully", lang, name=location_dict['name']))
     else:
         await message.answer(get_text(error_message_key or "admin_location_create_failed_error", lang, name=name))
     
-    await state.clear()
+    await set_state_and_data(state, None, {}) # Same as state.clear(), in one round trip
     # Send locations menu again
-    from app.keyboards.inline import create_admin_location_management_menu_keyboard
-    keyboard = create_admin_location_management_menu_keyboard(lang)
     # This message will be a new message, not an edit of a callback query message
-    await message.answer(get_text("admin_location_management_title", lang), reply_markup=keyboard)
+    title_text, keyboard = _menu_screen("locations", lang)
+    await message.answer(title_text, reply_markup=keyboard)
 
 
 async def _send_paginated_locations_list(
@@ -1981,16 +2197,8 @@ async def _send_paginated_locations_list(
     page: int = 0
 ):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
-
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
 
-    formatted_locations, total_count = await location_service.get_all_locations_paginated(
+    formatted_locations, total_count = await _LOCATION_SERVICE.get_all_locations_paginated(
         page, ITEMS_PER_PAGE_ADMIN, lang
     )
 
@@ -1999,14 +2207,9 @@ async def _send_paginated_locations_list(
     if not formatted_locations and page == 0:
         empty_text = title + "\n\n" + get_text("admin_no_locations_found", lang)
         # Assuming create_admin_location_management_menu_keyboard exists for back button
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_location_menu", lang, "admin_locations_menu")).as_markup()
+        kb = _admin_back_markup(lang, "admin_locations_menu", "back_to_location_menu")
         
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-            await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-            await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery): await event.answer()
+        await _reply_or_edit(event, empty_text, kb, parse_mode=None, answer_callback=True)
         return
 
     await state.set_state(AdminProductStates.LOCATION_SELECT_FOR_EDIT) 
@@ -2016,8 +2219,8 @@ async def _send_paginated_locations_list(
         items=formatted_locations,
         page=page,
         items_per_page=ITEMS_PER_PAGE_ADMIN,
-        base_callback_data="admin_locations_list_page", 
-        item_callback_prefix="admin_location_actions",
+        base_callback_data=lambda page_num: LocationCD(action="list_page", page=page_num).pack(),
+        item_callback_prefix=lambda location_id: LocationCD(action="actions", id=location_id, page=page).pack(),
         language=lang,
         back_callback_key="back_to_location_menu", # Text key for the back button
         back_callback_data="admin_locations_menu", # Callback data for back button
@@ -2026,98 +2229,114 @@ async def _send_paginated_locations_list(
         item_id_key="id" # Key from formatted_locations dict for item ID in callback
     )
     
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery): await event.answer()
+    await _reply_or_edit(event, title, keyboard, answer_callback=True)
 
 
-@router.callback_query(F.data.startswith("admin_list_locations_start") | F.data.startswith("admin_locations_list_page:"))
-async def cq_admin_list_locations_start(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
-    page = 0
-    # Callback data can be "admin_list_locations_start" or "admin_locations_list_page:PAGENUM"
-    if callback.data.startswith("admin_locations_list_page:"):
-        try:
-            page = int(callback.data.split(":")[1])
-        except (IndexError, ValueError): # Handle cases like "admin_locations_list_page:" without number
-            page = 0 
-    await _send_paginated_locations_list(callback, state, user_data, page=page)
-
-
-@router.callback_query(F.data.startswith("admin_location_actions:"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))
-async def cq_admin_location_actions(callback: types.CallbackQuery, user_data: Dict[str, Any], state: FSMContext):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    location_service = LocationService()
+@router.callback_query(LocationCD.filter(F.action == "list_page")) # Menu "list" button (page 0) and page buttons
+async def cq_admin_list_locations_start(callback: types.CallbackQuery, callback_data: LocationCD, user_data: Dict[str, Any], state: FSMContext):
+    await _send_paginated_locations_list(callback, state, user_data, page=callback_data.page or 0)
 
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-
-    location_id = int(callback.data.split(":")[1])
-    location_details = await location_service.get_location_details(location_id, lang)
 
+async def _build_location_actions_view(
+    location_id: int,
+    lang: str,
+    state: FSMContext,
+    list_page: Optional[int] = None
+) -> Optional[Tuple[str, InlineKeyboardMarkup]]:
+    """
+    Fetch a location, store it as the current location in FSM and build its actions view.
+    When list_page is known the FSM data is written in one set_data call instead of merged.
+    Returns (text, keyboard) or None if the location does not exist.
+    """
+    location_details = await _LOCATION_SERVICE.get_location_details(location_id, lang)
     if not location_details:
-        await callback.answer(get_text("admin_location_not_found_error", lang), show_alert=True)
-        current_page = (await state.get_data()).get("current_location_list_page", 0)
-        # Need to pass the original callback event to _send_paginated_locations_list
-        return await _send_paginated_locations_list(callback, state, user_data, page=current_page)
+        return None
 
-    await state.update_data(
-        current_location_id=location_id, 
-        current_location_name=location_details['name'],
+    address = location_details.get('address', get_text("not_specified_placeholder", lang))
+    location_data = {
+        "current_location_id": location_id,
+        "current_location_name": location_details['name'],
         # Ensure address is stored, even if it's the placeholder for "Not specified"
-        current_location_address=location_details.get('address', get_text("not_specified_placeholder", lang))
-    )
+        "current_location_address": address,
+    }
+    if list_page is not None:
+        await state.set_data({"current_location_list_page": list_page, **location_data})
+    else:
+        await state.update_data(**location_data)
     
     details_text = get_text("admin_location_details_display", lang, 
                             name=location_details['name'], 
-                            address=location_details.get('address', get_text("not_specified_placeholder", lang)))
+                            address=address)
     
-    # Assuming create_admin_location_item_actions_keyboard will be defined in app.keyboards.inline
-    from app.keyboards.inline import create_admin_location_item_actions_keyboard
     keyboard = create_admin_location_item_actions_keyboard(location_id, lang)
+    return details_text, keyboard
 
-    await callback.message.edit_text(details_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+
+async def _answer_location_actions(
+    message: types.Message,
+    location_id: int,
+    lang: str,
+    state: FSMContext
+):
+    """Send the location actions view as a new message (used from message-based FSM steps)."""
+    view = await _build_location_actions_view(location_id, lang, state)
+    await _answer_location_actions_view(message, view, lang, state)
+
+
+async def _answer_location_actions_view(
+    message: types.Message,
+    view: Optional[Tuple[str, InlineKeyboardMarkup]],
+    lang: str,
+    state: FSMContext
+):
+    """Send an already built location actions view, or fall back to the location menu if it is missing."""
+    if not view:
+        await state.clear()
+        await message.answer(get_text("admin_location_not_found_error", lang))
+        title_text, keyboard = _menu_screen("locations", lang)
+        await message.answer(title_text, reply_markup=keyboard)
+        return
+    details_text, keyboard = view
+    await message.answer(details_text, reply_markup=keyboard, parse_mode="HTML")
+
+
+@router.callback_query(LocationCD.filter(F.action == "actions"), StateFilter(AdminProductStates.LOCATION_SELECT_FOR_EDIT))
+async def cq_admin_location_actions(callback: types.CallbackQuery, callback_data: LocationCD, user_data: Dict[str, Any], state: FSMContext):
+    lang = user_data.get("language", "en")
+
+    location_id = callback_data.id
+    view = await _build_location_actions_view(location_id, lang, state, list_page=callback_data.page)
+
+    if not view:
+        await callback.answer(get_text("admin_location_not_found_error", lang), show_alert=True)
+        current_page = callback_data.page if callback_data.page is not None else (await state.get_data()).get("current_location_list_page", 0)
+        # Need to pass the original callback event to _send_paginated_locations_list
+        return await _send_paginated_locations_list(callback, state, user_data, page=current_page)
+
+    details_text, keyboard = view
+    await asyncio.gather(
+        callback.message.edit_text(details_text, reply_markup=keyboard, parse_mode="HTML"),
+        callback.answer()
+    )
 
 
 # Placeholder for where cq_admin_manufacturers_menu would be if it's a separate entry point
 async def cq_admin_manufacturers_menu_entry_point(message_or_callback: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any]):
     """Helper to navigate to the main manufacturer menu, e.g. after an action or cancel."""
     lang = user_data.get("language", "en")
-    target_message = message_or_callback.message if isinstance(message_or_callback, types.CallbackQuery) else message_or_callback
     
-    keyboard = create_admin_manufacturer_management_menu_keyboard(lang)
-    text = get_text("admin_manufacturer_management_title", lang)
+    text, keyboard = _menu_screen("manufacturers", lang)
     
     # Clear state before navigating to a main menu
     await state.clear()
 
-    if isinstance(message_or_callback, types.CallbackQuery) and hasattr(target_message, "edit_text"):
-        try:
-            await target_message.edit_text(text, reply_markup=keyboard)
-        except Exception as e: # If edit fails, send new message
-            logger.debug(f"Failed to edit message for cq_admin_manufacturers_menu_entry_point: {e}")
-            await target_message.answer(text, reply_markup=keyboard)
-    else:
-        await target_message.answer(text, reply_markup=keyboard)
-    
-    if isinstance(message_or_callback, types.CallbackQuery):
-        await message_or_callback.answer()
+    await _reply_or_edit(message_or_callback, text, keyboard, answer_callback=True)
 
 
 # --- Product Creation Handlers ---
 
 @router.callback_query(F.data == "admin_prod_add_start", StateFilter("*"))
 async def cq_admin_prod_add_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-
     # Clear any previous product creation data
     await state.update_data(product_data={}, product_localizations_temp=[])
     
@@ -2125,29 +2344,26 @@ async def cq_admin_prod_add_start(callback: types.CallbackQuery, state: FSMConte
 
 @router.callback_query(F.data == "admin_prod_add_cancel_to_menu", StateFilter(AdminProductStates)) # Universal cancel for this flow
 async def cq_admin_prod_add_cancel_to_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
+    await _cancel_product_flow_to_menu(callback, state, user_data.get("language", "en"))
 
-    await callback.answer(get_text("admin_action_cancelled", lang))
+
+async def _cancel_product_flow_to_menu(event: Union[types.Message, types.CallbackQuery], state: FSMContext, lang: str):
+    """
+    End a product flow and show the product management menu.
+    Callbacks get a toast and an edit; messages (/cancel typed mid-flow) get a notice and a new menu message.
+    """
+    await event.answer(get_text("admin_action_cancelled", lang))
     await state.clear()
     
     # Go to Product Management Menu
-    prod_menu_text = get_text("admin_product_management_title", lang)
-    prod_menu_kb = create_admin_product_management_menu_keyboard(lang)
-    await callback.message.edit_text(prod_menu_text, reply_markup=prod_menu_kb)
+    await _reply_or_edit(event, *_menu_screen("products", lang))
 
 
 # Pagination for manufacturer selection during product creation
 @router.callback_query(F.data.startswith("admin_prod_create_page_manufacturer:"), StateFilter(AdminProductStates.PRODUCT_AWAIT_MANUFACTURER_ID))
 async def cq_admin_prod_create_page_manufacturer(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     try:
-        page = int(callback.data.split(":")[1])
+        page = int(callback.data.removeprefix("admin_prod_create_page_manufacturer:"))
     except (IndexError, ValueError):
         page = 0
     await _send_paginated_entities_for_selection(callback, state, user_data, entity_type="manufacturer", page=page)
@@ -2155,12 +2371,8 @@ async def cq_admin_prod_create_page_manufacturer(callback: types.CallbackQuery,
 # Pagination for category selection during product creation
 @router.callback_query(F.data.startswith("admin_prod_create_page_category:"), StateFilter(AdminProductStates.PRODUCT_AWAIT_CATEGORY_ID))
 async def cq_admin_prod_create_page_category(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
     try:
-        page = int(callback.data.split(":")[1])
+        page = int(callback.data.removeprefix("admin_prod_create_page_category:"))
     except (IndexError, ValueError):
         page = 0
     await _send_paginated_entities_for_selection(callback, state, user_data, entity_type="category", page=page)
@@ -2170,11 +2382,6 @@ async def cq_admin_prod_create_page_category(callback: types.CallbackQuery, stat
 @router.message(StateFilter(AdminProductStates.PRODUCT_AWAIT_CATEGORY_ID), F.text)
 async def fsm_admin_prod_category_text_input_received(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        await message.answer(get_text("admin_access_denied", lang))
-        return
 
     await message.answer(get_text("admin_prod_use_keyboard_for_category", lang))
     
@@ -2197,14 +2404,9 @@ async def fsm_admin_prod_category_text_input_received(message: types.Message, st
 @router.callback_query(F.data.startswith("admin_prod_create_select_manufacturer:"), StateFilter(AdminProductStates.PRODUCT_AWAIT_MANUFACTURER_ID))
 async def cq_admin_prod_create_select_manufacturer(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService() # To validate manufacturer exists
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        manufacturer_id = int(callback.data.split(":")[1])
+        manufacturer_id = int(callback.data.removeprefix("admin_prod_create_select_manufacturer:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         # Go back to manufacturer selection
@@ -2212,7 +2414,7 @@ async def cq_admin_prod_create_select_manufacturer(callback: types.CallbackQuery
         return await _send_paginated_entities_for_selection(callback, state, user_data, entity_type="manufacturer", page=current_page)
 
     # Verify manufacturer exists (important if list is somehow stale)
-    manufacturer = await product_service.get_entity_by_id("manufacturer", manufacturer_id, lang)
+    manufacturer = await _PRODUCT_SERVICE.get_entity_by_id("manufacturer", manufacturer_id, lang)
     if not manufacturer:
         await callback.answer(get_text("admin_error_manufacturer_not_found_short", lang), show_alert=True) # Using a short version
         current_page = (await state.get_data()).get("current_manufacturer_selection_page", 0)
@@ -2231,13 +2433,8 @@ async def cq_admin_prod_create_select_manufacturer(callback: types.CallbackQuery
 @router.callback_query(F.data.startswith("admin_prod_create_select_category:"), StateFilter(AdminProductStates.PRODUCT_AWAIT_CATEGORY_ID))
 async def cq_admin_prod_create_select_category(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService() # To validate category exists if not skipped
 
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-
-    category_id_str = callback.data.split(":")[1]
+    category_id_str = callback.data.removeprefix("admin_prod_create_select_category:")
     # category_id = None # No longer default to None
     # category_name = get_text("not_applicable_short", lang) # No longer default if skipped
 
@@ -2245,7 +2442,7 @@ async def cq_admin_prod_create_select_category(callback: types.CallbackQuery, st
     try:
         category_id = int(category_id_str)
         # Verify category exists
-        category = await product_service.get_entity_by_id("category", category_id, lang)
+        category = await _PRODUCT_SERVICE.get_entity_by_id("category", category_id, lang)
         if not category:
             await callback.answer(get_text("admin_error_category_not_found_short", lang), show_alert=True)
             current_page = (await state.get_data()).get("current_category_selection_page", 0)
@@ -2262,28 +2459,18 @@ async def cq_admin_prod_create_select_category(callback: types.CallbackQuery, st
     await state.update_data(product_data=current_product_data)
 
     await state.set_state(AdminProductStates.PRODUCT_AWAIT_PRICE) # Changed from PRODUCT_AWAIT_COST
-    prompt_text = get_text("admin_prod_enter_price", lang) # Changed text key
-    cancel_info = get_text("cancel_prompt", lang)
+    full_prompt = _prompt_with_cancel("admin_prod_enter_price", lang) # Changed text key
     # Remove inline keyboard from previous message by sending a new one
-    try: # Try to edit the existing message first to avoid clutter
-        await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=None) # Remove kbd
-    except Exception: # If edit fails (e.g. message too old or content unchanged), send new.
-        await callback.message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-    await callback.answer() # Acknowledge the callback
+    await _show_prompt(callback, full_prompt)
 
 # --- Message handlers for product data input ---
 
 @router.message(StateFilter(AdminProductStates.PRODUCT_AWAIT_PRICE), F.text) # Changed StateFilter
 async def fsm_admin_prod_price_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext): # Renamed function
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
-        # Create a mock callback to use the cancel flow that returns to product menu
-        mock_callback = types.CallbackQuery(id=str(message.message_id)+"_cancel", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-        return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+        return await _cancel_product_flow_to_menu(message, state, lang)
 
     try:
         cost = Decimal(sanitize_input(message.text)) # Variable name 'cost' kept for simplicity, but it holds price
@@ -2292,9 +2479,7 @@ async def fsm_admin_prod_price_received(message: types.Message, user_data: Dict[
     except (DecimalInvalidOperation, ValueError):
         await message.answer(get_text("admin_prod_invalid_price_format", lang)) # Changed text key
         # Re-prompt for price
-        prompt_text = get_text("admin_prod_enter_price", lang) # Changed text key
-        cancel_info = get_text("cancel_prompt", lang)
-        await message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML")
+        await message.answer(_prompt_with_cancel("admin_prod_enter_price", lang), parse_mode="HTML") # Re-prompt for price
         return
 
     current_product_data = (await state.get_data()).get("product_data", {})
@@ -2311,13 +2496,9 @@ async def fsm_admin_prod_price_received(message: types.Message, user_data: Dict[
 @router.message(StateFilter(AdminProductStates.PRODUCT_AWAIT_VARIATION), F.text)
 async def fsm_admin_prod_variation_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
-        mock_callback = types.CallbackQuery(id=str(message.message_id)+"_cancel", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-        return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+        return await _cancel_product_flow_to_menu(message, state, lang)
 
     variation_input = sanitize_input(message.text)
     variation = variation_input if variation_input != "-" else None
@@ -2336,13 +2517,9 @@ async def fsm_admin_prod_variation_received(message: types.Message, user_data: D
 @router.message(StateFilter(AdminProductStates.PRODUCT_AWAIT_IMAGE_URL), F.text)
 async def fsm_admin_prod_image_url_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
-        mock_callback = types.CallbackQuery(id=str(message.message_id)+"_cancel", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-        return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+        return await _cancel_product_flow_to_menu(message, state, lang)
 
     image_url_input = sanitize_input(message.text)
     image_url = image_url_input if image_url_input != "-" else None
@@ -2376,7 +2553,6 @@ async def _admin_prod_create_ask_localization_lang(
     # Check if all supported languages are already localized
     # (Assuming ALL_TEXTS['language_name_en'] contains all supported bot languages)
     # This import might be better at the top of the file.
-    from app.localization.locales import TEXTS as ALL_LANG_TEXTS 
     all_supported_langs = list(ALL_LANG_TEXTS.get("language_name_en", {}).keys())
     
     available_langs_for_new_loc = [lc for lc in all_supported_langs if lc not in existing_lang_codes and lc is not None]
@@ -2403,9 +2579,7 @@ async def _admin_prod_create_ask_localization_lang(
         else: # No supported languages at all (config issue)
             await target_message.answer(get_text("admin_prod_error_no_languages_configured", lang), reply_markup=types.ReplyKeyboardRemove())
             # Potentially cancel flow or go back to product menu
-            mock_callback = types.CallbackQuery(id=str(event.id)+"_err_no_lang", from_user=event.from_user, chat_instance=str(target_message.chat.id), message=target_message, data="admin_prod_add_cancel_to_menu")
-            await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
-            if isinstance(event, types.CallbackQuery): await event.answer()
+            await _cancel_product_flow_to_menu(event, state, lang) # Also answers the callback, if any
             return
 
 
@@ -2442,24 +2616,16 @@ async def _admin_prod_create_ask_localization_lang(
     if isinstance(event, types.Message):
         await event.answer(final_prompt_text, reply_markup=builder.as_markup(), parse_mode="HTML")
     elif isinstance(event, types.CallbackQuery):
-        try:
-            await event.message.edit_text(final_prompt_text, reply_markup=builder.as_markup(), parse_mode="HTML")
-        except Exception: # If edit fails, send as new message
-             await event.message.answer(final_prompt_text, reply_markup=builder.as_markup(), parse_mode="HTML")
-        await event.answer()
+        await _reply_or_edit(event, final_prompt_text, builder.as_markup(), answer_callback=True)
 
 
 @router.callback_query(F.data.startswith("admin_prod_create_select_loc_lang:"), StateFilter(AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_LANG_CODE))
 async def cq_admin_prod_create_select_loc_lang(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en") # Admin's language
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
-    selected_loc_lang = callback.data.split(":")[2]
+    selected_loc_lang = _parse_cb(callback.data, 3)[2] # prefix:product_id:lang_code
     
     # Validate selected_loc_lang (e.g. ensure it's in supported languages) - though keyboard should only show valid ones
-    from app.localization.locales import TEXTS as ALL_LANG_TEXTS
     if selected_loc_lang not in ALL_LANG_TEXTS.get("language_name_en", {}):
         await callback.answer(get_text("error_occurred", lang) + " Invalid language selected.", show_alert=True)
         # Re-ask for language
@@ -2472,19 +2638,12 @@ async def cq_admin_prod_create_select_loc_lang(callback: types.CallbackQuery, st
     prompt_text = get_text("admin_prod_enter_loc_name", lang, lang_name=lang_display_name)
     cancel_info = get_text("cancel_prompt", lang)
 
-    try:
-        await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=None)
-    except Exception:
-        await callback.message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-    await callback.answer()
+    await _show_prompt(callback, f"{prompt_text}\n\n{hitalic(cancel_info)}")
 
 
 @router.message(StateFilter(AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_NAME), F.text)
 async def fsm_admin_prod_loc_name_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     state_data = await state.get_data()
     product_id_for_edit_context = state_data.get("current_edit_product_id")
@@ -2493,13 +2652,10 @@ async def fsm_admin_prod_loc_name_received(message: types.Message, user_data: Di
 
     if message.text.lower() == "/cancel":
         if product_id_for_edit_context: # If editing an existing product's localization
-            await message.answer(get_text("admin_action_cancelled", lang))
-            temp_msg = await message.answer(get_text("loading_text", lang), reply_markup=types.ReplyKeyboardRemove())
-            mock_cb = types.CallbackQuery(id=str(message.message_id)+"_cancel_loc_edit", from_user=message.from_user, chat_instance=str(message.chat.id), message=temp_msg, data=f"admin_prod_edit_locs_menu:{product_id_for_edit_context}")
-            return await cq_admin_prod_edit_locs_menu(mock_cb, state, user_data)
+            await message.answer(get_text("admin_action_cancelled", lang), reply_markup=types.ReplyKeyboardRemove())
+            return await _answer_product_locs_menu(message, product_id_for_edit_context, state, lang)
         else: # Product creation flow
-            mock_callback = types.CallbackQuery(id=str(message.message_id)+"_cancel_loc_create", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-            return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+            return await _cancel_product_flow_to_menu(message, state, lang)
 
     loc_name = sanitize_input(message.text)
     if not loc_name:
@@ -2526,10 +2682,6 @@ async def fsm_admin_prod_loc_name_received(message: types.Message, user_data: Di
 async def fsm_admin_prod_loc_desc_received(message: types.Message, user_data: Dict[str, Any], state: FSMContext):
     lang = user_data.get("language", "en")
     admin_id = message.from_user.id
-    user_service = UserService()
-    product_service = ProductService() # For saving localization
-    if not await is_admin_user_check(admin_id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     state_data = await state.get_data()
     product_id_for_edit_context = state_data.get("current_edit_product_id")
@@ -2538,13 +2690,10 @@ async def fsm_admin_prod_loc_desc_received(message: types.Message, user_data: Di
 
     if message.text.lower() == "/cancel":
         if product_id_for_edit_context:
-            await message.answer(get_text("admin_action_cancelled", lang))
-            temp_msg = await message.answer(get_text("loading_text", lang), reply_markup=types.ReplyKeyboardRemove())
-            mock_cb = types.CallbackQuery(id=str(message.message_id)+"_cancel_loc_edit_desc", from_user=message.from_user, chat_instance=str(message.chat.id), message=temp_msg, data=f"admin_prod_edit_locs_menu:{product_id_for_edit_context}")
-            return await cq_admin_prod_edit_locs_menu(mock_cb, state, user_data)
+            await message.answer(get_text("admin_action_cancelled", lang), reply_markup=types.ReplyKeyboardRemove())
+            return await _answer_product_locs_menu(message, product_id_for_edit_context, state, lang)
         else:
-            mock_callback = types.CallbackQuery(id=str(message.message_id)+"_cancel_loc_create_desc", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-            return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+            return await _cancel_product_flow_to_menu(message, state, lang)
 
     loc_desc_input = sanitize_input(message.text)
     loc_desc = loc_desc_input if loc_desc_input != "-" else None
@@ -2553,15 +2702,12 @@ async def fsm_admin_prod_loc_desc_received(message: types.Message, user_data: Di
         await message.answer(get_text("admin_action_failed_no_context", lang))
         # Determine correct cancel/fallback
         if product_id_for_edit_context:
-            temp_msg = await message.answer(get_text("loading_text", lang),reply_markup=types.ReplyKeyboardRemove())
-            mock_cb = types.CallbackQuery(id=str(message.message_id)+"_ctx_lost_loc_edit", from_user=message.from_user, chat_instance=str(message.chat.id), message=temp_msg, data=f"admin_prod_edit_locs_menu:{product_id_for_edit_context}")
-            return await cq_admin_prod_edit_locs_menu(mock_cb, state, user_data)
+            return await _answer_product_locs_menu(message, product_id_for_edit_context, state, lang)
         else:
-            mock_callback = types.CallbackQuery(id=str(message.message_id)+"_ctx_lost_loc_create", from_user=message.from_user, chat_instance=str(message.chat.id), message=message, data="admin_prod_add_cancel_to_menu")
-            return await cq_admin_prod_add_cancel_to_menu(mock_callback, state, user_data)
+            return await _cancel_product_flow_to_menu(message, state, lang)
 
     if product_id_for_edit_context: # Editing/Adding localization for an EXISTING product
-        success, msg_key = await product_service.add_or_update_product_localization_service(
+        success, msg_key = await _PRODUCT_SERVICE.add_or_update_product_localization_service(
             admin_id=admin_id, product_id=product_id_for_edit_context,
             loc_lang_code=active_loc_lang_code, name=current_loc_name, description=loc_desc, lang=lang
         )
@@ -2571,12 +2717,7 @@ async def fsm_admin_prod_loc_desc_received(message: types.Message, user_data: Di
         await state.update_data(current_localization_lang=None, editing_loc_lang_code=None, current_localization_name_temp=None)
         
         # Go back to the localization menu for the current product
-        temp_msg_for_loc_menu = await message.answer(get_text("loading_text", lang),reply_markup=types.ReplyKeyboardRemove())
-        mock_callback_to_loc_menu = types.CallbackQuery(
-            id=str(message.message_id) + "_after_loc_save", from_user=message.from_user,
-            chat_instance=str(message.chat.id), message=temp_msg_for_loc_menu, data=f"admin_prod_edit_locs_menu:{product_id_for_edit_context}"
-        )
-        await cq_admin_prod_edit_locs_menu(mock_callback_to_loc_menu, state, user_data)
+        await _answer_product_locs_menu(message, product_id_for_edit_context, state, lang)
 
     else: # Part of NEW product creation flow
         product_localizations_temp = state_data.get("product_localizations_temp", [])
@@ -2603,9 +2744,6 @@ async def fsm_admin_prod_loc_desc_received(message: types.Message, user_data: Di
 @router.callback_query(F.data == "admin_cat_add_start", StateFilter("*"))
 async def cq_admin_cat_add_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     await state.set_state(AdminProductStates.CATEGORY_AWAIT_NAME)
     
@@ -2614,30 +2752,17 @@ async def cq_admin_cat_add_start(callback: types.CallbackQuery, state: FSMContex
     
     full_prompt = f"{prompt_text}\n\n{hitalic(cancel_info)}"
     
-    try:
-        await callback.message.edit_text(full_prompt, parse_mode="HTML", reply_markup=None) # Remove previous keyboard
-    except Exception as e:
-        logger.info(f"Editing message for admin_cat_add_start failed, sending new: {e}")
-        await callback.message.answer(full_prompt, parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-        
-    await callback.answer()
+    await _show_prompt(callback, full_prompt)
 
 @router.message(StateFilter(AdminProductStates.CATEGORY_AWAIT_NAME), F.text)
 async def fsm_admin_category_name_received(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
         await message.answer(get_text("admin_action_cancelled", lang), reply_markup=types.ReplyKeyboardRemove())
         await state.clear()
-        # Simulate callback to cq_admin_categories_menu to show the menu
-        # Create a mock CallbackQuery object or directly call the menu sending logic
-        # For simplicity, directly sending the menu as a new message:
-        title_text = get_text("admin_category_management_title", lang, default="Category Management")
-        keyboard = create_admin_category_management_menu_keyboard(lang)
+        # Show the category menu again as a new message
+        title_text, keyboard = _menu_screen("categories", lang)
         await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
         return
 
@@ -2651,8 +2776,7 @@ async def fsm_admin_category_name_received(message: types.Message, state: FSMCon
         await message.answer(full_reprompt, parse_mode="HTML")
         return
 
-    product_service = ProductService()
-    created_category, message_key, category_id = await product_service.create_category(name=sanitized_name, lang=lang)
+    created_category, message_key, category_id = await _PRODUCT_SERVICE.create_category(name=sanitized_name, lang=lang)
 
     if created_category and category_id is not None:
         success_msg = get_text(message_key, lang, name=hcode(created_category['name']), id=category_id)
@@ -2665,8 +2789,7 @@ async def fsm_admin_category_name_received(message: types.Message, state: FSMCon
     await state.clear()
     
     # Show category management menu again
-    title_text = get_text("admin_category_management_title", lang, default="Category Management")
-    keyboard = create_admin_category_management_menu_keyboard(lang)
+    title_text, keyboard = _menu_screen("categories", lang)
     await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
 
 
@@ -2698,9 +2821,6 @@ async def cq_admin_prod_edit_locs_menu(callback: types.CallbackQuery, state: FSM
 @router.callback_query(F.data == "admin_cat_add_start", StateFilter("*"))
 async def cq_admin_cat_add_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     await state.set_state(AdminProductStates.CATEGORY_AWAIT_NAME)
     
@@ -2709,30 +2829,17 @@ async def cq_admin_cat_add_start(callback: types.CallbackQuery, state: FSMContex
     
     full_prompt = f"{prompt_text}\n\n{hitalic(cancel_info)}"
     
-    try:
-        await callback.message.edit_text(full_prompt, parse_mode="HTML", reply_markup=None) # Remove previous keyboard
-    except Exception as e:
-        logger.info(f"Editing message for admin_cat_add_start failed, sending new: {e}")
-        await callback.message.answer(full_prompt, parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-        
-    await callback.answer()
+    await _show_prompt(callback, full_prompt)
 
 @router.message(StateFilter(AdminProductStates.CATEGORY_AWAIT_NAME), F.text)
 async def fsm_admin_category_name_received(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-
-    if not await is_admin_user_check(message.from_user.id, user_service):
-        return await message.answer(get_text("admin_access_denied", lang))
 
     if message.text.lower() == "/cancel":
         await message.answer(get_text("admin_action_cancelled", lang), reply_markup=types.ReplyKeyboardRemove())
         await state.clear()
-        # Simulate callback to cq_admin_categories_menu to show the menu
-        # Create a mock CallbackQuery object or directly call the menu sending logic
-        # For simplicity, directly sending the menu as a new message:
-        title_text = get_text("admin_category_management_title", lang, default="Category Management")
-        keyboard = create_admin_category_management_menu_keyboard(lang)
+        # Show the category menu again as a new message
+        title_text, keyboard = _menu_screen("categories", lang)
         await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
         return
 
@@ -2746,8 +2853,7 @@ async def fsm_admin_category_name_received(message: types.Message, state: FSMCon
         await message.answer(full_reprompt, parse_mode="HTML")
         return
 
-    product_service = ProductService()
-    created_category, message_key, category_id = await product_service.create_category(name=sanitized_name, lang=lang)
+    created_category, message_key, category_id = await _PRODUCT_SERVICE.create_category(name=sanitized_name, lang=lang)
 
     if created_category and category_id is not None:
         success_msg = get_text(message_key, lang, name=hcode(created_category['name']), id=category_id)
@@ -2760,8 +2866,7 @@ async def fsm_admin_category_name_received(message: types.Message, state: FSMCon
     await state.clear()
     
     # Show category management menu again
-    title_text = get_text("admin_category_management_title", lang, default="Category Management")
-    keyboard = create_admin_category_management_menu_keyboard(lang)
+    title_text, keyboard = _menu_screen("categories", lang)
     await message.answer(title_text, reply_markup=keyboard, parse_mode="HTML")
 
 
@@ -2794,14 +2899,9 @@ async def cq_admin_prod_edit_locs_menu(callback: types.CallbackQuery, state: FSM
 @router.callback_query(F.data.startswith("admin_prod_edit_locs_menu:"), StateFilter("*")) # Accessible from product edit options
 async def cq_admin_prod_edit_locs_menu(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        product_id = int(callback.data.split(":")[1])
+        product_id = int(callback.data.removeprefix("admin_prod_edit_locs_menu:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID.", show_alert=True)
         # Go back to main product menu if ID is bad
@@ -2810,12 +2910,28 @@ async def cq_admin_prod_edit_locs_menu(callback: types.CallbackQuery, state: FSM
         await callback.message.edit_text(prod_menu_text, reply_markup=prod_menu_kb)
         return
 
-    product_details = await product_service.get_product_details_for_admin(product_id, lang)
-    if not product_details:
+    view = await _build_product_locs_menu_view(product_id, lang, state)
+    if not view:
         await callback.answer(get_text("admin_product_not_found", lang), show_alert=True)
         # Go back to product selection for editing
         return await cq_admin_prod_edit_select(callback, state, user_data)
 
+    title, keyboard = view
+    await _reply_or_edit(callback, title, keyboard, answer_callback=True)
+
+
+async def _build_product_locs_menu_view(
+    product_id: int,
+    lang: str,
+    state: FSMContext
+) -> Optional[Tuple[str, InlineKeyboardMarkup]]:
+    """
+    Fetch a product, enter PRODUCT_MANAGE_LOCALIZATIONS for it and build its localizations menu.
+    Returns (text, keyboard) or None if the product does not exist.
+    """
+    product_details = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id, lang)
+    if not product_details:
+        return None
 
     await state.set_state(AdminProductStates.PRODUCT_MANAGE_LOCALIZATIONS)
     await state.update_data(
@@ -2829,21 +2945,26 @@ async def cq_admin_prod_edit_locs_menu(callback: types.CallbackQuery, state: FSM
     
     keyboard = create_admin_localization_actions_keyboard(product_id, existing_localizations, lang)
     title = get_text("admin_prod_edit_locs_menu_title", lang, product_name=hbold(product_details.get("sku", str(product_id))))
+    return title, keyboard
 
-    try:
-        await callback.message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    except Exception:
-        await callback.message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+
+async def _answer_product_locs_menu(message: types.Message, product_id: int, state: FSMContext, lang: str):
+    """Send a product's localizations menu as a new message (used from message-based FSM steps)."""
+    view = await _build_product_locs_menu_view(product_id, lang, state)
+    if not view:
+        await state.clear()
+        await message.answer(get_text("admin_product_not_found", lang))
+        menu_text, menu_kb = _menu_screen("products", lang)
+        await message.answer(menu_text, reply_markup=menu_kb)
+        return
+    title, keyboard = view
+    await message.answer(title, reply_markup=keyboard, parse_mode="HTML")
 
 
 @router.callback_query(F.data.startswith("admin_prod_edit_loc_select:"), StateFilter(AdminProductStates.PRODUCT_MANAGE_LOCALIZATIONS))
 async def cq_admin_prod_edit_loc_select(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     """Handles selection of an existing localization to edit its name/description."""
     lang = user_data.get("language", "en") # Admin's language
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     parts = callback.data.split(":")
     if len(parts) != 3: # prefix:product_id:loc_lang_code
@@ -2869,30 +2990,22 @@ async def cq_admin_prod_edit_loc_select(callback: types.CallbackQuery, state: FS
     prompt_text = get_text("admin_prod_edit_loc_enter_name", lang, lang_name=lang_display_name)
     cancel_info = get_text("cancel_prompt_short", lang, command="/cancel") # Cancel goes to loc menu
 
-    try:
-        await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=None)
-    except Exception:
-        await callback.message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-    await callback.answer()
+    await _show_prompt(callback, f"{prompt_text}\n\n{hitalic(cancel_info)}")
 
 
 @router.callback_query(F.data.startswith("admin_prod_add_loc_start:"), StateFilter(AdminProductStates.PRODUCT_MANAGE_LOCALIZATIONS))
 async def cq_admin_prod_add_loc_start(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     """Handles 'Add Localization' button for an existing product."""
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        product_id = int(callback.data.split(":")[1])
+        product_id = int(callback.data.removeprefix("admin_prod_add_loc_start:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID for adding loc.", show_alert=True)
         return
 
     # Fetch existing localizations to exclude them from selection
-    product_details = await product_service.get_product_details_for_admin(product_id, lang)
+    product_details = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id, lang)
     if not product_details: # Should not happen if user is in this menu
         await callback.answer(get_text("admin_product_not_found", lang), show_alert=True)
         return
@@ -2915,7 +3028,6 @@ async def cq_admin_prod_add_loc_start(callback: types.CallbackQuery, state: FSMC
     prompt_text = get_text("admin_prod_add_loc_select_lang", lang)
     
     # Check if any languages are available to add
-    from app.localization.locales import TEXTS as ALL_LANG_TEXTS 
     all_supported_langs = list(ALL_LANG_TEXTS.get("language_name_en", {}).keys())
     available_to_add = [lc for lc in all_supported_langs if lc not in existing_lang_codes and lc is not None]
 
@@ -2924,20 +3036,13 @@ async def cq_admin_prod_add_loc_start(callback: types.CallbackQuery, state: FSMC
         # Keyboard will be just a cancel/back button from create_admin_select_lang_for_localization_keyboard
         # if no languages are available.
 
-    try:
-        await callback.message.edit_text(prompt_text, reply_markup=keyboard, parse_mode="HTML")
-    except Exception:
-        await callback.message.answer(prompt_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+    await _reply_or_edit(callback, prompt_text, keyboard, answer_callback=True)
 
 
 @router.callback_query(F.data.startswith("admin_prod_edit_add_new_loc_lang:"), StateFilter(AdminProductStates.PRODUCT_SELECT_NEW_LOCALIZATION_LANG))
 async def cq_admin_prod_edit_add_new_loc_lang(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     """Handles selection of a new language to add localization for an existing product."""
     lang = user_data.get("language", "en") # Admin's language
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     parts = callback.data.split(":")
     if len(parts) != 3: # prefix:product_id:new_loc_lang
@@ -2962,11 +3067,7 @@ async def cq_admin_prod_edit_add_new_loc_lang(callback: types.CallbackQuery, sta
     prompt_text = get_text("admin_prod_enter_loc_name", lang, lang_name=lang_display_name) # Re-use existing key
     cancel_info = get_text("cancel_prompt_short", lang, command="/cancel") # Cancel goes to loc menu
 
-    try:
-        await callback.message.edit_text(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=None)
-    except Exception:
-        await callback.message.answer(f"{prompt_text}\n\n{hitalic(cancel_info)}", parse_mode="HTML", reply_markup=types.ReplyKeyboardRemove())
-    await callback.answer()
+    await _show_prompt(callback, f"{prompt_text}\n\n{hitalic(cancel_info)}")
 
 # fsm_admin_prod_loc_name_received and fsm_admin_prod_loc_desc_received need to be context-aware
 # (create vs edit product, and add new loc vs edit existing loc for a product)
@@ -2998,42 +3099,22 @@ async def cq_admin_prod_edit_add_new_loc_lang(callback: types.CallbackQuery, sta
 @router.callback_query(F.data.startswith("admin_prod_delete_confirm:"), StateFilter("*")) # Can be called from product view
 async def cq_admin_prod_delete_confirm(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        product_id = int(callback.data.split(":")[1])
+        product_id = int(callback.data.removeprefix("admin_prod_delete_confirm:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID for delete confirmation.", show_alert=True)
         # Go back to product list if ID is bad
         return await _send_paginated_products_list(callback, state, user_data, page=0)
 
     # Fetch product details to get its name for the confirmation message
-    product_details = await product_service.get_product_details_for_admin(product_id, lang)
+    product_details = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id, lang)
     if not product_details:
         await callback.answer(get_text("admin_product_not_found", lang), show_alert=True)
         return await _send_paginated_products_list(callback, state, user_data, page=0)
 
     # Determine a primary name for confirmation
-    product_name_display = product_details.get("sku", str(product_id)) # Default
-    if product_details.get("localizations"):
-        name_found = False
-        for loc in product_details["localizations"]:
-            if loc['lang_code'] == lang:
-                product_name_display = loc['name']
-                name_found = True
-                break
-        if not name_found: # Fallback to English or first if admin lang not found
-            for loc_item in product_details["localizations"]: # Renamed loc to loc_item to avoid conflict
-                if loc_item['lang_code'] == 'en':
-                    product_name_display = loc_item['name']
-                    name_found = True
-                    break
-            if not name_found and product_details["localizations"]: # Check if localizations list is not empty
-                 product_name_display = product_details["localizations"][0]['name']
+    product_name_display = _product_primary_name(product_details, lang, product_details.get("sku", str(product_id)))
 
 
     await state.set_state(AdminProductStates.PRODUCT_CONFIRM_DELETE)
@@ -3049,50 +3130,33 @@ async def cq_admin_prod_delete_confirm(callback: types.CallbackQuery, state: FSM
         no_callback=f"admin_prod_view:{product_id}" # Back to view details of this product
     )
     
-    try:
-        await callback.message.edit_text(confirmation_text, reply_markup=keyboard, parse_mode="HTML")
-    except Exception: # If message too long or other error
-        await callback.message.answer(confirmation_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+    await _reply_or_edit(callback, confirmation_text, keyboard, answer_callback=True)
 
 
 @router.callback_query(F.data.startswith("admin_prod_execute_delete:"), StateFilter(AdminProductStates.PRODUCT_CONFIRM_DELETE))
 async def cq_admin_prod_execute_delete(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
     admin_id = callback.from_user.id
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(admin_id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     product_id_from_state = state_data.get("product_to_delete_id")
     product_name_from_state = state_data.get("product_to_delete_name", f"ID {product_id_from_state}")
 
     try:
-        product_id_from_cb = int(callback.data.split(":")[1])
+        product_id_from_cb = int(callback.data.removeprefix("admin_prod_execute_delete:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID in delete execution.", show_alert=True)
         return await _send_paginated_products_list(callback, state, user_data, page=0) # Fallback to list
 
     if product_id_from_state != product_id_from_cb:
-        logger.warning(f"Product ID mismatch during delete execution. State: {product_id_from_state}, Callback: {product_id_from_cb}. Using callback ID.")
+        logger.warning("Product ID mismatch during delete execution. State: %s, Callback: %s. Using callback ID.", product_id_from_state, product_id_from_cb)
         # Re-fetch name for accuracy if this happens, though product_service.delete_product_by_admin also fetches name
-        temp_details_for_name = await product_service.get_product_details_for_admin(product_id_from_cb, lang)
-        if temp_details_for_name:
-            product_name_from_state = temp_details_for_name.get("sku", str(product_id_from_cb)) # Update name based on CB ID
-            if temp_details_for_name.get("localizations"):
-                name_found = False
-                for loc in temp_details_for_name["localizations"]:
-                    if loc['lang_code'] == lang: product_name_from_state = loc['name']; name_found = True; break
-                if not name_found:
-                    for loc in temp_details_for_name["localizations"]:
-                        if loc['lang_code'] == 'en': product_name_from_state = loc['name']; name_found = True; break
-                    if not name_found and temp_details_for_name["localizations"]: product_name_from_state = temp_details_for_name["localizations"][0]['name']
-
-
-    success, message_key, deleted_product_name = await product_service.delete_product_by_admin(
+        temp_details_for_name = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id_from_cb, lang)
+        if temp_details_for_name: # Update name based on CB ID
+            product_name_from_state = _product_primary_name(temp_details_for_name, lang, temp_details_for_name.get("sku", str(product_id_from_cb)))
+
+
+    success, message_key, deleted_product_name = await _PRODUCT_SERVICE.delete_product_by_admin(
         admin_id=admin_id,
         product_id=product_id_from_cb, 
         lang=lang
@@ -3117,42 +3181,22 @@ async def cq_admin_prod_execute_delete(callback: types.CallbackQuery, state: FSM
 @router.callback_query(F.data.startswith("admin_prod_delete_confirm:"), StateFilter("*")) # Can be called from product view
 async def cq_admin_prod_delete_confirm(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        product_id = int(callback.data.split(":")[1])
+        product_id = int(callback.data.removeprefix("admin_prod_delete_confirm:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID for delete confirmation.", show_alert=True)
         # Go back to product list if ID is bad
         return await _send_paginated_products_list(callback, state, user_data, page=0)
 
     # Fetch product details to get its name for the confirmation message
-    product_details = await product_service.get_product_details_for_admin(product_id, lang)
+    product_details = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id, lang)
     if not product_details:
         await callback.answer(get_text("admin_product_not_found", lang), show_alert=True)
         return await _send_paginated_products_list(callback, state, user_data, page=0)
 
     # Determine a primary name for confirmation
-    product_name_display = product_details.get("sku", str(product_id)) # Default
-    if product_details.get("localizations"):
-        name_found = False
-        for loc in product_details["localizations"]:
-            if loc['lang_code'] == lang:
-                product_name_display = loc['name']
-                name_found = True
-                break
-        if not name_found: # Fallback to English or first if admin lang not found
-            for loc in product_details["localizations"]:
-                if loc['lang_code'] == 'en':
-                    product_name_display = loc['name']
-                    name_found = True
-                    break
-            if not name_found and product_details["localizations"]:
-                 product_name_display = product_details["localizations"][0]['name']
+    product_name_display = _product_primary_name(product_details, lang, product_details.get("sku", str(product_id)))
 
 
     await state.set_state(AdminProductStates.PRODUCT_CONFIRM_DELETE)
@@ -3168,39 +3212,30 @@ async def cq_admin_prod_delete_confirm(callback: types.CallbackQuery, state: FSM
         no_callback=f"admin_prod_view:{product_id}" # Back to view details of this product
     )
     
-    try:
-        await callback.message.edit_text(confirmation_text, reply_markup=keyboard, parse_mode="HTML")
-    except Exception: # If message too long or other error
-        await callback.message.answer(confirmation_text, reply_markup=keyboard, parse_mode="HTML")
-    await callback.answer()
+    await _reply_or_edit(callback, confirmation_text, keyboard, answer_callback=True)
 
 
 @router.callback_query(F.data.startswith("admin_prod_execute_delete:"), StateFilter(AdminProductStates.PRODUCT_CONFIRM_DELETE))
 async def cq_admin_prod_execute_delete(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
     admin_id = callback.from_user.id
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(admin_id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     product_id_from_state = state_data.get("product_to_delete_id")
     product_name_from_state = state_data.get("product_to_delete_name", f"ID {product_id_from_state}")
 
     try:
-        product_id_from_cb = int(callback.data.split(":")[1])
+        product_id_from_cb = int(callback.data.removeprefix("admin_prod_execute_delete:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang) + " Invalid product ID in delete execution.", show_alert=True)
         return await _send_paginated_products_list(callback, state, user_data, page=0) # Fallback to list
 
     if product_id_from_state != product_id_from_cb:
-        logger.warning(f"Product ID mismatch during delete execution. State: {product_id_from_state}, Callback: {product_id_from_cb}. Using callback ID.")
+        logger.warning("Product ID mismatch during delete execution. State: %s, Callback: %s. Using callback ID.", product_id_from_state, product_id_from_cb)
         # Potentially re-fetch name if relying on it and state might be stale, but service call will use callback ID.
         # For now, product_name_from_state will be used for messages.
 
-    success, message_key, deleted_product_name = await product_service.delete_product_by_admin(
+    success, message_key, deleted_product_name = await _PRODUCT_SERVICE.delete_product_by_admin(
         admin_id=admin_id,
         product_id=product_id_from_cb, # Use ID from callback as primary
         lang=lang
@@ -3220,6 +3255,25 @@ async def cq_admin_prod_execute_delete(callback: types.CallbackQuery, state: FSM
 
 # --- Product List and View Details Handlers ---
 
+def _product_primary_name(details: Dict[str, Any], lang: str, default: str, fallback_to_first: bool = True) -> str:
+    """
+    Product name in lang, else in English, else (if fallback_to_first) its first localization.
+    Returns default when none applies. One pass over the localizations.
+    """
+    localizations = details.get("localizations")
+    if not localizations:
+        return default
+    english_name = None
+    for loc in localizations:
+        if loc['lang_code'] == lang:
+            return loc['name']
+        if english_name is None and loc['lang_code'] == 'en':
+            english_name = loc['name']
+    if english_name is not None:
+        return english_name
+    return localizations[0]['name'] if fallback_to_first else default
+
+
 async def _send_paginated_products_list(
     event: Union[types.Message, types.CallbackQuery],
     state: FSMContext,
@@ -3227,16 +3281,8 @@ async def _send_paginated_products_list(
     page: int = 0
 ):
     lang = user_data.get("language", "en")
-    product_service = ProductService()
-    user_service = UserService()
-
-    if not await is_admin_user_check(event.from_user.id, user_service):
-        msg = get_text("admin_access_denied", lang)
-        if isinstance(event, types.CallbackQuery): await event.answer(msg, show_alert=True)
-        else: await event.answer(msg)
-        return
 
-    products_on_page_data, total_products = await product_service.get_products_for_admin_list(
+    products_on_page_data, total_products = await _PRODUCT_SERVICE.get_products_for_admin_list(
         page=page,
         items_per_page=ITEMS_PER_PAGE_ADMIN,
         lang=lang
@@ -3246,21 +3292,16 @@ async def _send_paginated_products_list(
 
     if not products_on_page_data and page == 0:
         empty_text = title + "\n\n" + get_text("admin_no_products_found", lang)
-        kb = InlineKeyboardBuilder().row(create_back_button("back_to_product_management", lang, "admin_products_menu")).as_markup()
+        kb = _admin_back_markup(lang, "admin_products_menu", "back_to_product_management")
         
-        target_message = event.message if isinstance(event, types.CallbackQuery) else event
-        if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-             await target_message.edit_text(empty_text, reply_markup=kb)
-        else:
-             await target_message.answer(empty_text, reply_markup=kb)
-        if isinstance(event, types.CallbackQuery): await event.answer()
+        await _reply_or_edit(event, empty_text, kb, parse_mode=None, answer_callback=True)
         return
 
     # The 'name' field from get_products_for_admin_list is already formatted for display.
     # It includes name, then SKU and cost, e.g., "Product A (SKU: 123) - 10.99 USD"
     # So, item_text_key="name" should work directly.
     # Define base_callback_data and item_callback_prefix, or allow override if needed.
-    current_base_callback_data = "admin_prod_list_page" # Default for general product list
+    current_base_callback_data = lambda page_num: ProductListCD(page=page_num).pack() # Default for general product list
     current_item_callback_prefix = "admin_prod_view" # Default for viewing product
 
     # Example of how overrides might be used if this function was more generic:
@@ -3284,103 +3325,76 @@ async def _send_paginated_products_list(
         item_id_key="id"
     )
     
-    target_message = event.message if isinstance(event, types.CallbackQuery) else event
-    if hasattr(target_message, "edit_text") and isinstance(event, types.CallbackQuery):
-        await target_message.edit_text(title, reply_markup=keyboard, parse_mode="HTML")
-    else:
-        await target_message.answer(title, reply_markup=keyboard, parse_mode="HTML")
-        
-    if isinstance(event, types.CallbackQuery): await event.answer()
-
-@router.callback_query(F.data == "admin_prod_list:0", StateFilter("*")) # Entry point from product menu
-async def cq_admin_prod_list(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    
-    # Clear any product-specific state if coming from another product operation
-    await state.clear() # Or selectively clear if needed
-    await _send_paginated_products_list(callback, state, user_data, page=0)
+    await _reply_or_edit(event, title, keyboard, answer_callback=True)
 
-@router.callback_query(F.data.startswith("admin_prod_list_page:"), StateFilter("*")) # Pagination
-async def cq_admin_prod_list_paginate(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
-    lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
-    try:
-        page = int(callback.data.split(":")[1])
-    except (IndexError, ValueError):
-        page = 0
-    await _send_paginated_products_list(callback, state, user_data, page=page)
+@router.callback_query(ProductListCD.filter(), StateFilter("*")) # Entry point from product menu (page 0) and pagination
+async def cq_admin_prod_list(callback: types.CallbackQuery, callback_data: ProductListCD, state: FSMContext, user_data: Dict[str, Any]):
+    if callback_data.page == 0:
+        # Clear any product-specific state if coming from another product operation
+        await state.clear() # Or selectively clear if needed
+    await _send_paginated_products_list(callback, state, user_data, page=callback_data.page)
 
 
 def _format_product_details_for_admin_view(details: Dict[str, Any], lang: str) -> str:
     """Helper to format product details for admin view message."""
     
     # Determine a primary name for the title, fallback to SKU or ID
-    primary_name = details.get("sku", str(details['id']))
-    if details.get("localizations"):
-        for loc in details["localizations"]:
-            if loc['lang_code'] == lang:
-                primary_name = loc['name']
-                break
-        if primary_name == details.get("sku", str(details['id'])): # if lang not found, try 'en'
-             for loc in details["localizations"]:
-                if loc['lang_code'] == 'en':
-                    primary_name = loc['name']
-                    break
-    
-    view_text = get_text("admin_product_view_title", lang, product_name=hbold(primary_name)) + "\n\n"
-    
-    view_text += f"{hbold(get_text('admin_prod_detail_id', lang))}: {hcode(details['id'])}\n"
-    view_text += f"{hbold(get_text('admin_prod_detail_manufacturer', lang))}: {hcode(details['manufacturer_name'])}\n"
-    view_text += f"{hbold(get_text('admin_prod_detail_category', lang))}: {hcode(details['category_name'])}\n"
-    view_text += f"{hbold(get_text('admin_prod_detail_cost', lang))}: {details['cost']}\n" # Already formatted by service
-    view_text += f"{hbold(get_text('admin_prod_detail_variation', lang))}: {hcode(details['variation'])}\n"
-    
-    if details.get('image_url'):
-        view_text += f"{hbold(get_text('admin_prod_detail_image_url', lang))}: {hlink('View Image', details['image_url'])}\n"
-    else:
-        view_text += f"{hbold(get_text('admin_prod_detail_image_url', lang))}: {get_text('not_set', lang)}\n"
-
-    view_text += f"\n{hbold(get_text('admin_prod_detail_localizations_header', lang))}:\n"
-    if details.get("localizations"):
-        for loc in details["localizations"]:
-            lang_code_display = get_text(f"language_name_{loc['lang_code']}", lang, default=loc['lang_code'].upper())
-            desc_display = hitalic(loc.get('description')) if loc.get('description') != get_text('not_set', lang) else get_text('not_set', lang)
-            view_text += f"  <b>{lang_code_display}:</b>\n"
-            view_text += f"    <i>{get_text('name_label', lang)}:</i> {hbold(loc['name'])}\n"
-            view_text += f"    <i>{get_text('description_label', lang)}:</i> {desc_display}\n"
+    primary_name = _product_primary_name(details, lang, details.get("sku", str(details['id'])), fallback_to_first=False)
+    
+    t = partial(get_text, language=lang)
+    not_set = t('not_set')
+    lines = [
+        t("admin_product_view_title", product_name=hbold(primary_name)),
+        "",
+        f"{hbold(t('admin_prod_detail_id'))}: {hcode(details['id'])}",
+        f"{hbold(t('admin_prod_detail_manufacturer'))}: {hcode(details['manufacturer_name'])}",
+        f"{hbold(t('admin_prod_detail_category'))}: {hcode(details['category_name'])}",
+        f"{hbold(t('admin_prod_detail_cost'))}: {details['cost']}", # Already formatted by service
+        f"{hbold(t('admin_prod_detail_variation'))}: {hcode(details['variation'])}",
+    ]
+    
+    image_url = details.get('image_url')
+    lines.append(f"{hbold(t('admin_prod_detail_image_url'))}: {hlink('View Image', image_url) if image_url else not_set}")
+
+    lines += ["", f"{hbold(t('admin_prod_detail_localizations_header'))}:"]
+    localizations = details.get("localizations")
+    if localizations:
+        name_label, description_label = t('name_label'), t('description_label') # Same for every localization
+        for loc in localizations:
+            lang_code_display = t(f"language_name_{loc['lang_code']}", default=loc['lang_code'].upper())
+            desc_display = hitalic(loc.get('description')) if loc.get('description') != not_set else not_set
+            lines += [
+                f"  <b>{lang_code_display}:</b>",
+                f"    <i>{name_label}:</i> {hbold(loc['name'])}",
+                f"    <i>{description_label}:</i> {desc_display}",
+            ]
     else:
-        view_text += f"  {get_text('admin_prod_no_localizations_added_summary', lang)}\n" # Re-use existing key
-
-    view_text += f"\n{hbold(get_text('admin_prod_detail_stock_header', lang))}:\n"
-    if details.get("stock_summary"):
-        for stock_info in details["stock_summary"]:
-            view_text += f"  - {hcode(stock_info['location_name'])}: {stock_info['quantity']} {get_text('units_short', lang)}\n"
+        lines.append(f"  {t('admin_prod_no_localizations_added_summary')}") # Re-use existing key
+
+    lines += ["", f"{hbold(t('admin_prod_detail_stock_header'))}:"]
+    stock_summary = details.get("stock_summary")
+    if stock_summary:
+        units_short = t('units_short')
+        lines.extend(
+            f"  - {hcode(stock_info['location_name'])}: {stock_info['quantity']} {units_short}"
+            for stock_info in stock_summary
+        )
     else:
-        view_text += f"  {get_text('admin_prod_no_stock_data', lang)}\n"
+        lines.append(f"  {t('admin_prod_no_stock_data')}")
         
-    return view_text
+    return "\n".join(lines) + "\n"
 
 @router.callback_query(F.data.startswith("admin_prod_view:"), StateFilter("*"))
 async def cq_admin_prod_view(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     try:
-        product_id = int(callback.data.split(":")[1])
+        product_id = int(callback.data.removeprefix("admin_prod_view:"))
     except (IndexError, ValueError):
         await callback.answer(get_text("error_occurred", lang), show_alert=True)
         return await _send_paginated_products_list(callback, state, user_data, page=0) # Go back to list
 
-    product_details_data = await product_service.get_product_details_for_admin(product_id, lang)
+    product_details_data = await _PRODUCT_SERVICE.get_product_details_for_admin(product_id, lang)
 
     if not product_details_data:
         await callback.answer(get_text("admin_product_not_found", lang), show_alert=True)
@@ -3393,50 +3407,49 @@ async def cq_admin_prod_view(callback: types.CallbackQuery, state: FSMContext, u
 
     formatted_text = _format_product_details_for_admin_view(product_details_data, lang)
     
-    from app.keyboards.inline import create_admin_product_view_actions_keyboard
     keyboard = create_admin_product_view_actions_keyboard(product_id, lang)
 
-    try:
-        await callback.message.edit_text(formatted_text, reply_markup=keyboard, parse_mode="HTML")
-    except Exception as e: # Handle message too long or other errors
-        logger.error(f"Error editing message for product view {product_id}: {e}")
-        # Send as new message if edit fails
-        await callback.message.answer(formatted_text, reply_markup=keyboard, parse_mode="HTML")
-    
-    await callback.answer()
+    await _reply_or_edit(callback, formatted_text, keyboard, answer_callback=True)
 
 
 # --- Product Creation Confirmation and Execution ---
 
 def _format_product_confirmation_details(product_data: Dict[str, Any], localizations: List[Dict[str, str]], lang: str) -> str:
     """Helper to format product details for confirmation message."""
-    details_text = get_text("admin_prod_confirm_add_details_title", lang) + "\n\n"
-    
-    details_text += f"{hbold(get_text('product_field_name_manufacturer_id', lang))}: {product_data.get('manufacturer_name', product_data.get('manufacturer_id', get_text('not_set', lang)))}\n"
-    details_text += f"{hbold(get_text('product_field_name_category_id', lang))}: {product_data.get('category_name', product_data.get('category_id', get_text('not_set', lang)))}\n"
-    details_text += f"{hbold(get_text('product_field_name_price', lang))}: {format_price(product_data.get('price', 0), lang)}\n" # Changed key and text key
-    details_text += f"{hbold(get_text('product_field_name_variation', lang))}: {hcode(product_data.get('variation')) if product_data.get('variation') else get_text('not_set', lang)}\n"
-    details_text += f"{hbold(get_text('product_field_name_image_url', lang))}: {hlink('Link', product_data['image_url']) if product_data.get('image_url') else get_text('not_set', lang)}\n"
-    
-    details_text += f"\n{hbold(get_text('product_field_name_localizations', lang))}:\n"
+    t = partial(get_text, language=lang)
+    not_set = t('not_set')
+    variation = product_data.get('variation')
+    image_url = product_data.get('image_url')
+    lines = [
+        t("admin_prod_confirm_add_details_title"),
+        "",
+        f"{hbold(t('product_field_name_manufacturer_id'))}: {product_data.get('manufacturer_name', product_data.get('manufacturer_id', not_set))}",
+        f"{hbold(t('product_field_name_category_id'))}: {product_data.get('category_name', product_data.get('category_id', not_set))}",
+        f"{hbold(t('product_field_name_price'))}: {format_price(product_data.get('price', 0), lang)}", # Changed key and text key
+        f"{hbold(t('product_field_name_variation'))}: {hcode(variation) if variation else not_set}",
+        f"{hbold(t('product_field_name_image_url'))}: {hlink('Link', image_url) if image_url else not_set}",
+        "",
+        f"{hbold(t('product_field_name_localizations'))}:",
+    ]
     if localizations:
+        name_label = t('name_label', default='Name')
+        description_label = t('description_label', default='Description')
         for loc in localizations:
-            lang_code_display = get_text(f"language_name_{loc['language_code']}", lang, default=loc['language_code'].upper())
-            desc_display = hitalic(loc.get('description')) if loc.get('description') else get_text('not_set', lang)
-            details_text += f"  - {lang_code_display}:\n"
-            details_text += f"    {get_text('name_label', lang, default='Name')}: {hbold(loc['name'])}\n"
-            details_text += f"    {get_text('description_label', lang, default='Description')}: {desc_display}\n"
+            lang_code_display = t(f"language_name_{loc['language_code']}", default=loc['language_code'].upper())
+            description = loc.get('description')
+            lines += [
+                f"  - {lang_code_display}:",
+                f"    {name_label}: {hbold(loc['name'])}",
+                f"    {description_label}: {hitalic(description) if description else not_set}",
+            ]
     else:
-        details_text += f"  {get_text('admin_prod_no_localizations_added_summary', lang)}\n"
+        lines.append(f"  {t('admin_prod_no_localizations_added_summary')}")
         
-    return details_text
+    return "\n".join(lines) + "\n"
 
 @router.callback_query(F.data == "admin_prod_create_confirm_details", StateFilter(AdminProductStates.PRODUCT_AWAIT_LOCALIZATION_LANG_CODE))
 async def cq_admin_prod_create_confirm_details(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
-    user_service = UserService()
-    if not await is_admin_user_check(callback.from_user.id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     product_main_data = state_data.get("product_data", {})
@@ -3450,8 +3463,9 @@ async def cq_admin_prod_create_confirm_details(callback: types.CallbackQuery, st
     ):
         await callback.answer(get_text("admin_prod_error_incomplete_data_for_confirmation", lang), show_alert=True)
         # Send back to product menu as something went wrong
-        mock_cb_for_cancel = types.CallbackQuery(id=callback.id + "_incomplete", from_user=callback.from_user, chat_instance=callback.message.chat.id, message=callback.message, data="admin_prod_add_cancel_to_menu")
-        return await cq_admin_prod_add_cancel_to_menu(mock_cb_for_cancel, state, user_data)
+        # The alert already answered the callback, so only reset and show the menu
+        await state.clear()
+        return await _reply_or_edit(callback, *_menu_screen("products", lang))
 
     await state.set_state(AdminProductStates.PRODUCT_CONFIRM_ADD)
     
@@ -3467,23 +3481,13 @@ async def cq_admin_prod_create_confirm_details(callback: types.CallbackQuery, st
     )
     
     full_message = f"{summary_text}\n\n{hbold(prompt_text)}"
-    try:
-        await callback.message.edit_text(full_message, reply_markup=keyboard, parse_mode="HTML")
-    except Exception: # If message too long or other edit error
-        await callback.message.answer(full_message, reply_markup=keyboard, parse_mode="HTML")
-
-    await callback.answer()
+    await _reply_or_edit(callback, full_message, keyboard, answer_callback=True)
 
 
 @router.callback_query(F.data == "admin_prod_create_execute_add", StateFilter(AdminProductStates.PRODUCT_CONFIRM_ADD))
 async def cq_admin_prod_create_execute_add(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     lang = user_data.get("language", "en")
     admin_id = callback.from_user.id
-    user_service = UserService()
-    product_service = ProductService()
-
-    if not await is_admin_user_check(admin_id, user_service):
-        return await callback.answer(get_text("admin_access_denied", lang), show_alert=True)
 
     state_data = await state.get_data()
     product_main_data = state_data.get("product_data", {})
@@ -3504,7 +3508,7 @@ async def cq_admin_prod_create_execute_add(callback: types.CallbackQuery, state:
         await callback.message.edit_text(prod_menu_text, reply_markup=prod_menu_kb)
         return
 
-    created_product, message_key, product_id = await product_service.create_product_with_details(
+    created_product, message_key, product_id = await _PRODUCT_SERVICE.create_product_with_details(
         admin_id=admin_id,
         product_data=product_main_data,
         localizations_data=product_localizations,
@@ -3532,9 +3536,5 @@ async def cq_admin_prod_create_execute_add(callback: types.CallbackQuery, state:
     await state.clear() # Clear FSM state for product creation
     
     # Navigate back to product management menu
-    prod_menu_text = get_text("admin_product_management_title", lang)
-    prod_menu_kb = create_admin_product_management_menu_keyboard(lang)
-    try:
-        await callback.message.edit_text(prod_menu_text, reply_markup=prod_menu_kb)
-    except Exception: # If edit fails (e.g. from alert being shown), send new.
-        await callback.message.answer(prod_menu_text, reply_markup=prod_menu_kb)
\ No newline at end of file
+    prod_menu_text, prod_menu_kb = _menu_screen("products", lang)
+    await _edit_or_resend(callback.message, prod_menu_text, prod_menu_kb, "HTML")
\ No newline at end of file
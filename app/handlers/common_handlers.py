@@ -19,6 +19,8 @@ from app.localization.locales import get_text
 logger = logging.getLogger(__name__)
 router = Router()
 
+_USER_SERVICE = UserService()
+
 
 @router.message(Command("start"))
 async def cmd_start(message: types.Message, state: FSMContext, user_data: Dict[str, Any]):
@@ -36,7 +38,6 @@ async def cmd_start(message: types.Message, state: FSMContext, user_data: Dict[s
         # For a more persistent "is this their first time ever" flag, we might need another DB field.
         # For now, if `is_new_user_this_cycle` is true, it means they were definitely new or DB access failed.
         
-        user_service = UserService()
         db_user = user_data.get("user_db_obj") # Get user object from middleware
         
         # If db_user is None and is_new_user_this_cycle is True, it means get_or_create failed or they are truly new.
@@ -68,12 +69,11 @@ async def cmd_start(message: types.Message, state: FSMContext, user_data: Dict[s
 @router.callback_query(F.data.startswith("lang:"))
 async def process_language_selection(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     try:
-        user_service = UserService()
         user_id = callback.from_user.id
         
-        selected_language = callback.data.split(":")[1]
+        selected_language = callback.data.removeprefix("lang:")
         
-        success = await user_service.set_user_language(user_id, selected_language)
+        success = await _USER_SERVICE.set_user_language(user_id, selected_language)
         
         if not success:
              # Default to English for this specific error message if setting language failed
@@ -34,6 +34,9 @@ from app.utils.helpers import format_price, format_datetime, get_order_status_em
 logger = logging.getLogger(__name__)
 router = Router()
 
+_PRODUCT_SERVICE = ProductService()
+_ORDER_SERVICE = OrderService()
+
 
 class OrderStates(StatesGroup):
     """States for the ordering process."""
@@ -71,9 +74,8 @@ async def _go_to_main_menu(event: Union[types.Message, types.CallbackQuery], sta
 @router.callback_query(F.data == "start_order", StateFilter(default_state, None, OrderStates.viewing_cart)) # Allow from cart too
 async def start_order_entry(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    product_service = ProductService()
     
-    locations = await product_service.get_locations_with_stock(language) # Pass language for potential name localization if any
+    locations = await _PRODUCT_SERVICE.get_locations_with_stock(language) # Pass language for potential name localization if any
     if not locations:
         await callback.message.edit_text(
             get_text("no_locations_available", language),
@@ -95,15 +97,14 @@ async def start_order_entry(callback: types.CallbackQuery, state: FSMContext, us
 @router.callback_query(StateFilter(OrderStates.choosing_location), F.data.startswith("location:"))
 async def select_location_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    location_id = int(callback.data.split(":")[1])
+    location_id = int(callback.data.removeprefix("location:"))
     await state.update_data(location_id=location_id)
     
-    product_service = ProductService()
     # Manufacturer names are assumed to be language-neutral from DB or handled by ProductService if they can be localized
-    manufacturers = await product_service.get_manufacturers_by_location(location_id, language) # Pass language
+    manufacturers = await _PRODUCT_SERVICE.get_manufacturers_by_location(location_id, language) # Pass language
     
     if not manufacturers:
-        locations = await product_service.get_locations_with_stock(language) 
+        locations = await _PRODUCT_SERVICE.get_locations_with_stock(language) 
         await callback.message.edit_text(
             get_text("no_manufacturers_available", language),
             reply_markup=create_locations_keyboard(locations, language) 
@@ -112,7 +113,7 @@ async def select_location_handler(callback: types.CallbackQuery, state: FSMConte
         return
 
     # Fetch location name for message - ProductService should provide this, ideally localized if applicable
-    location_details = await product_service.get_location_by_id(location_id) # Assume name is not localized or handled by service
+    location_details = await _PRODUCT_SERVICE.get_location_by_id(location_id) # Assume name is not localized or handled by service
     location_name = location_details.name if location_details else get_text("unknown_location_name", language)
 
     await state.set_state(OrderStates.choosing_manufacturer)
@@ -133,7 +134,7 @@ async def back_to_locations_handler(callback: types.CallbackQuery, state: FSMCon
 @router.callback_query(StateFilter(OrderStates.choosing_manufacturer), F.data.startswith("manufacturer:"))
 async def select_manufacturer_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    manufacturer_id = int(callback.data.split(":")[1])
+    manufacturer_id = int(callback.data.removeprefix("manufacturer:"))
     state_data = await state.get_data()
     location_id = state_data.get("location_id")
 
@@ -142,16 +143,15 @@ async def select_manufacturer_handler(callback: types.CallbackQuery, state: FSMC
         return await _go_to_main_menu(callback, state, user_data)
 
     await state.update_data(manufacturer_id=manufacturer_id)
-    product_service = ProductService()
     # Products are fetched with localized names by ProductService
-    products = await product_service.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
+    products = await _PRODUCT_SERVICE.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
 
-    manufacturer_details = await product_service.get_manufacturer_by_id(manufacturer_id) # Name assumed not localized or handled by service
+    manufacturer_details = await _PRODUCT_SERVICE.get_manufacturer_by_id(manufacturer_id) # Name assumed not localized or handled by service
     mfg_name = manufacturer_details.name if manufacturer_details else get_text("unknown_manufacturer_name", language)
 
     if not products:
-        manufacturers = await product_service.get_manufacturers_by_location(location_id, language) 
-        location_details = await product_service.get_location_by_id(location_id)
+        manufacturers = await _PRODUCT_SERVICE.get_manufacturers_by_location(location_id, language) 
+        location_details = await _PRODUCT_SERVICE.get_location_by_id(location_id)
         location_name = location_details.name if location_details else get_text("unknown_location_name", language)
         
         await callback.message.edit_text(
@@ -171,15 +171,14 @@ async def select_manufacturer_handler(callback: types.CallbackQuery, state: FSMC
 @router.callback_query(StateFilter(OrderStates.choosing_product, OrderStates.entering_quantity), F.data.startswith("back_to_mfg_list:"))
 async def back_to_manufacturers_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    location_id = int(callback.data.split(":")[1]) 
+    location_id = int(callback.data.removeprefix("back_to_mfg_list:"))
 
     await state.update_data(location_id=location_id) # Ensure location_id is in state for select_location_handler logic
     
     # Simulate select_location_handler's end part
-    product_service = ProductService()
-    manufacturers = await product_service.get_manufacturers_by_location(location_id, language)
+    manufacturers = await _PRODUCT_SERVICE.get_manufacturers_by_location(location_id, language)
     
-    location_details = await product_service.get_location_by_id(location_id)
+    location_details = await _PRODUCT_SERVICE.get_location_by_id(location_id)
     location_name = location_details.name if location_details else get_text("unknown_location_name", language)
 
     if not manufacturers: 
@@ -197,7 +196,7 @@ async def back_to_manufacturers_handler(callback: types.CallbackQuery, state: FS
 @router.callback_query(StateFilter(OrderStates.choosing_product), F.data.startswith("product:"))
 async def select_product_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    product_id = int(callback.data.split(":")[1])
+    product_id = int(callback.data.removeprefix("product:"))
     state_data = await state.get_data()
     location_id = state_data.get("location_id")
     manufacturer_id = state_data.get("manufacturer_id") 
@@ -207,12 +206,11 @@ async def select_product_handler(callback: types.CallbackQuery, state: FSMContex
         return await _go_to_main_menu(callback, state, user_data)
 
     await state.update_data(product_id=product_id)
-    product_service = ProductService()
-    product_details = await product_service.get_product_details(product_id, location_id, language) 
+    product_details = await _PRODUCT_SERVICE.get_product_details(product_id, location_id, language) 
 
     if not product_details or product_details["stock"] <= 0:
-        products = await product_service.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
-        manufacturer_details = await product_service.get_manufacturer_by_id(manufacturer_id)
+        products = await _PRODUCT_SERVICE.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
+        manufacturer_details = await _PRODUCT_SERVICE.get_manufacturer_by_id(manufacturer_id)
         mfg_name = manufacturer_details.name if manufacturer_details else get_text("unknown_manufacturer_name", language)
         
         await callback.message.edit_text(
@@ -246,10 +244,9 @@ async def back_to_products_handler(callback: types.CallbackQuery, state: FSMCont
     location_id = int(parts[2])
 
     await state.update_data(manufacturer_id=manufacturer_id, location_id=location_id)
-    product_service = ProductService()
-    products = await product_service.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
+    products = await _PRODUCT_SERVICE.get_products_by_manufacturer_and_location(manufacturer_id, location_id, language)
 
-    manufacturer_details = await product_service.get_manufacturer_by_id(manufacturer_id)
+    manufacturer_details = await _PRODUCT_SERVICE.get_manufacturer_by_id(manufacturer_id)
     mfg_name = manufacturer_details.name if manufacturer_details else get_text("unknown_manufacturer_name", language)
 
     if not products: 
@@ -258,8 +255,8 @@ async def back_to_products_handler(callback: types.CallbackQuery, state: FSMCont
         # Create a mock callback object if necessary or reuse parts of back_to_manufacturers_handler
         await state.set_state(OrderStates.choosing_manufacturer) # Set state correctly
         # Re-fetch manufacturers for the location
-        manufacturers = await product_service.get_manufacturers_by_location(location_id, language)
-        location_details = await product_service.get_location_by_id(location_id)
+        manufacturers = await _PRODUCT_SERVICE.get_manufacturers_by_location(location_id, language)
+        location_details = await _PRODUCT_SERVICE.get_location_by_id(location_id)
         location_name = location_details.name if location_details else get_text("unknown_location_name", language)
         await callback.message.edit_text(
             get_text("choose_manufacturer", language).format(location=location_name),
@@ -289,7 +286,7 @@ async def quantity_selected_handler(callback: types.CallbackQuery, state: FSMCon
         await callback.answer()
         return 
 
-    quantity = int(callback.data.split(":")[1])
+    quantity = int(callback.data.removeprefix("qty:"))
     await _process_add_to_cart(callback, state, user_data, quantity) # Pass callback directly
 
 
@@ -314,8 +311,7 @@ async def custom_quantity_entered_handler(message: types.Message, state: FSMCont
 
     if quantity is None: # Invalid quantity input
         # Re-prompt for custom quantity, including original product details and quantity keyboard
-        product_service = ProductService()
-        product_details = await product_service.get_product_details(product_id, location_id, language)
+        product_details = await _PRODUCT_SERVICE.get_product_details(product_id, location_id, language)
         
         if not product_details: 
             await message.answer(get_text("error_occurred", language))
@@ -356,12 +352,11 @@ async def _process_add_to_cart(event: Union[types.Message, types.CallbackQuery],
         await response_method(get_text("error_occurred", language), show_alert=isinstance(event, types.CallbackQuery))
         return await _go_to_main_menu(event, state, user_data)
 
-    order_service = OrderService()
     # The add_to_cart in OrderService expects quantity_to_add. 
     # If we want to set the total, the service method needs to be designed for that, or we fetch current cart qty.
     # Assuming this 'quantity' is the *total desired quantity for this item in the cart now*.
     # The OrderService method `update_cart_item_quantity` is more suitable for this logic.
-    success, message_key_or_error = await order_service.update_cart_item_quantity(
+    success, message_key_or_error = await _ORDER_SERVICE.update_cart_item_quantity(
         user_id=event.from_user.id, 
         product_id=product_id, 
         location_id=location_id, 
@@ -378,7 +373,7 @@ async def _process_add_to_cart(event: Union[types.Message, types.CallbackQuery],
 
     if success:
         await state.set_state(OrderStates.viewing_cart)
-        cart_has_items = bool(await order_service.get_cart_contents(event.from_user.id, language)) 
+        cart_has_items = bool(await _ORDER_SERVICE.get_cart_contents(event.from_user.id, language)) 
         cart_kb = create_cart_keyboard(language, has_items=cart_has_items)
         
         success_msg_text = get_text("added_to_cart", language) # Key for "Cart updated!"
@@ -390,8 +385,7 @@ async def _process_add_to_cart(event: Union[types.Message, types.CallbackQuery],
 
     else: # Add to cart failed
         # Re-show product details and quantity keyboard with the error message
-        product_service = ProductService()
-        product_details = await product_service.get_product_details(product_id, location_id, language)
+        product_details = await _PRODUCT_SERVICE.get_product_details(product_id, location_id, language)
         
         if not product_details:
              await response_target.answer(get_text("error_occurred", language))
@@ -417,8 +411,7 @@ async def _process_add_to_cart(event: Union[types.Message, types.CallbackQuery],
 async def _display_cart(event_target: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
     user_id = user_data.get("user_id")
-    order_service = OrderService()
-    cart_items = await order_service.get_cart_contents(user_id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(user_id, language) 
 
     if not cart_items:
         text = get_text("cart_empty", language)
@@ -468,8 +461,7 @@ async def cb_view_cart(callback: types.CallbackQuery, state: FSMContext, user_da
 @router.callback_query(StateFilter(OrderStates.viewing_cart), F.data == "clear_cart")
 async def clear_cart_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    order_service = OrderService()
-    success = await order_service.clear_cart(callback.from_user.id)
+    success = await _ORDER_SERVICE.clear_cart(callback.from_user.id)
     if success:
         await callback.answer(get_text("cart_cleared", language), show_alert=True)
     else:
@@ -479,8 +471,7 @@ async def clear_cart_handler(callback: types.CallbackQuery, state: FSMContext, u
 @router.callback_query(StateFilter(OrderStates.viewing_cart), F.data == "manage_cart_items")
 async def manage_cart_items_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    order_service = OrderService()
-    cart_items = await order_service.get_cart_contents(callback.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language) 
 
     if not cart_items:
         await callback.answer(get_text("cart_empty_alert", language), show_alert=True)
@@ -503,11 +494,10 @@ async def remove_specific_cart_item_handler(callback: types.CallbackQuery, state
         await callback.answer(get_text("error_occurred", language), show_alert=True)
         return
 
-    order_service = OrderService()
-    success, msg_key = await order_service.remove_from_cart(callback.from_user.id, product_id, location_id, language)
+    success, msg_key = await _ORDER_SERVICE.remove_from_cart(callback.from_user.id, product_id, location_id, language)
     await callback.answer(get_text(msg_key, language), show_alert=not success)
     
-    cart_items = await order_service.get_cart_contents(callback.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language) 
     if not cart_items: 
         return await _display_cart(callback, state, user_data)
     
@@ -527,11 +517,9 @@ async def change_specific_cart_item_qty_prompt(callback: types.CallbackQuery, st
         await callback.answer(get_text("error_occurred", language), show_alert=True)
         return
 
-    product_service = ProductService()
-    order_service = OrderService()
     
-    product_details = await product_service.get_product_details(product_id, location_id, language) 
-    cart_item = await order_service.get_cart_item_details( # New specific method needed in OrderService
+    product_details = await _PRODUCT_SERVICE.get_product_details(product_id, location_id, language) 
+    cart_item = await _ORDER_SERVICE.get_cart_item_details( # New specific method needed in OrderService
         user_id=callback.from_user.id, 
         product_id=product_id, 
         location_id=location_id, 
@@ -541,7 +529,7 @@ async def change_specific_cart_item_qty_prompt(callback: types.CallbackQuery, st
     if not product_details or not cart_item:
         await callback.answer(get_text("error_occurred", language), show_alert=True)
         # Go back to manage cart if item somehow disappeared or error
-        cart_contents = await order_service.get_cart_contents(callback.from_user.id, language)
+        cart_contents = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language)
         if not cart_contents: return await _display_cart(callback, state, user_data) # To empty cart view
         await callback.message.edit_text(get_text("manage_cart_items_title", language), reply_markup=create_manage_cart_items_keyboard(cart_contents, language))
         return
@@ -597,14 +585,13 @@ async def process_change_cart_item_qty_input(message: types.Message, state: FSMC
         )
         return 
 
-    order_service = OrderService()
-    success, msg_key_or_error = await order_service.update_cart_item_quantity(message.from_user.id, product_id, location_id, new_quantity, language) 
+    success, msg_key_or_error = await _ORDER_SERVICE.update_cart_item_quantity(message.from_user.id, product_id, location_id, new_quantity, language) 
     
     response_text = get_text(msg_key_or_error, language) if success else msg_key_or_error
     await message.answer(response_text)
 
     # After update, go back to manage_cart_items view
-    cart_items = await order_service.get_cart_contents(message.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(message.from_user.id, language) 
     if not cart_items:
         await state.set_state(OrderStates.viewing_cart) # Set state for _display_cart
         return await _display_cart(message, state, user_data) 
@@ -642,14 +629,13 @@ async def process_change_cart_item_qty_callback(callback: types.CallbackQuery, s
         await callback.answer(get_text("error_occurred", language), show_alert=True)
         return
 
-    order_service = OrderService()
-    success, msg_key_or_error = await order_service.update_cart_item_quantity(callback.from_user.id, product_id, location_id, new_quantity, language) 
+    success, msg_key_or_error = await _ORDER_SERVICE.update_cart_item_quantity(callback.from_user.id, product_id, location_id, new_quantity, language) 
     
     response_text = get_text(msg_key_or_error, language) if success else msg_key_or_error
     await callback.answer(response_text, show_alert=not success) # Show alert on error
 
     # After update, go back to manage_cart_items view
-    cart_items = await order_service.get_cart_contents(callback.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language) 
     if not cart_items: # If cart becomes empty
         await state.set_state(OrderStates.viewing_cart)
         return await _display_cart(callback, state, user_data) 
@@ -664,8 +650,7 @@ async def process_change_cart_item_qty_callback(callback: types.CallbackQuery, s
 @router.callback_query(StateFilter(OrderStates.viewing_cart), F.data == "checkout")
 async def checkout_start_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    order_service = OrderService()
-    cart_items = await order_service.get_cart_contents(callback.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language) 
     if not cart_items:
         await callback.answer(get_text("cart_empty_checkout", language), show_alert=True)
         return 
@@ -680,11 +665,10 @@ async def checkout_start_handler(callback: types.CallbackQuery, state: FSMContex
 @router.callback_query(StateFilter(OrderStates.choosing_payment), F.data.startswith("payment:"))
 async def payment_selected_handler(callback: types.CallbackQuery, state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
-    payment_method_code = callback.data.split(":")[1] # e.g. "cash"
+    payment_method_code = callback.data.removeprefix("payment:") # e.g. "cash"
     await state.update_data(payment_method=payment_method_code)
 
-    order_service = OrderService()
-    cart_items = await order_service.get_cart_contents(callback.from_user.id, language) 
+    cart_items = await _ORDER_SERVICE.get_cart_contents(callback.from_user.id, language) 
     if not cart_items: 
         await callback.answer(get_text("cart_empty_checkout", language), show_alert=True)
         return await _display_cart(callback, state, user_data)
@@ -722,8 +706,7 @@ async def confirm_order_handler(callback: types.CallbackQuery, state: FSMContext
         await callback.answer(get_text("error_occurred", language), show_alert=True)
         return await _go_to_main_menu(callback, state, user_data)
 
-    order_service = OrderService()
-    order_id, msg_key_or_error = await order_service.create_order_from_cart(callback.from_user.id, payment_method, language=language) 
+    order_id, msg_key_or_error = await _ORDER_SERVICE.create_order_from_cart(callback.from_user.id, payment_method, language=language) 
 
     final_text = get_text(msg_key_or_error, language) if order_id else msg_key_or_error 
     if order_id : final_text = final_text.format(order_id=order_id) 
@@ -751,10 +734,9 @@ async def cancel_order_from_confirmation_handler(callback: types.CallbackQuery,
 async def my_orders_handler(event: Union[types.Message, types.CallbackQuery], state: FSMContext, user_data: Dict[str, Any]):
     language = user_data.get("language", "en")
     user_id = user_data.get("user_id")
-    order_service = OrderService()
     
     # For now, show last 5. Pagination can be added using create_paginated_keyboard.
-    orders = await order_service.get_user_orders_formatted(user_id, language, limit=5) 
+    orders = await _ORDER_SERVICE.get_user_orders_formatted(user_id, language, limit=5) 
 
     if not orders:
         text = get_text("no_orders_found", language)
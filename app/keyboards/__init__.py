@@ -18,6 +18,8 @@ from .inline import (
     create_admin_category_management_menu_keyboard,
     create_admin_manufacturer_management_menu_keyboard,
     create_admin_location_management_menu_keyboard,
+    create_admin_location_item_actions_keyboard,
+    create_admin_location_edit_options_keyboard,
     create_admin_stock_management_menu_keyboard,
     create_confirmation_keyboard,
     create_admin_product_edit_options_keyboard,
@@ -31,6 +33,7 @@ from .inline import (
     create_admin_order_statuses_keyboard,
 )
 from .reply import create_main_menu_reply_keyboard
+from .callback_data import ManufacturerCD, LocationCD, OrderCD, OrdersListCD, ProductListCD
 
 __all__ = [
     "create_language_keyboard",
@@ -50,6 +53,8 @@ __all__ = [
     "create_admin_category_management_menu_keyboard",
     "create_admin_manufacturer_management_menu_keyboard",
     "create_admin_location_management_menu_keyboard",
+    "create_admin_location_item_actions_keyboard",
+    "create_admin_location_edit_options_keyboard",
     "create_admin_stock_management_menu_keyboard",
     "create_confirmation_keyboard",
     "create_admin_product_edit_options_keyboard",
@@ -62,6 +67,11 @@ __all__ = [
     "create_admin_order_list_filters_keyboard",
     "create_admin_order_statuses_keyboard",
     "create_main_menu_reply_keyboard", 
+    "ManufacturerCD",
+    "LocationCD",
+    "OrderCD",
+    "OrdersListCD",
+    "ProductListCD",
 ]
 
 
@@ -0,0 +1,49 @@
+"""
+Callback data factories and fixed callback prefixes for admin keyboards.
+Packed as "<prefix>:<field>:..." in field order; handlers receive the parsed object as `callback_data`.
+"""
+
+from typing import Optional
+
+from aiogram.filters.callback_data import CallbackData
+
+
+# User management callbacks are plain "<prefix><telegram_id>" strings; built by concatenation
+CB_USER_DETAILS = "admin_user_details:"
+CB_USER_BLOCK_PROMPT = "admin_user_block_confirm_prompt:"
+CB_USER_BLOCK_EXEC = "admin_user_block_execute:"
+CB_USER_UNBLOCK_PROMPT = "admin_user_unblock_confirm_prompt:"
+CB_USER_UNBLOCK_EXEC = "admin_user_unblock_execute:"
+
+
+class ManufacturerCD(CallbackData, prefix="admin_mfr"):
+    """Manufacturer admin actions: delete_page, confirm_delete, execute_delete."""
+    action: str
+    id: Optional[int] = None
+    page: Optional[int] = None
+
+
+class LocationCD(CallbackData, prefix="admin_loc"):
+    """Location admin actions: list_page, actions."""
+    action: str
+    id: Optional[int] = None
+    page: Optional[int] = None
+
+
+class OrderCD(CallbackData, prefix="admin_ord"):
+    """Order admin actions: details, set_status (status is the new status)."""
+    action: str
+    id: int
+    status: Optional[str] = None
+
+
+class OrdersListCD(CallbackData, prefix="admin_ord_list"):
+    """A page of the admin orders list; status is an order status or "all", user_id narrows it to one user."""
+    status: str = "all"
+    user_id: Optional[int] = None
+    page: int = 0
+
+
+class ProductListCD(CallbackData, prefix="admin_prod_list"):
+    """A page of the admin product list."""
+    page: int = 0
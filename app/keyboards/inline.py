@@ -5,12 +5,16 @@ Includes keyboards for product selection, cart, ordering, and admin functions.
 """
 
 import logging 
-from typing import List, Dict, Any, Optional, Union 
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Callable, Tuple
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from app.localization.locales import get_text, TEXTS as ALL_TEXTS 
-from app.utils.helpers import OrderStatusEnum, get_order_status_emoji 
+from app.utils.helpers import OrderStatusEnum, ORDER_STATUS_VALUES, get_order_status_emoji 
 from app.utils.helpers import format_price 
+from app.keyboards.callback_data import (
+    LocationCD, OrderCD, OrdersListCD, ProductListCD, CB_USER_BLOCK_PROMPT, CB_USER_UNBLOCK_PROMPT
+)
 
 logger = logging.getLogger(__name__) 
 
@@ -187,15 +191,17 @@ def create_confirm_order_keyboard(language: str, back_callback: str = "checkout"
     builder.row(InlineKeyboardButton(text=get_text("back", language), callback_data=back_callback))
     return builder.as_markup()
 
+@lru_cache(maxsize=32) # Single static button; one shared markup per language
 def create_back_to_menu_keyboard(language: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("main_menu_button", language), callback_data="main_menu"))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[[create_back_button("main_menu_button", language, "main_menu")]])
 
 def create_back_button(text_key: str, language: str, callback_data: str) -> InlineKeyboardButton: 
     return InlineKeyboardButton(text=get_text(text_key, language), callback_data=callback_data)
 
 # --- Admin Keyboards ---
+# Static admin menus depend only on the language, so they are built once per language
+# and the markup object is shared (aiogram Telegram objects are frozen).
+@lru_cache(maxsize=32)
 def create_admin_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(
@@ -218,69 +224,87 @@ def create_admin_keyboard(language: str) -> InlineKeyboardMarkup:
     builder.row(create_back_button("main_menu_button", language, "main_menu")) 
     return builder.as_markup()
 
+@lru_cache(maxsize=32)
 def create_admin_order_list_filters_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     pending_display = get_text(f"order_status_{OrderStatusEnum.PENDING_ADMIN_APPROVAL.value}", language)
     approved_display = get_text(f"order_status_{OrderStatusEnum.APPROVED.value}", language)
     all_display = get_text("admin_filter_all_orders_display", language)
 
-    builder.row(InlineKeyboardButton(text=f"⏳ {pending_display}", callback_data=f"admin_orders_filter:{OrderStatusEnum.PENDING_ADMIN_APPROVAL.value}"))
-    builder.row(InlineKeyboardButton(text=f"✅ {approved_display}", callback_data=f"admin_orders_filter:{OrderStatusEnum.APPROVED.value}"))
+    builder.row(InlineKeyboardButton(text=f"⏳ {pending_display}", callback_data=OrdersListCD(status=OrderStatusEnum.PENDING_ADMIN_APPROVAL.value).pack()))
+    builder.row(InlineKeyboardButton(text=f"✅ {approved_display}", callback_data=OrdersListCD(status=OrderStatusEnum.APPROVED.value).pack()))
     # Add more common filters if needed, e.g., completed, cancelled
-    builder.row(InlineKeyboardButton(text=f"🧾 {all_display}", callback_data="admin_orders_filter:all"))
+    builder.row(InlineKeyboardButton(text=f"🧾 {all_display}", callback_data=OrdersListCD(status="all").pack()))
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
 
-def create_admin_order_actions_keyboard(order_id: int, current_status_raw: str, language: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    
+# Order keyboards depend on (status, language); only the order id in callback_data varies per order.
+# The rows are cached as (button text, callback prefix) / (button text, target status) per (status, language)
+# and the buttons are filled in per order; the back-to-list button carries no order id and is shared.
+_CANCELLABLE_STATUSES = frozenset({
+    OrderStatusEnum.APPROVED.value, OrderStatusEnum.PROCESSING.value,
+    OrderStatusEnum.READY_FOR_PICKUP.value, OrderStatusEnum.SHIPPED.value
+})
+_FINAL_STATUSES = frozenset({OrderStatusEnum.COMPLETED.value, OrderStatusEnum.CANCELLED.value, OrderStatusEnum.REJECTED.value})
+
+
+@lru_cache(maxsize=64)
+def _order_actions_template(current_status_raw: str, language: str) -> Tuple[Tuple[Tuple[Tuple[str, str], ...], ...], InlineKeyboardButton]:
+    """Action rows of (text, callback prefix) for an order in current_status_raw, and its back button."""
+    rows = []
     if current_status_raw == OrderStatusEnum.PENDING_ADMIN_APPROVAL.value:
-        builder.row(
-            InlineKeyboardButton(text="✅ " + get_text("approve_order", language), callback_data=f"admin_approve_order:{order_id}"),
-            InlineKeyboardButton(text="🚫 " + get_text("reject_order", language), callback_data=f"admin_reject_order:{order_id}")
-        )
+        rows.append((
+            ("✅ " + get_text("approve_order", language), "admin_approve_order:"),
+            ("🚫 " + get_text("reject_order", language), "admin_reject_order:")
+        ))
     
-    if current_status_raw in [
-        OrderStatusEnum.APPROVED.value, OrderStatusEnum.PROCESSING.value, 
-        OrderStatusEnum.READY_FOR_PICKUP.value, OrderStatusEnum.SHIPPED.value
-    ]: # Non-final, cancellable states
-        builder.row(InlineKeyboardButton(text="❌ " + get_text("admin_action_cancel_order", language), callback_data=f"admin_cancel_order:{order_id}"))
+    if current_status_raw in _CANCELLABLE_STATUSES: # Non-final, cancellable states
+        rows.append((("❌ " + get_text("admin_action_cancel_order", language), "admin_cancel_order:"),))
 
     # Allow changing status unless it's already completed, cancelled or rejected
-    if current_status_raw not in [OrderStatusEnum.COMPLETED.value, OrderStatusEnum.CANCELLED.value, OrderStatusEnum.REJECTED.value]:
-         builder.row(InlineKeyboardButton(text="🔄 " + get_text("admin_action_change_status", language), callback_data=f"admin_change_order_status:{order_id}"))
+    if current_status_raw not in _FINAL_STATUSES:
+        rows.append((("🔄 " + get_text("admin_action_change_status", language), "admin_change_order_status:"),))
 
     # Determine the filter for the "Back to Orders List" button
     # If current_status_raw is a valid enum value, use it for the filter, otherwise default to 'all'
-    back_filter = current_status_raw if current_status_raw in OrderStatusEnum.values() else 'all'
-    builder.row(create_back_button("back_to_orders_list", language, f"admin_orders_filter:{back_filter}"))
-    return builder.as_markup()
+    back_filter = current_status_raw if current_status_raw in ORDER_STATUS_VALUES else 'all'
+    back_button = create_back_button("back_to_orders_list", language, OrdersListCD(status=back_filter).pack())
+    return tuple(rows), back_button
+
+def create_admin_order_actions_keyboard(order_id: int, current_status_raw: str, language: str) -> InlineKeyboardMarkup:
+    rows, back_button = _order_actions_template(current_status_raw, language)
+    inline_keyboard = [
+        [InlineKeyboardButton(text=text, callback_data=f"{prefix}{order_id}") for text, prefix in row]
+        for row in rows
+    ]
+    inline_keyboard.append([back_button])
+    return InlineKeyboardMarkup(inline_keyboard=inline_keyboard)
+
+@lru_cache(maxsize=64)
+def _order_statuses_template(current_status_raw: str, language: str) -> Tuple[Tuple[str, str], ...]:
+    """(button text, status) for every status an order in current_status_raw can be moved to."""
+    # Simplified: Allow changing to any other status. Service layer should validate transitions.
+    return tuple(
+        (f"{get_order_status_emoji(status.value)} {get_text(f'order_status_{status.value}', language)}", status.value)
+        for status in OrderStatusEnum
+        if status.value != current_status_raw
+    )
 
 def create_admin_order_statuses_keyboard(language: str, current_status_raw: str, order_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for status in OrderStatusEnum:
-        if status.value == current_status_raw: continue 
-        
-        # Simplified: Allow changing to any other status. Service layer should validate transitions.
-        # if current_status_raw in [OrderStatusEnum.COMPLETED.value, OrderStatusEnum.CANCELLED.value, OrderStatusEnum.REJECTED.value] and \
-        #    status not in [OrderStatusEnum.COMPLETED, OrderStatusEnum.CANCELLED, OrderStatusEnum.REJECTED]: 
-        #     continue 
-
-        emoji = get_order_status_emoji(status.value)
-        builder.row(InlineKeyboardButton(
-            text=f"{emoji} {get_text(f'order_status_{status.value}', language)}", 
-            callback_data=f"admin_set_status:{order_id}:{status.value}"
-        ))
-    builder.row(create_back_button("back", language, f"admin_order_details:{order_id}")) 
-    return builder.as_markup()
+    inline_keyboard = [
+        [InlineKeyboardButton(text=text, callback_data=OrderCD(action="set_status", id=order_id, status=status).pack())]
+        for text, status in _order_statuses_template(current_status_raw, language)
+    ]
+    inline_keyboard.append([create_back_button("back", language, OrderCD(action="details", id=order_id).pack())])
+    return InlineKeyboardMarkup(inline_keyboard=inline_keyboard)
 
 
 def create_paginated_keyboard(
     items: List[Dict[str, Any]], 
     page: int, 
     items_per_page: int, 
-    base_callback_data: str, # e.g., "admin_users_list_page:all" (filter part included)
-    item_callback_prefix: str, # e.g., "admin_user_details"
+    base_callback_data: Union[str, Callable[[int], str]], # e.g., "admin_users_list_page:1" (filter part included), or page -> callback data
+    item_callback_prefix: Union[str, Callable[[Any], str]], # e.g., "admin_user_details", or item id -> callback data
     language: str,
     back_callback_key: str, 
     back_callback_data: str, 
@@ -291,6 +315,10 @@ def create_paginated_keyboard(
     ) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     
+    # Plain strings get ":<value>" appended; callables (e.g. CallbackData packers) build the whole string
+    item_callback = item_callback_prefix if callable(item_callback_prefix) else (lambda item_id: f"{item_callback_prefix}:{item_id}")
+    page_callback = base_callback_data if callable(base_callback_data) else (lambda page_num: f"{base_callback_data}:{page_num}")
+    
     total_items = total_items_override if total_items_override is not None else len(items)
     
     # If total_items_override is not None, items is already the slice for the current page.
@@ -315,21 +343,21 @@ def create_paginated_keyboard(
         elif item_id_key in item: 
             button_text = f"{get_text('id_prefix', language, default='ID')}: {item_id}" 
         
-        builder.row(InlineKeyboardButton(text=button_text, callback_data=f"{item_callback_prefix}:{item_id}"))
+        builder.row(InlineKeyboardButton(text=button_text, callback_data=item_callback(item_id)))
 
     pagination_buttons_row = []
     total_pages = (total_items + items_per_page - 1) // items_per_page
     
     if page > 0:
-        # base_callback_data might be "admin_users_list_page:all" or "admin_users_list_page:blocked"
+        # base_callback_data might be "admin_users_list_page:" (all) or "admin_users_list_page:1" (blocked)
         # We need to append the page number after this base.
-        pagination_buttons_row.append(InlineKeyboardButton(text=get_text("prev_page", language), callback_data=f"{base_callback_data}:{page-1}"))
+        pagination_buttons_row.append(InlineKeyboardButton(text=get_text("prev_page", language), callback_data=page_callback(page-1)))
     
     if total_pages > 1: 
          pagination_buttons_row.append(InlineKeyboardButton(text=get_text("page_display", language).format(current_page=page+1, total_pages=total_pages), callback_data="noop_page_display"))
 
     if (page + 1) < total_pages : # Check if there is a next page
-        pagination_buttons_row.append(InlineKeyboardButton(text=get_text("next_page", language), callback_data=f"{base_callback_data}:{page+1}"))
+        pagination_buttons_row.append(InlineKeyboardButton(text=get_text("next_page", language), callback_data=page_callback(page+1)))
     
     if pagination_buttons_row:
         builder.row(*pagination_buttons_row)
@@ -342,14 +370,16 @@ def create_paginated_keyboard(
     return builder.as_markup()
 
 
+@lru_cache(maxsize=32)
 def create_admin_product_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(InlineKeyboardButton(text=get_text("admin_action_add", language), callback_data="admin_prod_add_start")) 
-    builder.row(InlineKeyboardButton(text=get_text("admin_action_list", language), callback_data="admin_prod_list:0")) 
+    builder.row(InlineKeyboardButton(text=get_text("admin_action_list", language), callback_data=ProductListCD(page=0).pack())) 
     builder.row(InlineKeyboardButton(text=get_text("admin_action_edit", language), callback_data="admin_prod_edit_select:0")) 
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
 
+@lru_cache(maxsize=32)
 def create_admin_category_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(InlineKeyboardButton(text=get_text("admin_action_add", language), callback_data="admin_cat_add_start")) 
@@ -357,6 +387,7 @@ def create_admin_category_management_menu_keyboard(language: str) -> InlineKeybo
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
 
+@lru_cache(maxsize=32)
 def create_admin_manufacturer_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(InlineKeyboardButton(text=get_text("admin_action_add", language), callback_data="admin_mfg_add_start"))
@@ -366,39 +397,60 @@ def create_admin_manufacturer_management_menu_keyboard(language: str) -> InlineK
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
     
+@lru_cache(maxsize=32)
 def create_admin_location_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(InlineKeyboardButton(text=get_text("admin_action_add", language), callback_data="admin_loc_add_start")) 
-    builder.row(InlineKeyboardButton(text=get_text("admin_action_list", language), callback_data="admin_list_locations_start"))
+    builder.row(InlineKeyboardButton(text=get_text("admin_action_list", language), callback_data=LocationCD(action="list_page", page=0).pack()))
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
     
+def create_admin_location_item_actions_keyboard(location_id: int, language: str) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(text=get_text("admin_action_edit", language), callback_data=f"admin_edit_location_start:{location_id}"),
+        InlineKeyboardButton(text=get_text("admin_action_delete", language), callback_data=f"admin_confirm_delete_location_prompt:{location_id}")
+    )
+    builder.row(create_back_button("back", language, LocationCD(action="list_page", page=0).pack()))
+    return builder.as_markup()
+
+def create_admin_location_edit_options_keyboard(location_id: int, language: str) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(text=get_text("name_label", language), callback_data="admin_edit_location_field:name"),
+        InlineKeyboardButton(text=get_text("address_label", language), callback_data="admin_edit_location_field:address")
+    )
+    builder.row(create_back_button("back", language, LocationCD(action="actions", id=location_id).pack()))
+    return builder.as_markup()
+    
+@lru_cache(maxsize=32)
 def create_admin_stock_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.row(InlineKeyboardButton(text=get_text("admin_action_update_stock", language), callback_data="admin_stock_select_prod:0")) 
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
 
+@lru_cache(maxsize=32)
 def create_admin_user_management_menu_keyboard(language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    # Base callback for pagination will include the filter type
-    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_all_users", language), callback_data="admin_users_list_page:all:0")) 
-    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_blocked_users", language), callback_data="admin_users_list_page:blocked:0")) 
-    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_active_users", language), callback_data="admin_users_list_page:active:0"))
+    # Base callback for pagination carries the is_blocked filter: "" = all, "1" = blocked, "0" = active
+    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_all_users", language), callback_data="admin_users_list_page::0")) 
+    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_blocked_users", language), callback_data="admin_users_list_page:1:0")) 
+    builder.row(InlineKeyboardButton(text=get_text("admin_action_list_active_users", language), callback_data="admin_users_list_page:0:0"))
     # TODO: Add button for searching users by ID/username: callback_data="admin_user_search_prompt"
     builder.row(create_back_button("back_to_admin_main_menu", language, "admin_panel_main"))
     return builder.as_markup()
 
 def create_admin_user_list_item_keyboard(telegram_id: int, is_blocked: bool, language: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    # Callback for user orders would be: f"admin_orders_filter_user:{telegram_id}:all:0" or similar
+    # A user's orders list would be: OrdersListCD(user_id=telegram_id).pack()
     # For now, this button is illustrative as its handler is not fully implemented here.
-    # builder.row(InlineKeyboardButton(text=get_text("admin_action_view_orders", language), callback_data=f"admin_view_user_orders:{telegram_id}:0")) 
+    # builder.row(InlineKeyboardButton(text=get_text("admin_action_view_orders", language), callback_data=OrdersListCD(user_id=telegram_id).pack())) 
 
     if is_blocked:
-        builder.row(InlineKeyboardButton(text=get_text("admin_action_unblock_user", language), callback_data=f"admin_user_unblock_confirm_prompt:{telegram_id}"))
+        builder.row(InlineKeyboardButton(text=get_text("admin_action_unblock_user", language), callback_data=CB_USER_UNBLOCK_PROMPT + str(telegram_id)))
     else:
-        builder.row(InlineKeyboardButton(text=get_text("admin_action_block_user", language), callback_data=f"admin_user_block_confirm_prompt:{telegram_id}"))
+        builder.row(InlineKeyboardButton(text=get_text("admin_action_block_user", language), callback_data=CB_USER_BLOCK_PROMPT + str(telegram_id)))
 
     builder.row(create_back_button("back_to_user_list", language, "back_to_user_list")) 
     return builder.as_markup()
@@ -406,12 +458,10 @@ def create_admin_user_list_item_keyboard(telegram_id: int, is_blocked: bool, lan
 
 def create_confirmation_keyboard(language: str, yes_callback: str, no_callback: str, 
                                  yes_text_key: str = "yes", no_text_key: str = "cancel") -> InlineKeyboardMarkup: 
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text=get_text(yes_text_key, language), callback_data=yes_callback),
-        InlineKeyboardButton(text=get_text(no_text_key, language), callback_data=no_callback)
-    )
-    return builder.as_markup()
+    # Single fixed row, so the markup is assembled directly
+    yes_button = InlineKeyboardButton(text=get_text(yes_text_key, language), callback_data=yes_callback)
+    no_button = InlineKeyboardButton(text=get_text(no_text_key, language), callback_data=no_callback)
+    return InlineKeyboardMarkup(inline_keyboard=[[yes_button, no_button]])
 
 def create_admin_product_edit_options_keyboard(product_id: int, language: str, product_name: str) -> InlineKeyboardMarkup: 
     builder = InlineKeyboardBuilder()
@@ -422,7 +472,7 @@ def create_admin_product_edit_options_keyboard(product_id: int, language: str, p
     builder.row(InlineKeyboardButton(text=get_text("product_field_name_image_url", language), callback_data=f"admin_prod_edit_field:{product_id}:image_url"))
     builder.row(InlineKeyboardButton(text=get_text("product_field_name_localizations", language), callback_data=f"admin_prod_edit_locs_menu:{product_id}"))
     builder.row(InlineKeyboardButton(text=get_text("admin_action_update_stock", language), callback_data=f"admin_stock_select_loc_for_prod:{product_id}:0")) 
-    builder.row(create_back_button("back_to_admin_products_menu", language, "admin_prod_list:0")) 
+    builder.row(create_back_button("back_to_admin_products_menu", language, ProductListCD(page=0).pack())) 
     return builder.as_markup()
     
 def create_admin_localization_actions_keyboard(product_id: int, localizations: List[Dict[str,str]], language: str) -> InlineKeyboardMarkup:
@@ -485,7 +535,7 @@ def create_admin_product_view_actions_keyboard(product_id: int, language: str) -
         InlineKeyboardButton(text=get_text("admin_button_edit_product", language), callback_data=f"admin_prod_options:{product_id}"),
         InlineKeyboardButton(text=get_text("admin_button_delete_product", language), callback_data=f"admin_prod_delete_confirm:{product_id}")
     )
-    builder.row(create_back_button("admin_button_back_to_product_list", language, "admin_prod_list:0"))
+    builder.row(create_back_button("admin_button_back_to_product_list", language, ProductListCD(page=0).pack()))
     return builder.as_markup()
 
 
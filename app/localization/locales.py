@@ -4,7 +4,8 @@ Provides centralized access to translated strings.
 """
 
 import logging
-from typing import Dict, Optional, Any # Added Any for TEXTS structure hint
+from functools import lru_cache
+from typing import Dict, Optional, Any, Tuple # Added Any for TEXTS structure hint
 
 logger = logging.getLogger(__name__)
 
@@ -241,6 +242,8 @@ TEXTS: Dict[str, Dict[Optional[str], str]] = { # Allow Optional[str] for languag
     "admin_confirm_unblock_user": {"en": "Are you sure you want to unblock user ID {id}?", "ru": "Вы уверены, что хотите разблокировать пользователя ID {id}?", "pl": "Czy na pewno chcesz odblokować użytkownika o ID {id}?"},
     "admin_user_blocked_success": {"en": "✅ User ID {id} has been blocked.", "ru": "✅ Пользователь ID {id} заблокирован.", "pl": "✅ Użytkownik o ID {id} został zablokowany."},
     "admin_user_unblocked_success": {"en": "✅ User ID {id} has been unblocked.", "ru": "✅ Пользователь ID {id} разблокирован.", "pl": "✅ Użytkownik o ID {id} został odblokowany."},
+    "admin_user_already_blocked": {"en": "ℹ️ User ID {id} is already blocked.", "ru": "ℹ️ Пользователь ID {id} уже заблокирован.", "pl": "ℹ️ Użytkownik o ID {id} jest już zablokowany."},
+    "admin_user_already_unblocked": {"en": "ℹ️ User ID {id} is already active.", "ru": "ℹ️ Пользователь ID {id} уже активен.", "pl": "ℹ️ Użytkownik o ID {id} jest już aktywny."},
     "admin_user_block_failed": {"en": "❌ Failed to block user ID {id}. They might not exist or are already blocked.", "ru": "❌ Не удалось заблокировать пользователя ID {id}. Возможно, он не существует или уже заблокирован.", "pl": "❌ Nie udało się zablokować użytkownika o ID {id}. Może nie istnieć lub jest już zablokowany."},
     "admin_user_unblock_failed": {"en": "❌ Failed to unblock user ID {id}. They might not exist or are already active.", "ru": "❌ Не удалось разблокировать пользователя ID {id}. Возможно, он не существует или уже активен.", "pl": "❌ Nie udało się odblokować użytkownika o ID {id}. Może nie istnieć lub jest już aktywny."},
     "admin_user_block_failed_db": {"en": "❌ Database error while trying to block user ID {id}.", "ru": "❌ Ошибка базы данных при попытке заблокировать пользователя ID {id}.", "pl": "❌ Błąd bazy danych podczas próby zablokowania użytkownika o ID {id}."},
@@ -324,6 +327,7 @@ TEXTS: Dict[str, Dict[Optional[str], str]] = { # Allow Optional[str] for languag
     "admin_product_create_failed_db_error": {"en": "Product creation failed due to a database error.", "ru": "Не удалось создать товар из-за ошибки базы данных.", "pl": "Tworzenie produktu nie powiodło się z powodu błędu bazy danych."},
     "admin_product_create_failed_unexpected": {"en": "Product creation failed due to an unexpected error.", "ru": "Не удалось создать товар из-за непредвиденной ошибки.", "pl": "Tworzenie produktu nie powiodło się z powodu nieoczekiwanego błędu."},
     "name_label": {"en": "Name", "ru": "Имя", "pl": "Nazwa"}, # Generic, used in confirmation
+    "address_label": {"en": "Address", "ru": "Адрес", "pl": "Adres"},
     "description_label": {"en": "Description", "ru": "Описание", "pl": "Opis"}, # Generic, used in confirmation
     "admin_prod_no_localizations_added_summary": {"en": "No localizations were added.", "ru": "Локализации не были добавлены.", "pl": "Nie dodano żadnych lokalizacji."},
     "not_applicable_short": {"en": "N/A", "ru": "Н/П", "pl": "N/D"}, # For category if skipped
@@ -390,6 +394,41 @@ TEXTS: Dict[str, Dict[Optional[str], str]] = { # Allow Optional[str] for languag
     "admin_prod_use_keyboard_for_category": {"en": "Please select a category using the buttons below. Text input is not supported for category selection during product creation.", "ru": "Пожалуйста, выберите категорию с помощью кнопок ниже. Ввод текста для выбора категории при создании товара не поддерживается.", "pl": "Proszę wybrać kategorię za pomocą poniższych przycisków. Wprowadzanie tekstu w celu wyboru kategorii podczas tworzenia produktu nie jest obsługiwane."},
 }
 
+# TEXTS flattened at import to (language, key) -> template, English fallback already applied,
+# so get_text needs one dict lookup for every known key and language
+_SUPPORTED_LANGUAGES = {lang for translations in TEXTS.values() for lang in translations if lang is not None}
+_FLAT_TEXTS: Dict[Tuple[str, str], str] = {
+    (lang, key): translations.get(lang, translations.get("en", f"[[{key}]]"))
+    for key, translations in TEXTS.items() if translations
+    for lang in _SUPPORTED_LANGUAGES
+}
+
+@lru_cache(maxsize=4096)
+def _resolve_text(key: str, language: str, default: Optional[str]) -> str:
+    """
+    Resolve the raw (unformatted) template for a key and language.
+    TEXTS is static, so each (key, language, default) is looked up once per process.
+    """
+    lang_texts = TEXTS.get(key)
+    if lang_texts:
+        text_for_lang = lang_texts.get(language)
+        if text_for_lang is not None:
+            return text_for_lang
+        # Fallback to English if specific language not found for the key
+        text_en = lang_texts.get("en")
+        if text_en is not None:
+            # logger.debug(f"Text key '{key}' not found for language '{language}', falling back to English.")
+            return text_en
+        # If English also not found, the text stays "[[{key}]]"
+        return f"[[{key}]]"
+
+    # If key itself was not found at all, use the provided default. Otherwise "[[{key}]]"
+    if lang_texts is None and default is not None:
+        # logger.warning(f"Text key '{key}' not found. Using provided default.")
+        return default
+    return f"[[{key}]]"
+
+
 def get_text(key: str, language: Optional[str], default: Optional[str] = None, **kwargs: Any) -> str: # Ensure kwargs is here
     """
     Get localized text for a given key and language.
@@ -399,31 +438,14 @@ def get_text(key: str, language: Optional[str], default: Optional[str] = None, *
     if language is None:
         language = "en" # Default to English if no language provided
 
-    final_text = f"[[{key}]]" # Default if nothing found
-
-    lang_texts = TEXTS.get(key)
-    if lang_texts:
-        text_for_lang = lang_texts.get(language)
-        if text_for_lang is not None:
-            final_text = text_for_lang
-        else:
-            # Fallback to English if specific language not found for the key
-            text_en = lang_texts.get("en")
-            if text_en is not None:
-                # logger.debug(f"Text key '{key}' not found for language '{language}', falling back to English.")
-                final_text = text_en
-            # If English also not found, final_text remains "[[{key}]]"
-    
-    # If key itself was not found at all, lang_texts would be None
-    # In this case, if a default is provided, use it. Otherwise, final_text is "[[{key}]]"
-    if lang_texts is None and default is not None:
-        # logger.warning(f"Text key '{key}' not found. Using provided default.")
-        final_text = default
+    final_text = _FLAT_TEXTS.get((language, key))
+    if final_text is None: # Unknown key or language: full lookup with default handling
+        final_text = _resolve_text(key, language, default)
     
     # Attempt to format the string if kwargs are provided
     if kwargs:
         try:
-            return final_text.format(**kwargs)
+            return final_text.format_map(kwargs)
         except KeyError as e:
             logger.error(f"Missing key '{e}' in text for '{key}' with language '{language}' and format args {kwargs}. Text: '{final_text}'")
             # Return the unformatted string or a modified error indicator
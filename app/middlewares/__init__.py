@@ -1,6 +1,7 @@
 """Middlewares package for request processing components."""
 
 from .language_middleware import LanguageMiddleware
+from .admin_middleware import AdminOnlyMiddleware
 
-__all__ = ["LanguageMiddleware"]
+__all__ = ["LanguageMiddleware", "AdminOnlyMiddleware"]
 
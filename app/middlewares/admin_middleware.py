@@ -0,0 +1,101 @@
+"""
+Admin access middleware for the admin router.
+Checks admin privileges once per update so admin handlers don't have to.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Union
+
+from aiogram import BaseMiddleware
+from cachetools import TTLCache
+from aiogram.types import Message, CallbackQuery, TelegramObject
+
+from app.services.user_service import UserService
+from app.utils.keyed_lock import KeyedLock
+from app.localization.locales import get_text
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+_USER_SERVICE = UserService()
+
+# settings.ADMIN_CHAT_ID is a string; parse it once instead of on every check
+try:
+    _ADMIN_CHAT_ID_INT = int(settings.ADMIN_CHAT_ID) if settings.ADMIN_CHAT_ID is not None else None
+except ValueError:
+    logger.error("ADMIN_CHAT_ID %r is not an integer; only DB admins will be recognised", settings.ADMIN_CHAT_ID)
+    _ADMIN_CHAT_ID_INT = None
+
+# Admin status per user, kept for a minute so repeated button presses don't hit the DB
+_admin_status_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_admin_status_locks = KeyedLock()
+
+
+async def is_admin_user_check(user_id: int, user_service: UserService) -> bool:
+    """Check if user is admin based on settings or DB (raises on DB errors)."""
+    if user_id == _ADMIN_CHAT_ID_INT:
+        return True
+    return await user_service.fetch_is_admin(user_id)
+
+
+async def is_admin_cached(user_id: int) -> bool:
+    """
+    Cached variant of is_admin_user_check.
+    Concurrent lookups for the same user wait on one lock, so only one DB query is made.
+    A failed lookup counts as "not admin" for this update only and is not cached.
+    """
+    cached = _admin_status_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    async with _admin_status_locks.hold(user_id):
+        cached = _admin_status_cache.get(user_id)
+        if cached is None:
+            try:
+                cached = await is_admin_user_check(user_id, _USER_SERVICE)
+            except Exception as e:
+                logger.error("Error checking admin status for user %s: %s", user_id, e, exc_info=True)
+                return False
+            _admin_status_cache[user_id] = cached
+    return cached
+
+
+def invalidate_admin_status(user_id: int) -> None:
+    """Drop a cached admin status so the next check goes to the DB (e.g. after an admin changes that user)."""
+    _admin_status_cache.pop(user_id, None)
+
+
+class AdminOnlyMiddleware(BaseMiddleware):
+    """
+    Inner middleware that lets only admins reach the handlers of a router.
+    Non-admins get an "access denied" reply; for admins both data["is_admin"] and
+    user_data["is_admin"] are set to True for the rest of the update.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: Union[Message, CallbackQuery],
+        data: Dict[str, Any]
+    ) -> Any:
+        """Check admin rights before calling the handler."""
+        user_id = event.from_user.id
+
+        if not await is_admin_cached(user_id):
+            lang = data.get("user_data", {}).get("language", "en")
+            denied_text = get_text("admin_access_denied", lang)
+            logger.warning("Non-admin user %s attempted to use an admin handler", user_id)
+
+            if isinstance(event, CallbackQuery):
+                await event.answer(denied_text, show_alert=True)
+            else:
+                await event.answer(denied_text)
+            return  # Stop processing for non-admins
+
+        # Stash the result for this update so handlers can read it without awaiting
+        data["is_admin"] = True
+        user_data = data.get("user_data")
+        if user_data is not None:
+            user_data["is_admin"] = True
+        return await handler(event, data)
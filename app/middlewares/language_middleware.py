@@ -13,6 +13,8 @@ from app.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
+_USER_SERVICE = UserService()
+
 
 class LanguageMiddleware(BaseMiddleware):
     """Middleware for handling user language preferences and user data."""
@@ -34,10 +36,8 @@ class LanguageMiddleware(BaseMiddleware):
             default_language = telegram_lang.lower()
         
         try:
-            user_service = UserService()
-            
             # Get or create user
-            user, is_new = await user_service.get_or_create_user(user_id, default_language)
+            user, is_new = await _USER_SERVICE.get_or_create_user(user_id, default_language)
             
             if user:
                 # Check if user is blocked
@@ -2,6 +2,8 @@ from typing import Optional, List, Tuple, Dict, Any
 from sqlalchemy.exc import SQLAlchemyError
 import logging # Added for logging
 
+from cachetools import TTLCache
+
 from app.db.repositories.location_repo import LocationRepository
 from app.db.models import Location
 from app.localization.locales import get_text # For messages
@@ -9,6 +11,11 @@ from app.localization.locales import get_text # For messages
 logger = logging.getLogger(__name__) # Added logger
 
 class LocationService:
+    # Short-lived cache of formatted locations keyed on (location_id, lang), shared by all instances.
+    # Filled by paginated listings so opening a location right after listing is a dict hit;
+    # cleared whenever a location is updated or deleted.
+    _details_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
     def __init__(self):
         self.repo = LocationRepository() # In a larger app, use dependency injection
 
@@ -47,10 +54,16 @@ class LocationService:
 
     async def get_location_details(self, location_id: int, lang: str) -> Optional[Dict[str, Any]]:
         """Gets details for a single location, formatted for admin."""
+        cached = self._details_cache.get((location_id, lang))
+        if cached is not None:
+            return cached
+
         try:
             location = await self.repo.get_location_by_id(location_id)
             if location:
-                return self._format_location_for_admin(location, lang)
+                details = self._format_location_for_admin(location, lang)
+                self._details_cache[(location_id, lang)] = details
+                return details
             return None
         except SQLAlchemyError as e:
             logger.error(f"Error fetching location {location_id}: {e}")
@@ -65,6 +78,8 @@ class LocationService:
             skip = page * limit
             locations_list, total_count = await self.repo.list_locations(skip=skip, limit=limit)
             formatted_locations = [self._format_location_for_admin(loc, lang) for loc in locations_list]
+            for location in formatted_locations:
+                self._details_cache[(location["id"], lang)] = location
             return formatted_locations, total_count
         except SQLAlchemyError as e:
             logger.error(f"Error listing locations: {e}")
@@ -83,6 +98,7 @@ class LocationService:
                     return None, "admin_location_name_exists_error"
 
             updated_location = await self.repo.update_location(location_id, name, address)
+            self._details_cache.clear()
             if updated_location:
                 return self._format_location_for_admin(updated_location, lang), None
             else:
@@ -109,6 +125,7 @@ class LocationService:
 
             # The repository's delete_location method already checks for dependencies.
             deleted = await self.repo.delete_location(location_id)
+            self._details_cache.clear()
             if deleted:
                 return True, "admin_location_deleted_successfully", location_name
             else:
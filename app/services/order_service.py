@@ -14,7 +14,7 @@ from app.db.repositories.product_repo import ProductRepository
 from app.db.models import Order, OrderItem, UserCart
 from app.localization.locales import get_text
 from app.utils.helpers import (
-    OrderStatusEnum, format_price, format_datetime, 
+    OrderStatusEnum, ORDER_STATUS_VALUES, format_price, format_datetime, 
     get_order_status_emoji, get_payment_method_emoji
 )
 from app.services.product_service import ProductService
@@ -296,26 +296,37 @@ class OrderService:
         limit: int = 20,
         offset: int = 0,
         status_filter: Optional[str] = None,
-        user_id_filter: Optional[int] = None
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        user_id_filter: Optional[int] = None,
+        before_ts: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
         """
         Get formatted orders list for admin.
+        before_ts/before_id (created_at and id of the previous page's last order) seek straight to
+        the next page; offset is then ignored and total_count is None, as counting would read every
+        remaining row (the caller carries the total over from the previous page).
         Returns (formatted_orders, total_count).
         """
         try:
             async with get_session() as session:
                 order_repo = OrderRepository(session)
-                
-                orders = await order_repo.list_orders(
-                    status=status_filter,
-                    user_id=user_id_filter,
-                    limit=limit,
-                    offset=offset
-                )
-                total_count = await order_repo.count_orders(
-                    status=status_filter,
-                    user_id=user_id_filter
-                )
+
+                if before_ts is not None and before_id is not None:
+                    orders = await order_repo.list_orders_before(
+                        (before_ts, before_id),
+                        status=status_filter,
+                        user_id=user_id_filter,
+                        limit=limit
+                    )
+                    total_count = None
+                else:
+                    # Page and total come back from one query
+                    orders, total_count = await order_repo.list_orders_with_total(
+                        status=status_filter,
+                        user_id=user_id_filter,
+                        limit=limit,
+                        offset=offset
+                    )
                 
                 formatted_orders = []
                 for order in orders:
@@ -350,7 +361,8 @@ class OrderService:
             async with get_session() as session:
                 order_repo = OrderRepository(session)
                 
-                order = await order_repo.get_order_by_id(order_id)
+                # Localizations are fetched separately for the requested language only
+                order = await order_repo.get_order_by_id(order_id, with_localizations=False)
                 if not order:
                     return None
                 
@@ -359,16 +371,15 @@ class OrderService:
                 status_display = get_text(f"order_status_{order.status}", language)
                 payment_display = get_text(f"payment_{order.payment_method}", language)
                 
+                # Localized product names for all items in a single IN query
+                product_names = await order_repo.get_product_names_for_language(
+                    list({item.product_id for item in order.items}), language
+                )
+                
                 # Format order items
                 items_formatted = []
                 for item in order.items:
-                    # Get localized product name
-                    product_name = None
-                    for loc in item.product.localizations:
-                        if loc.language_code == language:
-                            product_name = loc.name
-                            break
-                    product_name = product_name or f"Product {item.product_id}"
+                    product_name = product_names.get(item.product_id) or f"Product {item.product_id}"
                     
                     item_total = item.price_at_order * item.quantity
                     
@@ -391,8 +402,9 @@ class OrderService:
                     "payment_method_raw": order.payment_method,
                     "payment_method_display": payment_display,
                     "total_amount_display": format_price(order.total_amount),
+                    "created_at": order.created_at,
                     "created_at_display": format_datetime(order.created_at, language),
-                    "updated_at_iso": order.updated_at.isoformat() if order.updated_at else None,
+                    "updated_at_display": format_datetime(order.updated_at, language) if order.updated_at else None,
                     "admin_notes": order.admin_notes,
                     "items": items_formatted
                 }
@@ -523,7 +535,7 @@ class OrderService:
         Returns (success, message_key).
         """
         try:
-            if new_status not in OrderStatusEnum.values():
+            if new_status not in ORDER_STATUS_VALUES:
                 return False, "admin_invalid_status_transition"
             
             async with get_session() as session:
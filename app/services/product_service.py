@@ -8,7 +8,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 import asyncio
 
-from sqlalchemy import select, func # Added import
+from cachetools import TTLCache
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError # Added import
 from sqlalchemy.orm import selectinload
 
@@ -25,6 +26,11 @@ logger = logging.getLogger(__name__)
 class ProductService:
     """Service for product management operations."""
 
+    # Short-lived cache of manufacturer {"id", "name"} dicts, shared by all instances.
+    # Filled by paginated listings so get_entity_by_id after a list click is a dict hit;
+    # entries are dropped on update/delete.
+    _manufacturer_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
     async def get_locations_with_stock(self, language: str = "en") -> List[Dict[str, Any]]:
         """Get all locations that have products in stock."""
         try:
@@ -249,7 +255,10 @@ class ProductService:
                     return [{"id": entity.id, "name": entity.name} for entity in entities], total_count
                 elif entity_type == "manufacturer":
                     entities, total_count = await product_repo.get_all_manufacturers_paginated(page, items_per_page)
-                    return [{"id": entity.id, "name": entity.name} for entity in entities], total_count
+                    manufacturers = [{"id": entity.id, "name": entity.name} for entity in entities]
+                    for manufacturer in manufacturers:
+                        self._manufacturer_cache[manufacturer["id"]] = manufacturer
+                    return manufacturers, total_count
                 elif entity_type == "category":
                     all_categories = await product_repo.list_categories()
                     total_count = len(all_categories)
@@ -268,6 +277,11 @@ class ProductService:
         self, entity_type: str, entity_id: int, language: str = "en"
     ) -> Optional[Dict[str, Any]]:
         """Fetches a single entity (Location or Manufacturer) by its ID."""
+        if entity_type == "manufacturer":
+            cached = self._manufacturer_cache.get(entity_id)
+            if cached is not None:
+                return cached
+
         try:
             async with get_session() as session:
                 product_repo = ProductRepository(session)
@@ -283,7 +297,10 @@ class ProductService:
                         entity = await product_repo.get_category_by_id(entity_id)
                 
                 if entity:
-                    return {"id": entity.id, "name": entity.name}
+                    entity_dict = {"id": entity.id, "name": entity.name}
+                    if entity_type == "manufacturer":
+                        self._manufacturer_cache[entity_id] = entity_dict
+                    return entity_dict
                 return None
         except Exception as e:
             logger.error(f"Error getting {entity_type} by ID {entity_id}: {e}", exc_info=True)
@@ -316,10 +333,12 @@ class ProductService:
                 if to_delete:
                     await session.delete(to_delete)
                     await session.commit()
+                    self._manufacturer_cache.pop(manufacturer_id, None)
                     logger.info(f"Manufacturer {manufacturer_id} ({manufacturer_name}) deleted successfully.")
                     return True, "admin_manufacturer_deleted_successfully", manufacturer_name
                 else:
                     # This case should ideally be caught by get_entity_by_id, but as a fallback:
+                    self._manufacturer_cache.pop(manufacturer_id, None)
                     logger.warning(f"Manufacturer {manufacturer_id} ({manufacturer_name}) not found for deletion after initial check.")
                     return False, "admin_manufacturer_not_found", manufacturer_name
         except SQLAlchemyError as e:
@@ -446,6 +465,7 @@ class ProductService:
                 
                 if updated_manufacturer:
                     await session.commit()
+                    self._manufacturer_cache.pop(manufacturer_id, None)
                     logger.info(f"Manufacturer {manufacturer_id} updated successfully to name '{name}'.")
                     return True, "admin_manufacturer_updated_successfully", {"id": updated_manufacturer.id, "name": updated_manufacturer.name}
                 else:
@@ -617,18 +637,11 @@ class ProductService:
         async with get_session() as session:
             product_repo = ProductRepository(session)
             
-            # Fetch paginated products with details (localizations, sku, cost)
-            # The repository method list_products should ideally allow eager loading of localizations.
-            # Assuming list_products is updated or already does this.
-            products_on_page = await product_repo.list_products(
+            # Page (with localizations for the display names) and total product count in one query
+            products_on_page, total_count = await product_repo.list_products_with_total(
                 limit=items_per_page, 
-                offset=page * items_per_page,
-                with_details=True # Ensure this loads localizations
+                offset=page * items_per_page
             )
-            
-            total_count_stmt = select(func.count(Product.id))
-            total_count_result = await session.execute(total_count_stmt)
-            total_count = total_count_result.scalar_one()
 
             formatted_products = []
             for product in products_on_page:
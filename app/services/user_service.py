@@ -3,16 +3,19 @@ User service for managing user-related business logic.
 Handles user creation, language settings, admin operations, and statistics.
 """
 
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
+from cachetools import TTLCache
+
 from app.db.database import get_session
 from app.db.repositories.user_repo import UserRepository
 from app.db.repositories.order_repo import OrderRepository
 from app.db.models import User
 from app.localization.locales import get_text
-from app.utils.helpers import format_datetime
+from app.utils.helpers import format_datetime, OrderStatusEnum
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,10 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service for user management operations."""
 
+    # Short-lived cache of admin user list pages, shared by all instances.
+    # Keyed on (language, limit, offset, is_blocked_filter); cleared on block/unblock.
+    _admin_user_list_cache: TTLCache = TTLCache(maxsize=256, ttl=5)
+
     async def get_or_create_user(self, telegram_id: int, language_code: str = "en") -> Tuple[Optional[User], bool]:
         """
         Get existing user or create new one.
@@ -73,12 +80,15 @@ class UserService:
             logger.error(f"Error setting language for user {telegram_id}: {e}", exc_info=True)
             return False
 
+    async def fetch_is_admin(self, telegram_id: int) -> bool:
+        """Check if user has admin privileges (raises on DB errors)."""
+        async with get_session() as session:
+            return await UserRepository(session).is_admin(telegram_id)
+
     async def is_admin(self, telegram_id: int) -> bool:
         """Check if user has admin privileges."""
         try:
-            async with get_session() as session:
-                user_repo = UserRepository(session)
-                return await user_repo.is_admin(telegram_id)
+            return await self.fetch_is_admin(telegram_id)
         except Exception as e:
             logger.error(f"Error checking admin status for user {telegram_id}: {e}", exc_info=True)
             return False
@@ -94,75 +104,101 @@ class UserService:
         List users for admin with formatting.
         Returns (formatted_users, total_count).
         """
+        cache_key = (language, limit, offset, is_blocked_filter)
+        cached = self._admin_user_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            async with get_session() as session:
-                user_repo = UserRepository(session)
-                
-                users = await user_repo.list_users(limit, offset, is_blocked_filter)
-                total_count = await user_repo.count_users(is_blocked_filter)
-                
-                formatted_users = []
-                for user in users:
-                    status_emoji = "🔒" if user.is_blocked else "🔓"
-                    lang_display = user.language_code.upper()
-                    
-                    formatted_users.append({
-                        "telegram_id": user.telegram_id,
-                        "name": f"User ID: {user.telegram_id} ({lang_display}) {status_emoji}",
-                        "language_code": user.language_code,
-                        "is_blocked": user.is_blocked,
-                        "created_at_display": format_datetime(user.created_at, language)
-                    })
+            # Page and total count are independent queries; each runs in its own session
+            users, total_count = await asyncio.gather(
+                self._list_users_page(limit, offset, is_blocked_filter),
+                self._count_users(is_blocked_filter)
+            )
+            
+            formatted_users = []
+            for user in users:
+                status_emoji = "🔒" if user.is_blocked else "🔓"
+                lang_display = user.language_code.upper()
                 
-                return formatted_users, total_count
+                formatted_users.append({
+                    "telegram_id": user.telegram_id,
+                    "name": f"User ID: {user.telegram_id} ({lang_display}) {status_emoji}",
+                    "language_code": user.language_code,
+                    "is_blocked": user.is_blocked,
+                    "created_at_display": format_datetime(user.created_at, language)
+                })
+            
+            self._admin_user_list_cache[cache_key] = (formatted_users, total_count)
+            return formatted_users, total_count
                 
         except Exception as e:
             logger.error(f"Error listing users for admin: {e}", exc_info=True)
             return [], 0
 
+    async def _list_users_page(self, limit: int, offset: int, is_blocked_filter: Optional[bool]) -> List[User]:
+        """Fetch one page of users in its own session (raises on DB errors)."""
+        async with get_session() as session:
+            return await UserRepository(session).list_users(limit, offset, is_blocked_filter)
+
+    async def _count_users(self, is_blocked_filter: Optional[bool]) -> int:
+        """Count users in its own session (raises on DB errors)."""
+        async with get_session() as session:
+            return await UserRepository(session).count_users(is_blocked_filter)
+
     async def get_user_details_for_admin(self, telegram_id: int, language: str = "en") -> Optional[Dict[str, Any]]:
         """Get detailed user information for admin view."""
         try:
-            async with get_session() as session:
-                user_repo = UserRepository(session)
-                order_repo = OrderRepository(session)
-                
-                user = await user_repo.get_by_telegram_id(telegram_id)
-                if not user:
-                    return None
-                
-                # Get order count
-                order_count = await order_repo.count_user_orders(telegram_id)
-                
-                # Check admin status
-                is_admin_status = await user_repo.is_admin(telegram_id)
-                
-                return {
-                    "telegram_id": user.telegram_id,
-                    "language_code": user.language_code,
-                    "is_blocked": user.is_blocked,
-                    "is_admin_status": is_admin_status,
-                    "order_count": order_count,
-                    "created_at_display": format_datetime(user.created_at, language),
-                    "updated_at_display": format_datetime(user.updated_at, language)
-                }
+            # The three lookups are independent; an AsyncSession cannot run queries
+            # concurrently, so each one gets its own session and they run in parallel.
+            user, order_count, is_admin_status = await asyncio.gather(
+                self._fetch_user(telegram_id),
+                self._count_user_orders(telegram_id),
+                self.is_admin(telegram_id)
+            )
+            if not user:
+                return None
+
+            return {
+                "telegram_id": user.telegram_id,
+                "language_code": user.language_code,
+                "is_blocked": user.is_blocked,
+                "is_admin_status": is_admin_status,
+                "order_count": order_count,
+                "created_at_display": format_datetime(user.created_at, language),
+                "updated_at_display": format_datetime(user.updated_at, language)
+            }
                 
         except Exception as e:
             logger.error(f"Error getting user details for admin {telegram_id}: {e}", exc_info=True)
             return None
 
+    async def _fetch_user(self, telegram_id: int) -> Optional[User]:
+        """Fetch a user row in its own session (raises on DB errors)."""
+        async with get_session() as session:
+            return await UserRepository(session).get_by_telegram_id(telegram_id)
+
+    async def _count_user_orders(self, telegram_id: int) -> int:
+        """Count a user's orders in its own session (raises on DB errors)."""
+        async with get_session() as session:
+            return await OrderRepository(session).count_user_orders(telegram_id)
+
     async def block_user_by_admin(self, telegram_id: int, admin_id: int) -> Tuple[bool, str]:
         """
         Block a user by admin action.
-        Returns (success, message_key).
+        Returns (success, message_key); a user who is already blocked is left untouched.
         """
         try:
             async with get_session() as session:
                 user_repo = UserRepository(session)
-                
+
+                user = await user_repo.get_by_telegram_id(telegram_id)
+                if user is not None and user.is_blocked:
+                    return True, "admin_user_already_blocked"  # Nothing to write (e.g. another admin was first)
                 result_user = await user_repo.update_user_block_status(telegram_id, True)
                 if result_user:
                     await session.commit()
+                    self._admin_user_list_cache.clear()
                     logger.warning(f"Admin {admin_id} blocked user {telegram_id}")
                     return True, "admin_user_blocked_success"
                 else:
@@ -175,15 +211,19 @@ class UserService:
     async def unblock_user_by_admin(self, telegram_id: int, admin_id: int) -> Tuple[bool, str]:
         """
         Unblock a user by admin action.
-        Returns (success, message_key).
+        Returns (success, message_key); a user who is already unblocked is left untouched.
         """
         try:
             async with get_session() as session:
                 user_repo = UserRepository(session)
-                
+
+                user = await user_repo.get_by_telegram_id(telegram_id)
+                if user is not None and not user.is_blocked:
+                    return True, "admin_user_already_unblocked"  # Nothing to write (e.g. another admin was first)
                 result_user = await user_repo.update_user_block_status(telegram_id, False)
                 if result_user:
                     await session.commit()
+                    self._admin_user_list_cache.clear()
                     logger.info(f"Admin {admin_id} unblocked user {telegram_id}")
                     return True, "admin_user_unblocked_success"
                 else:
@@ -198,24 +238,11 @@ class UserService:
         try:
             async with get_session() as session:
                 user_repo = UserRepository(session)
-                order_repo = OrderRepository(session)
-                
-                # User statistics
-                total_users = await user_repo.count_users()
-                active_users = await user_repo.count_users(is_blocked=False)
-                blocked_users = await user_repo.count_users(is_blocked=True)
-                
-                # Order statistics
-                total_orders = await order_repo.count_orders()
-                pending_orders = await order_repo.count_orders(status="pending_admin_approval")
                 
-                return {
-                    "total_users": total_users,
-                    "active_users": active_users,
-                    "blocked_users": blocked_users,
-                    "total_orders": total_orders,
-                    "pending_orders": pending_orders
-                }
+                # All user and order counts come back from a single query
+                return await user_repo.get_basic_statistics_counts(
+                    pending_order_status=OrderStatusEnum.PENDING_ADMIN_APPROVAL.value
+                )
                 
         except Exception as e:
             logger.error(f"Error getting basic statistics: {e}", exc_info=True)
@@ -0,0 +1,43 @@
+"""
+Redis FSM storage with a combined state+data write.
+aiogram keeps state and data under separate keys, so a transition that changes both costs
+two round trips; set_state_and_data sends both commands in one pipeline.
+"""
+
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StateType, StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+
+
+class PipelinedRedisStorage(RedisStorage):
+    """RedisStorage that can write state and data in a single round trip."""
+
+    async def set_state_and_data(self, key: StorageKey, state: StateType, data: Dict[str, Any]) -> None:
+        state_key = self.key_builder.build(key, "state")
+        data_key = self.key_builder.build(key, "data")
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if state is None:
+                pipe.delete(state_key)
+            else:
+                pipe.set(state_key, state.state if isinstance(state, State) else state, ex=self.state_ttl)
+            if data:
+                pipe.set(data_key, self.json_dumps(data), ex=self.data_ttl)
+            else:
+                pipe.delete(data_key)
+            await pipe.execute()
+
+
+async def set_state_and_data(state: FSMContext, new_state: Optional[StateType], data: Dict[str, Any]) -> None:
+    """
+    Replace both the FSM state and its data.
+    One round trip on PipelinedRedisStorage; two sequential writes on any other storage.
+    """
+    if isinstance(state.storage, PipelinedRedisStorage):
+        await state.storage.set_state_and_data(key=state.key, state=new_state, data=data)
+        return
+    await state.set_state(new_state)
+    await state.set_data(data)
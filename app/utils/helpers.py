@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Union
+from typing import FrozenSet, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,10 @@ class OrderStatusEnum(Enum):
         return [status.value for status in cls]
 
 
+# Valid order status strings, for O(1) membership checks
+ORDER_STATUS_VALUES: FrozenSet[str] = frozenset(OrderStatusEnum.values())
+
+
 def format_price(amount: Union[Decimal, float, int, str], currency: str = "$") -> str: # Added str to Union
     """Format price for display."""
     try:
@@ -67,29 +71,36 @@ def format_datetime(dt: datetime, language: str = "en") -> str:
         return str(dt)
 
 
+_ORDER_STATUS_EMOJI = {
+    OrderStatusEnum.PENDING_ADMIN_APPROVAL.value: "⏳",
+    OrderStatusEnum.APPROVED.value: "✅", 
+    OrderStatusEnum.PROCESSING.value: "⚙️",
+    OrderStatusEnum.READY_FOR_PICKUP.value: "📦",
+    OrderStatusEnum.SHIPPED.value: "🚚",
+    OrderStatusEnum.COMPLETED.value: "🎉",
+    OrderStatusEnum.CANCELLED.value: "❌",
+    OrderStatusEnum.REJECTED.value: "🚫"
+}
+
+_PAYMENT_METHOD_EMOJI = {
+    "cash": "💵",
+    "card": "💳",
+    "online": "🌐"
+}
+
+
 def get_order_status_emoji(status: str) -> str:
     """Get emoji for order status."""
-    emoji_map = {
-        OrderStatusEnum.PENDING_ADMIN_APPROVAL.value: "⏳",
-        OrderStatusEnum.APPROVED.value: "✅", 
-        OrderStatusEnum.PROCESSING.value: "⚙️",
-        OrderStatusEnum.READY_FOR_PICKUP.value: "📦",
-        OrderStatusEnum.SHIPPED.value: "🚚",
-        OrderStatusEnum.COMPLETED.value: "🎉",
-        OrderStatusEnum.CANCELLED.value: "❌",
-        OrderStatusEnum.REJECTED.value: "🚫"
-    }
-    return emoji_map.get(status, "❓")
+    return _ORDER_STATUS_EMOJI.get(status, "❓")
 
 
 def get_payment_method_emoji(payment_method: str) -> str:
     """Get emoji for payment method."""
-    emoji_map = {
-        "cash": "💵",
-        "card": "💳",
-        "online": "🌐"
-    }
-    return emoji_map.get(payment_method.lower(), "💰")
+    return _PAYMENT_METHOD_EMOJI.get(payment_method.lower(), "💰")
+
+
+# Anything except letters, numbers, spaces, and common punctuation
+_SANITIZE_RE = re.compile(r'[^\w\s\-.,!?():]')
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
@@ -105,8 +116,7 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
         text = text[:max_length]
     
     # Remove potentially harmful characters but keep basic punctuation
-    # Allow letters, numbers, spaces, and common punctuation
-    sanitized = re.sub(r'[^\w\s\-.,!?():]', '', text)
+    sanitized = _SANITIZE_RE.sub('', text)
     
     return sanitized
 
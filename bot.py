@@ -12,11 +12,11 @@ from typing import Dict, Any
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.redis import RedisStorage
 
 from app.db.database import init_db, close_db
 from app.handlers import common_handlers, user_handlers, admin_handlers
 from app.middlewares.language_middleware import LanguageMiddleware
+from app.utils.fsm_storage import PipelinedRedisStorage
 from config.settings import settings
 
 # Configure logging
@@ -48,7 +48,8 @@ async def main():
         
         # Initialize Redis storage for FSM
         try:
-            storage = RedisStorage.from_url(settings.REDIS_URL)
+            # Pipelined variant lets handlers write state and data in one round trip
+            storage = PipelinedRedisStorage.from_url(settings.REDIS_URL)
             logger.info("Redis storage initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Redis storage: {e}")
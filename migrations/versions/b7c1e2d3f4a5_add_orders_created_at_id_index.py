@@ -0,0 +1,23 @@
+"""Add (created_at, id) index to orders
+
+Revision ID: b7c1e2d3f4a5
+Revises: 7451e40fc5f4
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c1e2d3f4a5'
+down_revision = '7451e40fc5f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_orders_created_at_id', table_name='orders')